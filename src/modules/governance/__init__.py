@@ -1,5 +1,7 @@
 """Governance module - skills for AI decision governance and compliance."""
 
+from .batch import BatchGovernanceResult, BatchGovernanceRunner
+from .parallel import analyze, audit
 from .skills.decision_context_extractor import DecisionContextExtractor
 from .skills.leadership_questions_generator import LeadershipQuestionsGenerator
 from .skills.risk_identifier import RiskIdentifier
@@ -8,4 +10,8 @@ __all__ = [
     "DecisionContextExtractor",
     "RiskIdentifier",
     "LeadershipQuestionsGenerator",
+    "analyze",
+    "audit",
+    "BatchGovernanceRunner",
+    "BatchGovernanceResult",
 ]
@@ -0,0 +1,231 @@
+"""BatchGovernanceRunner - offline governance analysis through the OpenAI Batch API."""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import ValidationError
+
+from .skills._base import LLMSkill
+from .skills._client import resolve_client
+from .skills._llm import cache_routing, response_format
+from .skills.decision_context_extractor import DecisionContextExtractor
+from .skills.leadership_questions_generator import LeadershipQuestionsGenerator
+from .skills.risk_identifier import RiskIdentifier
+
+# Skill classes by name; requests and outputs follow their own attributes
+_SKILLS: Dict[str, Type[LLMSkill]] = {
+    skill_class.name: skill_class
+    for skill_class in (
+        DecisionContextExtractor,
+        RiskIdentifier,
+        LeadershipQuestionsGenerator,
+    )
+}
+
+_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+@dataclass
+class BatchGovernanceResult:
+    """Result of a single governance request in a batch."""
+
+    custom_id: str
+    skill_name: str
+    input: Dict[str, Any]
+    output: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        """Check if the request produced a valid output."""
+        return self.output is not None
+
+
+class BatchGovernanceRunner:
+    """
+    Run governance skills offline through the OpenAI Batch API.
+
+    Batch requests are billed at half the real-time price and draw on a
+    separate, larger rate limit, at the cost of up to 24 hours of latency.
+    Use this for nightly compliance sweeps and historical audit replays;
+    interactive reviews should keep using the skills directly.
+
+    Requests are built exactly as the live skills build them, and responses
+    are validated against the same output models. Invalid responses are
+    reported as errors rather than retried.
+
+    Example:
+        runner = BatchGovernanceRunner()
+        for decision in decisions:
+            runner.add("decision_context_extractor", {"decision_text": decision})
+        results = await runner.run()
+        contexts = [r.output["context"] for r in results if r.success]
+    """
+
+    def __init__(
+        self,
+        poll_interval: float = 30.0,
+        max_poll_interval: float = 600.0,
+        completion_window: str = "24h",
+    ) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            poll_interval: Initial delay between batch status checks (seconds)
+            max_poll_interval: Upper bound for the exponential poll backoff
+            completion_window: Batch completion window
+
+        Raises:
+            ValueError: If OPENAI_API_KEY is not set
+        """
+        self.client, _ = resolve_client("BatchGovernanceRunner")
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.completion_window = completion_window
+        self._skills: Dict[str, LLMSkill] = {}
+        self._requests: List[Tuple[str, str, Dict[str, Any], Dict[str, Any]]] = []
+
+    def add(self, skill_name: str, input: Dict[str, Any]) -> str:
+        """
+        Queue a governance request.
+
+        Args:
+            skill_name: Name of a governance skill
+            input: Input the skill's execute() would receive
+
+        Returns:
+            custom_id identifying the request in the results
+
+        Raises:
+            ValueError: If the skill is unknown or the input is invalid
+        """
+        if skill_name not in _SKILLS:
+            raise ValueError(
+                f"Unknown governance skill '{skill_name}'. "
+                f"Available: {', '.join(sorted(_SKILLS))}"
+            )
+
+        skill = self._skills.get(skill_name)
+        if skill is None:
+            skill = _SKILLS[skill_name]()
+            self._skills[skill_name] = skill
+
+        custom_id = f"request-{len(self._requests)}"
+        body = {
+            "model": skill.model,
+            "messages": skill.build_request_messages(input),
+            "temperature": skill.temperature,
+            "response_format": response_format(skill.output_schema),
+            **cache_routing(skill.cache_routing_key),
+        }
+        self._requests.append((custom_id, skill_name, input, body))
+        return custom_id
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def to_jsonl(self) -> str:
+        """
+        Render the queued requests as a Batch API input file.
+
+        Returns:
+            JSONL content, one request per line
+        """
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body,
+                }
+            )
+            for custom_id, _, _, body in self._requests
+        ]
+        return "\n".join(lines) + "\n"
+
+    async def run(self) -> List[BatchGovernanceResult]:
+        """
+        Submit the queued requests as one batch and wait for the results.
+
+        Returns:
+            One BatchGovernanceResult per queued request, in queue order
+
+        Raises:
+            ValueError: If no requests are queued
+            RuntimeError: If the batch fails or is cancelled
+        """
+        if not self._requests:
+            raise ValueError("No requests queued")
+
+        input_file = await self.client.files.create(
+            file=("governance_batch.jsonl", self.to_jsonl().encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window,  # type: ignore[arg-type]
+        )
+
+        interval = self.poll_interval
+        while batch.status not in _TERMINAL_STATUSES:
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, self.max_poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+
+        if batch.status in ("failed", "cancelled"):
+            raise RuntimeError(f"Batch {batch.id} {batch.status}")
+
+        # Expired batches still return whatever completed in the window
+        lines: Dict[str, Dict[str, Any]] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                content = await self.client.files.content(file_id)
+                for line in content.text.splitlines():
+                    if line.strip():
+                        record = json.loads(line)
+                        lines[record["custom_id"]] = record
+
+        return [
+            self._parse_result(custom_id, skill_name, input, lines.get(custom_id))
+            for custom_id, skill_name, input, _ in self._requests
+        ]
+
+    @staticmethod
+    def _parse_result(
+        custom_id: str,
+        skill_name: str,
+        input: Dict[str, Any],
+        record: Optional[Dict[str, Any]],
+    ) -> BatchGovernanceResult:
+        """Validate one batch output line into the skill's live output shape."""
+        result = BatchGovernanceResult(
+            custom_id=custom_id, skill_name=skill_name, input=input
+        )
+
+        if record is None:
+            result.error = "No response in batch output"
+            return result
+
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            result.error = str(record.get("error") or response.get("body"))
+            return result
+
+        skill_class = _SKILLS[skill_name]
+        raw_response = response["body"]["choices"][0]["message"]["content"] or "{}"
+        try:
+            parsed = skill_class.output_schema.model_validate_json(raw_response)
+        except ValidationError as e:
+            result.error = f"Failed to parse LLM response: {e}"
+            return result
+
+        result.output = {
+            skill_class.output_key: parsed.model_dump(),
+            "raw_response": raw_response,
+        }
+        return result
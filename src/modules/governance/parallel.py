@@ -0,0 +1,144 @@
+"""Concurrent execution of the independent governance analysis skills."""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from .skills._context_fmt import CONTEXT_FIELDS, format_context
+from .skills.decision_context_extractor import DecisionContextExtractor
+from .skills.leadership_questions_generator import LeadershipQuestionsGenerator
+from .skills.risk_identifier import RiskIdentifier
+
+
+async def analyze(
+    decision_context: Dict[str, Any], questions_use_risk: bool = False
+) -> Dict[str, Any]:
+    """
+    Run risk identification and leadership question generation for a decision.
+
+    Both skills only need the extracted decision context, so by default their
+    LLM calls are issued concurrently and wall time is that of the slower call.
+    If either skill fails, the other is cancelled rather than left running.
+    Slow calls do not fail: each skill returns a degraded output (flagged with
+    "degraded": True) once its OPENAI_TIMEOUT_S budget is spent.
+    When questions_use_risk is set, the questions are generated from the risk
+    analysis as well, which makes the calls a two-stage chain instead.
+
+    Args:
+        decision_context: Context from DecisionContextExtractor
+        questions_use_risk: Feed the risk analysis into question generation
+
+    Returns:
+        Dictionary with:
+            - risk_analysis (dict): RiskIdentifier output
+            - leadership_review (dict): LeadershipQuestionsGenerator output
+            - traces (list): SkillTrace for each skill run
+
+    Example:
+        result = await analyze(extraction["context"])
+        level = result["risk_analysis"]["analysis"]["overall_risk_level"]
+    """
+    risk_identifier = RiskIdentifier()
+    questions_generator = LeadershipQuestionsGenerator()
+
+    if questions_use_risk:
+        risk_output, risk_trace = await risk_identifier.run(
+            {"decision_context": decision_context}
+        )
+        questions_output, questions_trace = await questions_generator.run(
+            {
+                "decision_context": decision_context,
+                "risk_analysis": risk_output["analysis"],
+            }
+        )
+    else:
+        try:
+            async with asyncio.TaskGroup() as group:
+                risk_task = group.create_task(
+                    risk_identifier.run({"decision_context": decision_context})
+                )
+                questions_task = group.create_task(
+                    questions_generator.run({"decision_context": decision_context})
+                )
+        except ExceptionGroup as e:
+            # Surface the skill's own error, as the sequential path does
+            raise e.exceptions[0] from e
+
+        risk_output, risk_trace = risk_task.result()
+        questions_output, questions_trace = questions_task.result()
+
+    return {
+        "risk_analysis": risk_output,
+        "leadership_review": questions_output,
+        "traces": [risk_trace, questions_trace],
+    }
+
+
+async def audit(
+    input: Dict[str, Any], questions_use_risk: bool = False
+) -> Dict[str, Any]:
+    """
+    Extract the decision context and analyze it, overlapping the two stages.
+
+    The extraction is streamed, and analyze() starts speculatively as soon as
+    every field the analysis prompts are built from has been generated, while
+    the extractor is still finishing its response. Once the extraction
+    completes, the speculative analysis is kept if its context formats
+    identically to the final one; otherwise it is cancelled and analyze()
+    reruns on the final context, so the result always matches the sequential
+    pipeline.
+
+    Args:
+        input: DecisionContextExtractor input (decision_text, and optionally
+            additional_context)
+        questions_use_risk: Feed the risk analysis into question generation
+
+    Returns:
+        Dictionary with:
+            - extraction (dict): DecisionContextExtractor output
+            - risk_analysis (dict): RiskIdentifier output
+            - leadership_review (dict): LeadershipQuestionsGenerator output
+            - traces (list): SkillTrace for each analysis skill run
+
+    Example:
+        result = await audit({"decision_text": "Approved $400k loan..."})
+        level = result["risk_analysis"]["analysis"]["overall_risk_level"]
+    """
+    extractor = DecisionContextExtractor()
+    partial_context: Dict[str, Any] = {}
+    speculative_context: Dict[str, Any] = {}
+    speculation: Optional[asyncio.Task[Dict[str, Any]]] = None
+    extraction: Dict[str, Any] = {}
+
+    try:
+        async for event in extractor.execute_stream(input):
+            if event["type"] == "field":
+                partial_context[event["field"]] = event["value"]
+                if speculation is None and all(
+                    field in partial_context for field in CONTEXT_FIELDS
+                ):
+                    speculative_context = dict(partial_context)
+                    speculation = asyncio.create_task(
+                        analyze(speculative_context, questions_use_risk)
+                    )
+            elif event["type"] == "result":
+                extraction = event["output"]
+    except BaseException:
+        if speculation is not None:
+            await _discard(speculation)
+        raise
+
+    decision_context = extraction["context"]
+    if speculation is not None:
+        if format_context(speculative_context) == format_context(decision_context):
+            analysis = await speculation
+            return {"extraction": extraction, **analysis}
+        await _discard(speculation)
+
+    analysis = await analyze(decision_context, questions_use_risk)
+    return {"extraction": extraction, **analysis}
+
+
+async def _discard(task: asyncio.Task[Any]) -> None:
+    """Cancel a speculative task and wait for it to unwind."""
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,304 @@
+"""LLMSkill - shared request, caching and degradation logic of governance skills."""
+
+import json
+from abc import abstractmethod
+from functools import lru_cache
+from typing import Any, AsyncIterator, ClassVar, Dict, List, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+from ....skills.base import Skill
+from ._client import resolve_client, resolve_timeout
+from ._llm import (
+    Prefix,
+    build_messages,
+    complete_json,
+    response_format,
+    stream_json,
+)
+from ._response_cache import get_response_cache, make_cache_key
+from ._tokens import PROMPT_CACHE_MIN_TOKENS, prefix_tokens
+
+
+@lru_cache(maxsize=None)
+def _request_digest(skill_class: Type["LLMSkill"]) -> str:
+    """
+    Hash everything a skill's requests share, for its response cache keys.
+
+    Covers every prefix message (instructions, reference document and
+    few-shot examples) and the output schema, so editing any of them makes
+    earlier responses miss instead of being served stale.
+    """
+    fields = [field for message in skill_class._PREFIX for field in message.values()]
+    schema = json.dumps(response_format(skill_class.output_schema), sort_keys=True)
+    return make_cache_key(*fields, schema)
+
+
+@lru_cache(maxsize=None)
+def _prefix_is_cacheable(skill_class: Type["LLMSkill"], model: str) -> bool:
+    """Check a skill's static prefix reaches OpenAI's prompt caching minimum."""
+    return prefix_tokens(skill_class._PREFIX, model) >= PROMPT_CACHE_MIN_TOKENS
+
+
+class LLMSkill(Skill):
+    """
+    Base class for governance skills backed by one structured OpenAI call.
+
+    A subclass declares its static prompt prefix, output model and output
+    key, and implements build_user_prompt(), placeholder() and describe().
+    This class turns them into the shared request path: exact-match response
+    caching, Structured Outputs with validation feedback, a degraded
+    placeholder on timeout, and streaming.
+
+    Every request sends _PREFIX first and the per-decision user message
+    last. The prefix is built once per class by build_prefix(), so it is
+    byte-identical across requests and OpenAI prompt caching can reuse it
+    once it is long enough (see cache_routing_key).
+
+    Example:
+        class SummaryWriter(LLMSkill):
+            name = "summary_writer"
+            prompt_cache_key = "governance:summary_writer:v1.0.0"
+            output_key = "summary"
+            output_schema = Summary
+            _PREFIX = build_prefix(_SYSTEM_PROMPT, REFERENCE, EXAMPLES)
+
+            def build_user_prompt(self, input): ...
+            def placeholder(self): ...
+            def describe(self, result): ...
+    """
+
+    prompt_version: ClassVar[str]
+    prompt_cache_key: ClassVar[str]
+    temperature: ClassVar[float]
+    # Key of the parsed response in execute()'s output
+    output_key: ClassVar[str]
+    output_schema: ClassVar[Type[BaseModel]]
+    _PREFIX: ClassVar[Prefix]
+
+    __slots__ = ("client", "model", "timeout", "cache")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.client, self.model = resolve_client(type(self).__name__)
+        self.timeout = resolve_timeout()
+        self.cache = get_response_cache()
+
+    @property
+    def cache_routing_key(self) -> Optional[str]:
+        """
+        The prompt_cache_key to send with this skill's requests.
+
+        OpenAI only caches prompt prefixes of at least 1024 tokens, so the
+        key is None (requests are not routed) when the static prefix is
+        shorter. The prefix is counted once per skill class and model.
+        """
+        if _prefix_is_cacheable(type(self), self.model):
+            return self.prompt_cache_key
+        return None
+
+    @abstractmethod
+    def build_user_prompt(self, input: Dict[str, Any]) -> str:
+        """
+        Build the per-decision user message.
+
+        Args:
+            input: Skill input
+
+        Returns:
+            User message content
+
+        Raises:
+            ValueError: If a required input is missing
+        """
+
+    def build_request_messages(self, input: Dict[str, Any]) -> List[Dict[str, str]]:
+        """
+        Build the chat messages of a request, as execute() sends them.
+
+        Args:
+            input: Skill input
+
+        Returns:
+            Static prefix messages followed by the user message
+
+        Raises:
+            ValueError: If a required input is missing
+        """
+        return build_messages(self._PREFIX, self.build_user_prompt(input))
+
+    @abstractmethod
+    def placeholder(self) -> BaseModel:
+        """Build the output returned in place of a timed-out response."""
+
+    @abstractmethod
+    def describe(self, result: Any) -> str:
+        """Summarize a parsed response for the trace reasoning."""
+
+    async def execute(self, input: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run the skill's LLM request, serving repeats from the response cache.
+
+        Args:
+            input: Skill input
+
+        Returns:
+            Dictionary with:
+                - <output_key> (dict): Parsed response
+                - raw_response (str): Raw LLM response for auditing
+                - degraded (bool): Present (True) only when OpenAI did not
+                  respond within OPENAI_TIMEOUT_S and a placeholder was returned
+
+        Raises:
+            ValueError: If the input is invalid
+        """
+        user_prompt = self.build_user_prompt(input)
+
+        # Serve byte-identical requests from the response cache
+        cache_key = self._cache_key(user_prompt)
+        cached = await self._cached_output(cache_key)
+        if cached is not None:
+            if self._trace:
+                self._trace.reasoning = (
+                    f"Served cached {self.model} response from the response cache."
+                )
+            return cached
+
+        return await self._generate(user_prompt, cache_key)
+
+    async def _generate(self, user_prompt: str, cache_key: str) -> Dict[str, Any]:
+        """Call OpenAI for a cache miss and cache the validated output."""
+        # Call OpenAI, feeding validation errors back for correction
+        try:
+            result, raw_response = await complete_json(
+                self.client,
+                model=self.model,
+                messages=build_messages(self._PREFIX, user_prompt),
+                schema=self.output_schema,
+                temperature=self.temperature,
+                prompt_cache_key=self.cache_routing_key,
+                timeout=self.timeout,
+            )
+        except TimeoutError:
+            # Degrade instead of stalling or failing the playbook; not cached
+            return self._degraded_output()
+
+        # Store reasoning in trace
+        if self._trace:
+            self._trace.reasoning = self.describe(result)
+
+        output = {
+            self.output_key: result.model_dump(),
+            "raw_response": raw_response,
+        }
+        await self.cache.set(cache_key, output, self.model)
+
+        return output
+
+    async def execute_stream(
+        self, input: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run the skill, streaming progress as the response is generated.
+
+        Same input, caching, time budget and output as execute(), but for
+        callers that render results as they arrive. Runs outside run(), so
+        no trace is recorded. A stream that outlasts OPENAI_TIMEOUT_S ends
+        with execute()'s degraded placeholder; an invalid streamed response
+        is requested again through execute()'s retrying path, so the result
+        may not match the streamed deltas.
+
+        Args:
+            input: Same as execute()
+
+        Yields:
+            - {"type": "delta", "content": str}: next chunk of raw response
+            - {"type": "item", "field": str, "value": Any}: a completed list
+              entry (e.g. one risk) as soon as it has been generated
+            - {"type": "field", "field": str, "value": Any}: a completed
+              top-level field (e.g. all risks), in generation order
+            - {"type": "result", "output": dict}: execute()'s output, last
+
+        Raises:
+            ValueError: If the input is invalid, or no response was valid
+        """
+        user_prompt = self.build_user_prompt(input)
+        cache_key = self._cache_key(user_prompt)
+        output = await self._cached_output(cache_key)
+        if output is not None:
+            yield {"type": "result", "output": output}
+            return
+
+        async for event in self._generate_stream(user_prompt, cache_key):
+            yield event
+
+    async def _generate_stream(
+        self, user_prompt: str, cache_key: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream OpenAI's response for a cache miss, ending with the output."""
+        try:
+            async for event in stream_json(
+                self.client,
+                model=self.model,
+                messages=build_messages(self._PREFIX, user_prompt),
+                schema=self.output_schema,
+                temperature=self.temperature,
+                prompt_cache_key=self.cache_routing_key,
+                timeout=self.timeout,
+            ):
+                if event["type"] != "result":
+                    yield event
+                    continue
+                output = {
+                    self.output_key: event["value"].model_dump(),
+                    "raw_response": event["raw_response"],
+                }
+                await self.cache.set(cache_key, output, self.model)
+        except TimeoutError:
+            output = self._degraded_output()
+        except ValueError:
+            # Invalid response; retry with validation feedback instead. Not
+            # self._generate(), as overrides have already run their lookups
+            output = await LLMSkill._generate(self, user_prompt, cache_key)
+
+        yield {"type": "result", "output": output}
+
+    def _degraded_output(self) -> Dict[str, Any]:
+        """Build the output returned when OpenAI does not respond in time."""
+        if self._trace:
+            self._trace.reasoning = (
+                f"{self.model} did not respond within {self.timeout:g}s. "
+                "Returned a degraded placeholder."
+            )
+        return {
+            self.output_key: self.placeholder().model_dump(),
+            "raw_response": "",
+            "degraded": True,
+        }
+
+    def _cache_key(self, user_prompt: str) -> str:
+        """Build the response cache key for a request."""
+        return make_cache_key(
+            self.model,
+            self.prompt_version,
+            _request_digest(type(self)),
+            user_prompt,
+        )
+
+    async def _cached_output(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached output, evicting entries that no longer validate."""
+        cached = await self.cache.get(cache_key)
+        if cached is None:
+            return None
+
+        try:
+            result = self.output_schema.model_validate(cached[self.output_key])
+        except (KeyError, ValidationError):
+            # Schema drifted since the entry was written
+            await self.cache.delete(cache_key)
+            return None
+
+        return {
+            self.output_key: result.model_dump(),
+            "raw_response": cached.get("raw_response", ""),
+        }
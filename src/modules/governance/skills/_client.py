@@ -0,0 +1,75 @@
+"""Shared OpenAI client for governance skills."""
+
+import os
+from typing import Dict, Final, Tuple
+
+from openai import AsyncOpenAI
+
+API_KEY_ENV: Final = "OPENAI_API_KEY"
+MODEL_ENV: Final = "OPENAI_MODEL"
+DEFAULT_MODEL: Final = "gpt-4o-mini"
+TIMEOUT_ENV: Final = "OPENAI_TIMEOUT_S"
+DEFAULT_TIMEOUT_SECONDS: Final = 15.0
+
+_clients: Dict[str, AsyncOpenAI] = {}
+
+
+def get_client(api_key: str) -> AsyncOpenAI:
+    """
+    Get the AsyncOpenAI client shared by all governance skills.
+
+    Each AsyncOpenAI owns an HTTP connection pool, so constructing one per
+    skill instance pays a fresh TCP/TLS handshake on every first call. Skills
+    using the same API key share one client and therefore one warm pool.
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        Shared AsyncOpenAI client for the key
+    """
+    client = _clients.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(api_key=api_key)
+        _clients[api_key] = client
+    return client
+
+
+def resolve_client(owner: str) -> Tuple[AsyncOpenAI, str]:
+    """
+    Get the shared client and configured model from the environment.
+
+    The environment is read on each call (a dict lookup) rather than at
+    import time, so importing the governance package never requires an API
+    key and configuration changes apply to newly created skills.
+
+    Args:
+        owner: Class name used in the error message
+
+    Returns:
+        Tuple of (shared AsyncOpenAI client, model name)
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set
+    """
+    api_key = os.environ.get(API_KEY_ENV)
+    if not api_key:
+        raise ValueError(
+            f"{API_KEY_ENV} environment variable must be set to use {owner}"
+        )
+    return get_client(api_key), os.environ.get(MODEL_ENV, DEFAULT_MODEL)
+
+
+def resolve_timeout() -> float:
+    """
+    Get the per-call time budget for governance LLM requests.
+
+    Returns:
+        Seconds from OPENAI_TIMEOUT_S, or 15 when unset
+    """
+    return float(os.environ.get(TIMEOUT_ENV, DEFAULT_TIMEOUT_SECONDS))
+
+
+def reset_clients() -> None:
+    """Drop all shared clients (mainly for testing)."""
+    _clients.clear()
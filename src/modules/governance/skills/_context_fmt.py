@@ -0,0 +1,50 @@
+"""Shared formatting of decision context for governance prompts."""
+
+from functools import lru_cache
+from typing import Any, Mapping, Tuple
+
+_LIST_FIELDS = ("stakeholders", "constraints", "data_sources", "risk_factors")
+# Every decision context field that format_context() reads
+CONTEXT_FIELDS = ("decision_summary", *_LIST_FIELDS)
+
+
+def format_context(decision_context: Mapping[str, Any]) -> str:
+    """
+    Format a decision context as the user message body for governance skills.
+
+    RiskIdentifier and LeadershipQuestionsGenerator both describe the decision
+    with this text, so the same context always produces byte-identical
+    prompts across skills and runs. Results are memoized, since a pipeline
+    formats the same context once per skill.
+
+    Args:
+        decision_context: Context from DecisionContextExtractor
+
+    Returns:
+        One "Field: value" line per context field
+    """
+    summary = decision_context.get("decision_summary", "Not provided")
+    lists = tuple(tuple(decision_context.get(field) or ()) for field in _LIST_FIELDS)
+    try:
+        return _format_cached(summary, lists)
+    except TypeError:
+        # Unhashable values cannot be memoized
+        return _format(summary, lists)
+
+
+@lru_cache(maxsize=256)
+def _format_cached(summary: Any, lists: Tuple[Tuple[Any, ...], ...]) -> str:
+    return _format(summary, lists)
+
+
+def _format(summary: Any, lists: Tuple[Tuple[Any, ...], ...]) -> str:
+    stakeholders, constraints, data_sources, risk_factors = lists
+    lines = [
+        f"Decision Summary: {summary}",
+        f"Stakeholders: {', '.join(stakeholders)}",
+        f"Constraints: {', '.join(constraints)}",
+        f"Data Sources: {', '.join(data_sources)}",
+    ]
+    if risk_factors:
+        lines.append(f"Pre-identified Risk Factors: {', '.join(risk_factors)}")
+    return "\n".join(lines)
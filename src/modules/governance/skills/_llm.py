@@ -0,0 +1,477 @@
+"""Structured JSON completions shared by the governance skills."""
+
+import asyncio
+import copy
+import json
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from openai import APITimeoutError, AsyncOpenAI
+from pydantic import BaseModel, ValidationError
+
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 1.0
+
+# Static messages shared by every request of a skill; never mutate them
+Prefix = Tuple[Dict[str, str], ...]
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def build_prefix(
+    system_prompt: str,
+    reference: str,
+    examples: Sequence[Tuple[str, str]],
+) -> Prefix:
+    """
+    Build the static message prefix of a governance skill.
+
+    The instructions, reference document and few-shot examples never vary
+    per call, so each skill builds them once and every request reuses the
+    same message objects, keeping the prefix byte-identical for OpenAI
+    prompt caching.
+
+    Args:
+        system_prompt: Skill instructions
+        reference: Static reference document
+        examples: Few-shot (user message, assistant response) pairs
+
+    Returns:
+        Prefix messages
+    """
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "system", "content": reference},
+    ]
+    for example_input, example_output in examples:
+        messages.append({"role": "user", "content": example_input})
+        messages.append({"role": "assistant", "content": example_output})
+    return tuple(messages)
+
+
+def build_messages(prefix: Prefix, user_prompt: str) -> List[Dict[str, str]]:
+    """
+    Assemble the chat messages for a governance request.
+
+    Args:
+        prefix: Static prefix from build_prefix()
+        user_prompt: Per-decision user message
+
+    Returns:
+        Chat messages
+    """
+    return [*prefix, {"role": "user", "content": user_prompt}]
+
+
+def strict_json_schema(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build the JSON schema of a Pydantic model in Structured Outputs' strict form.
+
+    Strict mode requires every object to list all of its properties as
+    required and to forbid additional properties. Optional fields stay
+    nullable, so the model still fills them with None.
+
+    Args:
+        schema: Pydantic output model
+
+    Returns:
+        Strict JSON schema
+    """
+    root = schema.model_json_schema()
+    return _make_strict(root, root)
+
+
+def _make_strict(node: Dict[str, Any], root: Dict[str, Any]) -> Dict[str, Any]:
+    """Make a JSON schema node and everything nested in it strict, in place."""
+    for definition in node.get("$defs", {}).values():
+        _make_strict(definition, root)
+
+    if node.get("type") == "object":
+        node.setdefault("additionalProperties", False)
+    properties = node.get("properties")
+    if isinstance(properties, dict):
+        node["required"] = list(properties)
+        for value in properties.values():
+            _make_strict(value, root)
+    if isinstance(node.get("items"), dict):
+        _make_strict(node["items"], root)
+    for variant in node.get("anyOf", []):
+        _make_strict(variant, root)
+    all_of = node.get("allOf")
+    if all_of is not None and len(all_of) == 1:
+        node.update(_make_strict(all_of[0], root))
+        del node["allOf"]
+    elif all_of is not None:
+        for entry in all_of:
+            _make_strict(entry, root)
+
+    # None defaults are implied by nullable types
+    if "default" in node and node["default"] is None:
+        del node["default"]
+
+    # A $ref cannot have siblings such as a description, so inline it
+    ref = node.get("$ref")
+    if ref is not None and len(node) > 1:
+        resolved: Any = root
+        for key in ref.removeprefix("#/").split("/"):
+            resolved = resolved[key]
+        del node["$ref"]
+        node.update({**copy.deepcopy(resolved), **node})
+        return _make_strict(node, root)
+
+    return node
+
+
+def cache_routing(prompt_cache_key: Optional[str]) -> Dict[str, str]:
+    """
+    Build the request fields routing a skill's traffic to one prompt-cache shard.
+
+    Args:
+        prompt_cache_key: OpenAI prompt cache routing key, or None for none
+
+    Returns:
+        Extra request body fields
+    """
+    if prompt_cache_key is None:
+        return {}
+    return {"prompt_cache_key": prompt_cache_key}
+
+
+@lru_cache(maxsize=None)
+def response_format(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build a Structured Outputs response format for a Pydantic model.
+
+    The schema is enforced server-side, so the model can only return JSON
+    matching the output model.
+
+    Args:
+        schema: Pydantic output model
+
+    Returns:
+        response_format parameter for chat.completions.create()
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": schema.__name__,
+            "schema": strict_json_schema(schema),
+            "strict": True,
+        },
+    }
+
+
+async def complete_json(
+    client: AsyncOpenAI,
+    *,
+    model: str,
+    messages: List[Dict[str, str]],
+    schema: Type[ModelT],
+    temperature: float,
+    prompt_cache_key: Optional[str],
+    max_attempts: int = MAX_ATTEMPTS,
+    timeout: Optional[float] = None,
+) -> Tuple[ModelT, str]:
+    """
+    Request a JSON completion and validate it against a Pydantic model.
+
+    The output model is sent as a strict JSON schema. A response that still
+    fails validation (e.g. a refusal or truncated output) is not discarded:
+    it is appended to the conversation together with the validation error
+    and the model is asked to correct it. The original messages are left
+    untouched so the request prefix stays byte-identical for OpenAI prompt
+    caching.
+
+    Args:
+        client: OpenAI client
+        model: Model name
+        messages: Initial chat messages (not modified)
+        schema: Pydantic model the response must validate against
+        temperature: Sampling temperature
+        prompt_cache_key: OpenAI prompt cache routing key, or None for none
+        max_attempts: Total number of requests to make before giving up
+        timeout: Overall time budget in seconds, covering every attempt
+
+    Returns:
+        Tuple of (validated model, raw response text)
+
+    Raises:
+        ValueError: If no attempt produced a valid response
+        TimeoutError: If the time budget ran out
+    """
+    try:
+        async with asyncio.timeout(timeout):
+            return await _complete_json(
+                client,
+                model=model,
+                messages=messages,
+                schema=schema,
+                temperature=temperature,
+                prompt_cache_key=prompt_cache_key,
+                max_attempts=max_attempts,
+                request_options={} if timeout is None else {"timeout": timeout},
+            )
+    except APITimeoutError as e:
+        raise TimeoutError(f"OpenAI request timed out after {timeout}s") from e
+
+
+async def _complete_json(
+    client: AsyncOpenAI,
+    *,
+    model: str,
+    messages: List[Dict[str, str]],
+    schema: Type[ModelT],
+    temperature: float,
+    prompt_cache_key: Optional[str],
+    max_attempts: int,
+    request_options: Dict[str, Any],
+) -> Tuple[ModelT, str]:
+    """Run the completion attempts for complete_json()."""
+    conversation: List[Dict[str, Any]] = list(messages)
+
+    for attempt in range(max_attempts):
+        response = await client.chat.completions.create(
+            model=model,
+            messages=conversation,  # type: ignore[arg-type]
+            temperature=temperature,
+            response_format=response_format(schema),  # type: ignore[arg-type]
+            extra_body=cache_routing(prompt_cache_key),
+            **request_options,
+        )
+
+        raw_response = response.choices[0].message.content or "{}"
+
+        try:
+            return schema.model_validate_json(raw_response), raw_response
+        except ValidationError as e:
+            if attempt + 1 >= max_attempts:
+                raise ValueError(f"Failed to parse LLM response: {e}") from e
+
+            conversation.append({"role": "assistant", "content": raw_response})
+            conversation.append(
+                {
+                    "role": "user",
+                    "content": (
+                        f"Your output had error: {e}. "
+                        "Return valid JSON matching the schema."
+                    ),
+                }
+            )
+            await asyncio.sleep(RETRY_BACKOFF_SECONDS * (attempt + 1))
+
+    raise ValueError("max_attempts must be at least 1")
+
+
+class ArrayItemScanner:
+    """
+    Incrementally extract completed elements of a JSON object's array fields.
+
+    Fed the text of a streamed JSON object chunk by chunk, the scanner reports
+    each element of a top-level array field (e.g. one risk in "risks") as soon
+    as the element's closing delimiter arrives, without waiting for the rest
+    of the document. Top-level fields whose value is complete are collected
+    in fields, in document order.
+
+    Example:
+        scanner = ArrayItemScanner()
+        scanner.feed('{"risks": [{"severity": "high"}, ')
+        # [("risks", {"severity": "high"})]
+        scanner.feed('{"severity": "low"}], ')
+        # scanner.fields == {"risks": [{"severity": "high"}, ...]}
+    """
+
+    def __init__(self) -> None:
+        self._document = ""
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string = ""
+        self._key = ""
+        self._in_array = False
+        self._item_start: Optional[int] = None
+        self._value_start: Optional[int] = None
+        self._awaiting_value = False
+        self.fields: Dict[str, Any] = {}
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """
+        Consume the next chunk of the document.
+
+        Args:
+            text: Next chunk of JSON text
+
+        Returns:
+            (field name, element) for each element completed by this chunk
+        """
+        items: List[Tuple[str, Any]] = []
+        start = len(self._document)
+        self._document += text
+        document = self._document
+
+        for index in range(start, len(document)):
+            char = document[index]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = document[self._string_start : index]
+                continue
+
+            if self._awaiting_value and not char.isspace():
+                self._awaiting_value = False
+                self._value_start = index
+
+            if self._in_array and self._depth == 2 and self._item_start is None:
+                if not char.isspace() and char not in ",]":
+                    self._item_start = index
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = index + 1
+            elif char == ":" and self._depth == 1:
+                self._key = self._last_string
+                self._awaiting_value = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 2 and char == "[":
+                    self._in_array = True
+                    self._item_start = None
+            elif char in "}]":
+                if self._depth == 2 and self._in_array:
+                    self._emit(document, index, items)
+                    self._in_array = False
+                elif self._depth == 1:
+                    self._emit_field(document, index)
+                self._depth -= 1
+            elif char == "," and self._depth == 2 and self._in_array:
+                self._emit(document, index, items)
+            elif char == "," and self._depth == 1:
+                self._emit_field(document, index)
+
+        return items
+
+    def _emit(self, document: str, end: int, items: List[Tuple[str, Any]]) -> None:
+        """Record the array element ending just before index end."""
+        if self._item_start is not None:
+            try:
+                items.append((self._key, json.loads(document[self._item_start : end])))
+            except json.JSONDecodeError:
+                pass
+        self._item_start = None
+
+    def _emit_field(self, document: str, end: int) -> None:
+        """Record the top-level field value ending just before index end."""
+        if self._value_start is not None:
+            try:
+                self.fields[self._key] = json.loads(document[self._value_start : end])
+            except json.JSONDecodeError:
+                pass
+        self._value_start = None
+
+
+async def stream_json(
+    client: AsyncOpenAI,
+    *,
+    model: str,
+    messages: List[Dict[str, str]],
+    schema: Type[ModelT],
+    temperature: float,
+    prompt_cache_key: Optional[str],
+    timeout: Optional[float] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream a JSON completion, reporting progress as it is generated.
+
+    Yields events:
+        - {"type": "delta", "content": str}: next chunk of raw response text
+        - {"type": "item", "field": str, "value": Any}: a completed element of
+          a top-level array field, as soon as it has been generated
+        - {"type": "field", "field": str, "value": Any}: a top-level field
+          whose value is complete, as soon as it has been generated
+        - {"type": "result", "value": ModelT, "raw_response": str}: the
+          validated response, always last
+
+    Unlike complete_json(), an invalid response is not retried. The time
+    budget covers the request and every chunk of the stream, but not the
+    time the caller spends between chunks.
+
+    Args:
+        client: OpenAI client
+        model: Model name
+        messages: Chat messages
+        schema: Pydantic model the response must validate against
+        temperature: Sampling temperature
+        prompt_cache_key: OpenAI prompt cache routing key, or None for none
+        timeout: Time budget in seconds for the whole response
+
+    Yields:
+        Stream events
+
+    Raises:
+        ValueError: If the completed response fails validation
+        TimeoutError: If the time budget ran out
+    """
+    deadline = None if timeout is None else asyncio.get_running_loop().time() + timeout
+
+    try:
+        async with asyncio.timeout_at(deadline):
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=messages,  # type: ignore[arg-type]
+                temperature=temperature,
+                response_format=response_format(schema),  # type: ignore[arg-type]
+                stream=True,
+                extra_body=cache_routing(prompt_cache_key),
+                **({} if timeout is None else {"timeout": timeout}),
+            )
+
+        scanner = ArrayItemScanner()
+        chunks: List[str] = []
+        completed: List[str] = []
+        chunk_iterator = aiter(stream)
+        while True:
+            # Bound each wait rather than the generator, which is suspended
+            # in the caller's task between chunks
+            async with asyncio.timeout_at(deadline):
+                try:
+                    chunk = await anext(chunk_iterator)
+                except StopAsyncIteration:
+                    break
+            if not chunk.choices:
+                continue
+            content = chunk.choices[0].delta.content
+            if not content:
+                continue
+            chunks.append(content)
+            yield {"type": "delta", "content": content}
+            for field, value in scanner.feed(content):
+                yield {"type": "item", "field": field, "value": value}
+            for field in list(scanner.fields)[len(completed) :]:
+                completed.append(field)
+                yield {"type": "field", "field": field, "value": scanner.fields[field]}
+    except APITimeoutError as e:
+        raise TimeoutError(f"OpenAI request timed out after {timeout}s") from e
+
+    raw_response = "".join(chunks) or "{}"
+    try:
+        result = schema.model_validate_json(raw_response)
+    except ValidationError as e:
+        raise ValueError(f"Failed to parse LLM response: {e}") from e
+
+    yield {"type": "result", "value": result, "raw_response": raw_response}
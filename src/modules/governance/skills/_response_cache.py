@@ -0,0 +1,197 @@
+"""ResponseCache - content-addressable cache for governance skill LLM responses."""
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+CACHE_DIR_ENV = "GOVERNANCE_CACHE_DIR"
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(*fields: str) -> str:
+    """
+    Build a content-addressable cache key from prompt fields.
+
+    Each field is length-prefixed (8 bytes, big-endian) before hashing so
+    that ("ab", "c") and ("a", "bc") can never produce the same key.
+
+    Args:
+        *fields: Strings identifying the request (model, prompt version,
+                 system prompt, user prompt, ...)
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for field in fields:
+        data = field.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    Cache of parsed LLM responses keyed by request content.
+
+    Entries are held in a bounded in-memory LRU and, when a cache directory
+    is configured, persisted as one JSON file per key so that audit replays
+    survive process restarts.
+
+    Example:
+        cache = ResponseCache(cache_dir=".cache/governance")
+        key = make_cache_key(model, "v1", system_prompt, user_prompt)
+        cached = await cache.get(key)
+        if cached is None:
+            ...  # call the LLM
+            await cache.set(key, {"context": ..., "raw_response": ...}, model)
+    """
+
+    def __init__(
+        self, cache_dir: Optional[str] = None, max_entries: int = 1024
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Optional directory for persistent entries
+            max_entries: Maximum number of entries kept in memory
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None and self.cache_dir:
+            entry = await asyncio.to_thread(self._read_entry, key)
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        value: Dict[str, Any] = entry["value"]
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any], model: str) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key from make_cache_key()
+            value: JSON-serializable value to cache (copied, so later
+                   mutation by the caller does not leak into the cache)
+            model: Model that produced the value (kept for auditing)
+        """
+        entry = {
+            "value": copy.deepcopy(value),
+            "model": model,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+        self._remember(key, entry)
+
+        if self.cache_dir:
+            try:
+                await asyncio.to_thread(self._write_entry, key, entry)
+            except OSError as e:
+                # The value is cached in memory; a failed write must not fail
+                # the skill that produced it
+                logger.warning("Could not persist cache entry %s: %s", key, e)
+
+    async def delete(self, key: str) -> None:
+        """
+        Evict a value (e.g. one that no longer matches the output schema).
+
+        Args:
+            key: Cache key from make_cache_key()
+        """
+        self._entries.pop(key, None)
+
+        if self.cache_dir:
+            path = self.cache_dir / f"{key}.json"
+            try:
+                await asyncio.to_thread(path.unlink, True)
+            except OSError as e:
+                logger.warning("Could not delete cache entry %s: %s", key, e)
+
+    def clear(self) -> None:
+        """Clear all in-memory entries (persistent entries are kept)."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        """Insert an entry into the in-memory LRU, evicting the oldest."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read a persisted entry, treating unreadable files as misses."""
+        path = self.cache_dir / f"{key}.json"  # type: ignore[operator]
+        try:
+            entry: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return None
+        return entry
+
+    def _write_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        """Persist an entry via a temporary file so readers never see a torn write."""
+        path = self.cache_dir / f"{key}.json"  # type: ignore[operator]
+        # A temporary file of its own per write, as writes of a key can overlap
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=self.cache_dir,
+            prefix=f"{key}.",
+            suffix=".tmp",
+            delete=False,
+        ) as tmp_file:
+            try:
+                tmp_file.write(json.dumps(entry))
+                tmp_file.close()
+                os.replace(tmp_file.name, path)
+            except BaseException:
+                os.unlink(tmp_file.name)
+                raise
+
+
+_default_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get the process-wide response cache shared by all governance skills.
+
+    The cache is persisted to disk when the GOVERNANCE_CACHE_DIR environment
+    variable is set at first use; otherwise it is in-memory only.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResponseCache(cache_dir=os.getenv(CACHE_DIR_ENV))
+    return _default_cache
@@ -0,0 +1,254 @@
+"""SemanticCache - similarity lookup of governance responses for paraphrased input."""
+
+import copy
+import math
+import operator
+import os
+import re
+import threading
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+SEMANTIC_CACHE_ENV = "GOVERNANCE_SEMANTIC_CACHE"
+DEFAULT_THRESHOLD = 0.95
+
+# Monetary amounts, percentages and other figures, e.g. "$400k", "400,000", "6.2%"
+_FIGURE_PATTERN = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*([kmb%])?(?![a-z\d])", re.I)
+# Capitalized words; those starting a sentence or line are skipped as non-names
+_NAME_PATTERN = re.compile(r"\b[A-Z][\w&'-]*")
+_MULTIPLIERS = {"k": 1e3, "m": 1e6, "b": 1e9}
+
+
+def critical_tokens(text: str) -> FrozenSet[str]:
+    """
+    Extract the business-critical tokens two texts must share to be equivalent.
+
+    Embeddings place "approved $400k" and "approved $40k" very close together,
+    so a semantic hit is only accepted when figures and names match exactly.
+    Figures are normalized so that "$400k" and "$400,000" compare equal.
+
+    Args:
+        text: Decision text
+
+    Returns:
+        Set of normalized figures and names
+    """
+    tokens = set()
+    for number, suffix in _FIGURE_PATTERN.findall(text):
+        suffix = suffix.lower()
+        value = float(number.replace(",", "")) * _MULTIPLIERS.get(suffix, 1)
+        figure = f"{value:f}".rstrip("0").rstrip(".")
+        tokens.add(figure + "%" if suffix == "%" else figure)
+    for match in _NAME_PATTERN.finditer(text):
+        if not _starts_sentence(text, match.start()):
+            tokens.add(match.group().lower())
+    return frozenset(tokens)
+
+
+def _starts_sentence(text: str, index: int) -> bool:
+    """Check whether the word at index opens a sentence or line."""
+    before = text[max(0, index - 16) : index]
+    stripped = before.rstrip()
+    if not stripped:
+        return index < 16 or "\n" in before
+    return stripped[-1] in ".!?:" or "\n" in before[len(stripped) :]
+
+
+def _normalize(vector: Sequence[float]) -> "array[float]":
+    """Scale a vector to unit length so a dot product is cosine similarity."""
+    norm = math.sqrt(math.fsum(x * x for x in vector))
+    if norm == 0:
+        return array("d", vector)
+    return array("d", (x / norm for x in vector))
+
+
+def _sum_products(a: Sequence[float], b: Sequence[float]) -> float:
+    """Dot product of two vectors of the same length."""
+    return sum(map(operator.mul, a, b))
+
+
+# Dot product in C on Python 3.12+
+_dot: Callable[[Sequence[float], Sequence[float]], float] = getattr(
+    math, "sumprod", _sum_products
+)
+
+
+@dataclass(frozen=True, eq=False)
+class _Entry:
+    namespace: str
+    vector: "array[float]"
+    tokens: FrozenSet[str]
+    value: Dict[str, Any]
+
+
+class SemanticCache:
+    """
+    Cache of parsed LLM responses looked up by embedding similarity.
+
+    Sits in front of the exact-match ResponseCache so that paraphrases of an
+    earlier decision reuse its response. A lookup hits when the most similar
+    entry with the same namespace and critical tokens (figures and names) as
+    the query reaches the similarity threshold.
+
+    Example:
+        cache = SemanticCache(threshold=0.95)
+        hit = cache.get(namespace, embedding, decision_text)
+        if hit is None:
+            ...  # call the LLM
+            cache.set(namespace, embedding, decision_text, output)
+    """
+
+    def __init__(
+        self, threshold: float = DEFAULT_THRESHOLD, max_entries: int = 1024
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum number of entries kept (oldest evicted first)
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: Deque[_Entry] = deque()
+        # Entries by namespace and critical tokens; only a query's own bucket
+        # can hit, so lookups score those entries alone
+        self._buckets: Dict[Tuple[str, FrozenSet[str]], List[_Entry]] = {}
+        # get() may run on a worker thread while entries are added
+        self._lock = threading.Lock()
+
+    def get(
+        self, namespace: str, embedding: Sequence[float], text: str
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Find a cached value for a semantically equivalent text.
+
+        Thread-safe; scoring a large bucket takes milliseconds of pure Python,
+        so async callers should run it in a worker thread.
+
+        Args:
+            namespace: Scope of comparable entries (model, prompt version, ...)
+            embedding: Embedding of text
+            text: Text the embedding was computed from
+
+        Returns:
+            Tuple of (cached value, similarity), or None on a miss
+        """
+        query = _normalize(embedding)
+        with self._lock:
+            candidates = list(self._buckets.get((namespace, critical_tokens(text)), ()))
+
+        best: Optional[_Entry] = None
+        best_score = -1.0
+        for entry in candidates:
+            if len(entry.vector) != len(query):
+                continue
+            score = _dot(query, entry.vector)
+            if score > best_score:
+                best, best_score = entry, score
+
+        if best is None or best_score < self.threshold:
+            return None
+        return best.value, best_score
+
+    def set(
+        self,
+        namespace: str,
+        embedding: Sequence[float],
+        text: str,
+        value: Dict[str, Any],
+    ) -> None:
+        """
+        Store a value.
+
+        Args:
+            namespace: Scope of comparable entries (model, prompt version, ...)
+            embedding: Embedding of text
+            text: Text the embedding was computed from
+            value: Value to cache (copied)
+        """
+        entry = _Entry(
+            namespace=namespace,
+            vector=_normalize(embedding),
+            tokens=critical_tokens(text),
+            value=copy.deepcopy(value),
+        )
+        with self._lock:
+            while len(self._entries) >= self.max_entries:
+                self._forget(self._entries.popleft())
+            self._entries.append(entry)
+            self._buckets.setdefault((namespace, entry.tokens), []).append(entry)
+
+    def delete(self, value: Dict[str, Any]) -> None:
+        """
+        Remove the entry holding a value.
+
+        Args:
+            value: Value returned by get()
+        """
+        with self._lock:
+            for entry in [entry for entry in self._entries if entry.value is value]:
+                self._entries.remove(entry)
+                self._forget(entry)
+
+    def clear(self) -> None:
+        """Clear all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _forget(self, entry: _Entry) -> None:
+        """Remove an entry from its bucket."""
+        key = (entry.namespace, entry.tokens)
+        bucket = self._buckets[key]
+        bucket.remove(entry)
+        if not bucket:
+            del self._buckets[key]
+
+
+_default_cache: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Get the process-wide semantic cache, if enabled.
+
+    Semantic caching trades an embedding call per request for skipping the
+    completion on paraphrased input, so it is opt-in: set the
+    GOVERNANCE_SEMANTIC_CACHE environment variable to a similarity threshold
+    (e.g. "0.95") or to "1" to use the default threshold.
+
+    Returns:
+        The shared SemanticCache, or None when disabled
+    """
+    global _default_cache
+    setting = os.getenv(SEMANTIC_CACHE_ENV, "").strip()
+    if not setting or setting.lower() in ("0", "false", "no", "off"):
+        return None
+    if _default_cache is None:
+        threshold = DEFAULT_THRESHOLD
+        if setting.lower() not in ("1", "true", "yes", "on"):
+            threshold = float(setting)
+        _default_cache = SemanticCache(threshold=threshold)
+    return _default_cache
+
+
+def reset_semantic_cache() -> None:
+    """Drop the shared semantic cache (mainly for testing)."""
+    global _default_cache
+    _default_cache = None
@@ -0,0 +1,63 @@
+"""Local token counting for governance prompts."""
+
+from functools import lru_cache
+from typing import Any, Final, Optional
+
+from ._client import DEFAULT_MODEL
+from ._llm import Prefix
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None  # type: ignore[assignment]
+
+# OpenAI only caches prompt prefixes of at least this many tokens
+PROMPT_CACHE_MIN_TOKENS: Final = 1024
+# Rough characters per token of English prose, used without tiktoken
+_CHARS_PER_TOKEN: Final = 4
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str) -> Optional[Any]:
+    """Get the tiktoken encoding for a model, if tiktoken is installed."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Models newer than the installed tiktoken use the latest encoding
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text: str, model: str = DEFAULT_MODEL) -> int:
+    """
+    Count the tokens in a text without an API round trip.
+
+    Uses tiktoken when installed (pip install agentic-playbooks[tokens]) and
+    otherwise estimates from the text length.
+
+    Args:
+        text: Text to count
+        model: Model whose tokenizer to use
+
+    Returns:
+        Number of tokens (estimated without tiktoken)
+    """
+    encoding = _encoding(model)
+    if encoding is None:
+        return -(-len(text) // _CHARS_PER_TOKEN)
+    return len(encoding.encode(text))
+
+
+def prefix_tokens(prefix: Prefix, model: str = DEFAULT_MODEL) -> int:
+    """
+    Count the tokens in a skill's static message prefix.
+
+    Args:
+        prefix: Prefix from build_prefix()
+        model: Model whose tokenizer to use
+
+    Returns:
+        Number of content tokens in the prefix
+    """
+    return sum(count_tokens(message["content"], model) for message in prefix)
@@ -1,13 +1,41 @@
 """DecisionContextExtractor - extracts governance context from AI decisions."""
 
-import json
-import os
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Final,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from openai import APITimeoutError
+from pydantic import BaseModel, Field, ValidationError
+
+from ._base import LLMSkill
+from ._llm import Prefix, build_prefix
+from ._semantic_cache import get_semantic_cache
+from ._taxonomy import EXTRACTION_EXAMPLES, EXTRACTION_SCHEMA
+
+_SYSTEM_PROMPT: Final[
+    str
+] = """You are a governance analyst extracting structured context from AI decisions.
+Extract the decision summary, stakeholders, constraints, data sources, risk factors
+and your confidence level from the decision text, following the extraction schema.
 
-from openai import AsyncOpenAI
-from pydantic import BaseModel, Field
+Return your analysis as a JSON object with these exact keys:
+- decision_summary: string
+- stakeholders: array of strings
+- constraints: array of strings
+- data_sources: array of strings
+- risk_factors: array of strings
+- confidence_level: string (high/medium/low)
 
-from ....skills.base import Skill
+Be thorough but concise. If a category has no items, use an empty array."""
 
 
 class DecisionContext(BaseModel):
@@ -31,7 +59,7 @@ class DecisionContext(BaseModel):
     )
 
 
-class DecisionContextExtractor(Skill):
+class DecisionContextExtractor(LLMSkill):
     """
     Extract governance context from AI decision text.
 
@@ -58,31 +86,39 @@ class DecisionContextExtractor(Skill):
 
     name = "decision_context_extractor"
     version = "1.0.0"
+    prompt_version: ClassVar[str] = "v3"
+    prompt_cache_key: ClassVar[str] = "governance:decision_context_extractor:v1.0.0"
+    temperature: ClassVar[float] = 0.1  # Low temperature for consistent extraction
+    embedding_model = "text-embedding-3-small"
+
+    output_key: ClassVar[str] = "context"
+    output_schema: ClassVar[Type[BaseModel]] = DecisionContext
+
+    _PREFIX: ClassVar[Prefix] = build_prefix(
+        _SYSTEM_PROMPT, EXTRACTION_SCHEMA, EXTRACTION_EXAMPLES
+    )
     description = "Extract governance context from AI decision text"
 
+    __slots__ = ("semantic_cache",)
+
     def __init__(self) -> None:
         super().__init__()
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "OPENAI_API_KEY environment variable must be set to use DecisionContextExtractor"
-            )
-        self.client = AsyncOpenAI(api_key=api_key)
-        self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        self.semantic_cache = get_semantic_cache()
 
-    async def execute(self, input: Dict[str, Any]) -> Dict[str, Any]:
+    @property
+    def _namespace(self) -> str:
+        """Semantic cache scope: only responses from the same model and prompt."""
+        return f"{self.name}:{self.model}:{self.prompt_version}"
+
+    def build_user_prompt(self, input: Dict[str, Any]) -> str:
         """
-        Extract decision context from text.
+        Build the per-decision user message.
 
         Args:
-            input: Dictionary with:
-                - decision_text (str): The decision text to analyze
-                - additional_context (str, optional): Additional context for analysis
+            input: Dictionary with decision_text and optional additional_context
 
         Returns:
-            Dictionary with:
-                - context (dict): Extracted decision context
-                - raw_response (str): Raw LLM response for auditing
+            User message content
 
         Raises:
             ValueError: If decision_text is missing
@@ -93,60 +129,109 @@ class DecisionContextExtractor(Skill):
 
         additional_context = input.get("additional_context", "")
 
-        # Build prompt for extraction
-        system_prompt = """You are a governance analyst extracting structured context from AI decisions.
-Extract the following information from the decision text:
-1. A brief summary of the decision
-2. All stakeholders mentioned or implied (people, organizations, systems)
-3. Any constraints or limitations mentioned
-4. Data sources referenced or used
-5. Potential risk factors or concerns
-6. Your confidence level in this extraction (high/medium/low)
-
-Return your analysis as a JSON object with these exact keys:
-- decision_summary: string
-- stakeholders: array of strings
-- constraints: array of strings
-- data_sources: array of strings
-- risk_factors: array of strings
-- confidence_level: string (high/medium/low)
-
-Be thorough but concise. If a category has no items, use an empty array."""
-
         user_prompt = f"""Decision Text:
 {decision_text}"""
 
         if additional_context:
             user_prompt += f"\n\nAdditional Context:\n{additional_context}"
 
-        # Call OpenAI
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=0.1,  # Low temperature for consistent extraction
-            response_format={"type": "json_object"},
+        return user_prompt
+
+    def placeholder(self) -> DecisionContext:
+        """Build the output returned in place of a timed-out response."""
+        return DecisionContext(decision_summary="<timeout>", confidence_level="low")
+
+    def describe(self, result: DecisionContext) -> str:
+        """Summarize a parsed response for the trace reasoning."""
+        return (
+            f"Extracted decision context using {self.model}. "
+            f"Confidence: {result.confidence_level or 'unknown'}"
         )
 
-        raw_response = response.choices[0].message.content or "{}"
+    async def _generate(self, user_prompt: str, cache_key: str) -> Dict[str, Any]:
+        """Serve paraphrases from the semantic cache before calling OpenAI."""
+        embedding, similar = await self._lookup_similar(user_prompt)
+        if similar is not None:
+            return similar
+
+        output = await super()._generate(user_prompt, cache_key)
+        self._remember(embedding, user_prompt, output)
+        return output
+
+    async def _generate_stream(
+        self, user_prompt: str, cache_key: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Serve paraphrases from the semantic cache before streaming."""
+        embedding, similar = await self._lookup_similar(user_prompt)
+        if similar is not None:
+            yield {"type": "result", "output": similar}
+            return
+
+        async for event in super()._generate_stream(user_prompt, cache_key):
+            if event["type"] == "result":
+                self._remember(embedding, user_prompt, event["output"])
+            yield event
+
+    async def _lookup_similar(
+        self, user_prompt: str
+    ) -> Tuple[Optional[List[float]], Optional[Dict[str, Any]]]:
+        """
+        Look a user prompt up in the semantic cache.
+
+        Cached outputs are validated as _cached_output() does; entries that
+        no longer validate are evicted and count as a miss. The embedding
+        request shares the completion's OPENAI_TIMEOUT_S budget; when it
+        runs out the semantic cache is skipped.
+
+        Args:
+            user_prompt: Per-decision user message
+
+        Returns:
+            Tuple of (prompt embedding, output of a similar decision); the
+            embedding is None when semantic caching is disabled or timed out,
+            and the output is None on a miss
+        """
+        if self.semantic_cache is None:
+            return None, None
 
-        # Parse and validate response
         try:
-            context_data = json.loads(raw_response)
-            context = DecisionContext(**context_data)
-        except (json.JSONDecodeError, ValueError) as e:
-            raise ValueError(f"Failed to parse LLM response: {e}") from e
+            async with asyncio.timeout(self.timeout):
+                response = await self.client.embeddings.create(
+                    model=self.embedding_model, input=user_prompt, timeout=self.timeout
+                )
+        except (TimeoutError, APITimeoutError):
+            return None, None
+        embedding: List[float] = response.data[0].embedding
+
+        # Scoring is pure Python, so keep it off the event loop
+        hit = await asyncio.to_thread(
+            self.semantic_cache.get, self._namespace, embedding, user_prompt
+        )
+        if hit is None:
+            return embedding, None
+
+        value, similarity = hit
+        try:
+            result = self.output_schema.model_validate(value[self.output_key])
+        except (KeyError, ValidationError):
+            # Schema drifted since the entry was written
+            self.semantic_cache.delete(value)
+            return embedding, None
 
-        # Store reasoning in trace
         if self._trace:
             self._trace.reasoning = (
-                f"Extracted decision context using {self.model}. "
-                f"Confidence: {context.confidence_level or 'unknown'}"
+                f"Served cached {self.model} response for a similar decision "
+                f"(similarity {similarity:.3f}) from the semantic cache."
             )
-
-        return {
-            "context": context.model_dump(),
-            "raw_response": raw_response,
+        return embedding, {
+            self.output_key: result.model_dump(),
+            "raw_response": value.get("raw_response", ""),
         }
+
+    def _remember(
+        self, embedding: Optional[List[float]], user_prompt: str, output: Dict[str, Any]
+    ) -> None:
+        """Store a fresh output in the semantic cache."""
+        if self.semantic_cache is None or embedding is None or output.get("degraded"):
+            return
+        self.semantic_cache.set(self._namespace, embedding, user_prompt, output)
@@ -1,13 +1,29 @@
 """LeadershipQuestionsGenerator - generates questions for leadership review."""
 
-import json
-import os
-from typing import Any, Dict, List
+from typing import Any, ClassVar, Dict, Final, List, Type
 
-from openai import AsyncOpenAI
 from pydantic import BaseModel, Field
 
-from ....skills.base import Skill
+from ._base import LLMSkill
+from ._context_fmt import format_context
+from ._llm import Prefix, build_prefix
+from ._taxonomy import QUESTION_EXAMPLES, QUESTION_RUBRIC
+
+_SYSTEM_PROMPT: Final[
+    str
+] = """You are a leadership advisor generating strategic review questions for AI decisions.
+
+Generate thoughtful, probing questions that leadership should consider when reviewing
+this AI decision: 3-5 strategic, 3-5 ethical and 3-5 operational questions, following
+the leadership review question rubric.
+
+Return your questions as a JSON object with these exact keys:
+- strategic_questions: array of strings
+- ethical_questions: array of strings
+- operational_questions: array of strings
+
+Make questions specific to this decision context, not generic.
+The decision to review is provided in the user message."""
 
 
 class LeadershipQuestions(BaseModel):
@@ -27,7 +43,7 @@ class LeadershipQuestions(BaseModel):
     )
 
 
-class LeadershipQuestionsGenerator(Skill):
+class LeadershipQuestionsGenerator(LLMSkill):
     """
     Generate strategic leadership review questions for AI decisions.
 
@@ -59,31 +75,29 @@ class LeadershipQuestionsGenerator(Skill):
 
     name = "leadership_questions_generator"
     version = "1.0.0"
+    prompt_version: ClassVar[str] = "v3"
+    prompt_cache_key: ClassVar[str] = "governance:leadership_questions_generator:v1.0.0"
+    temperature: ClassVar[float] = 0.3
+
+    output_key: ClassVar[str] = "questions"
+    output_schema: ClassVar[Type[BaseModel]] = LeadershipQuestions
+
+    _PREFIX: ClassVar[Prefix] = build_prefix(
+        _SYSTEM_PROMPT, QUESTION_RUBRIC, QUESTION_EXAMPLES
+    )
     description = "Generate strategic leadership review questions for AI decisions"
 
-    def __init__(self) -> None:
-        super().__init__()
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "OPENAI_API_KEY environment variable must be set to use LeadershipQuestionsGenerator"
-            )
-        self.client = AsyncOpenAI(api_key=api_key)
-        self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-
-    async def execute(self, input: Dict[str, Any]) -> Dict[str, Any]:
+    __slots__ = ()
+
+    def build_user_prompt(self, input: Dict[str, Any]) -> str:
         """
-        Generate leadership review questions.
+        Build the per-decision user message.
 
         Args:
-            input: Dictionary with:
-                - decision_context (dict): Decision context from DecisionContextExtractor
-                - risk_analysis (dict, optional): Risk analysis from RiskIdentifier
+            input: Dictionary with decision_context and optional risk_analysis
 
         Returns:
-            Dictionary with:
-                - questions (dict): Leadership review questions by category
-                - raw_response (str): Raw LLM response for auditing
+            User message content
 
         Raises:
             ValueError: If decision_context is missing
@@ -94,55 +108,11 @@ class LeadershipQuestionsGenerator(Skill):
 
         risk_analysis = input.get("risk_analysis")
 
-        # Build prompt for question generation
-        system_prompt = """You are a leadership advisor generating strategic review questions for AI decisions.
-
-Generate thoughtful, probing questions that leadership should consider when reviewing this AI decision.
-Generate 3-5 questions in each of these categories:
-
-**Strategic Questions** - Focus on:
-- Business impact and ROI
-- Alignment with organizational strategy
-- Long-term implications
-- Resource allocation
-- Competitive positioning
-
-**Ethical Questions** - Focus on:
-- Fairness and bias concerns
-- Treatment of different stakeholders
-- Transparency and explainability
-- Human oversight and accountability
-- Compliance with values and policies
-
-**Operational Questions** - Focus on:
-- Implementation requirements
-- Monitoring and ongoing review
-- Escalation procedures
-- Performance metrics
-- Contingency plans
-
-Return your questions as a JSON object with these exact keys:
-- strategic_questions: array of strings
-- ethical_questions: array of strings
-- operational_questions: array of strings
-
-Make questions specific to this decision context, not generic."""
-
-        # Format context for analysis
-        context_summary = f"""Decision Summary: {decision_context.get('decision_summary', 'Not provided')}
-
-Stakeholders: {', '.join(decision_context.get('stakeholders', []))}
-
-Constraints: {', '.join(decision_context.get('constraints', []))}
-
-Data Sources: {', '.join(decision_context.get('data_sources', []))}"""
-
-        if decision_context.get("risk_factors"):
-            context_summary += f"\n\nRisk Factors: {', '.join(decision_context.get('risk_factors', []))}"
+        context_summary = format_context(decision_context)
 
         # Add risk analysis if provided
         if risk_analysis:
-            context_summary += f"\n\nOverall Risk Level: {risk_analysis.get('overall_risk_level', 'unknown')}"
+            context_summary += f"\nOverall Risk Level: {risk_analysis.get('overall_risk_level', 'unknown')}"
 
             risks = risk_analysis.get("risks", [])
             if risks:
@@ -150,51 +120,28 @@ Data Sources: {', '.join(decision_context.get('data_sources', []))}"""
                     r for r in risks if r.get("severity") in ["high", "critical"]
                 ]
                 if high_severity:
-                    context_summary += "\n\nHigh/Critical Risks:"
+                    context_summary += "\nHigh/Critical Risks:"
                     for risk in high_severity:
                         context_summary += (
                             f"\n- [{risk.get('severity')}] {risk.get('description')}"
                         )
 
-        user_prompt = f"""Generate leadership review questions for this decision:
+        return context_summary
 
-{context_summary}"""
+    def placeholder(self) -> LeadershipQuestions:
+        """Build the output returned in place of a timed-out response."""
+        return LeadershipQuestions()
 
-        # Call OpenAI
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=0.3,
-            response_format={"type": "json_object"},
+    def describe(self, result: LeadershipQuestions) -> str:
+        """Summarize a parsed response for the trace reasoning."""
+        total_questions = (
+            len(result.strategic_questions)
+            + len(result.ethical_questions)
+            + len(result.operational_questions)
+        )
+        return (
+            f"Generated {total_questions} leadership review questions using {self.model}. "
+            f"Strategic: {len(result.strategic_questions)}, "
+            f"Ethical: {len(result.ethical_questions)}, "
+            f"Operational: {len(result.operational_questions)}"
         )
-
-        raw_response = response.choices[0].message.content or "{}"
-
-        # Parse and validate response
-        try:
-            questions_data = json.loads(raw_response)
-            questions = LeadershipQuestions(**questions_data)
-        except (json.JSONDecodeError, ValueError) as e:
-            raise ValueError(f"Failed to parse LLM response: {e}") from e
-
-        # Store reasoning in trace
-        if self._trace:
-            total_questions = (
-                len(questions.strategic_questions)
-                + len(questions.ethical_questions)
-                + len(questions.operational_questions)
-            )
-            self._trace.reasoning = (
-                f"Generated {total_questions} leadership review questions using {self.model}. "
-                f"Strategic: {len(questions.strategic_questions)}, "
-                f"Ethical: {len(questions.ethical_questions)}, "
-                f"Operational: {len(questions.operational_questions)}"
-            )
-
-        return {
-            "questions": questions.model_dump(),
-            "raw_response": raw_response,
-        }
@@ -1,13 +1,29 @@
 """RiskIdentifier - analyzes decision context to identify and assess risks."""
 
-import json
-import os
-from typing import Any, Dict, List
+from typing import Any, ClassVar, Dict, Final, List, Type
 
-from openai import AsyncOpenAI
 from pydantic import BaseModel, Field
 
-from ....skills.base import Skill
+from ._base import LLMSkill
+from ._context_fmt import format_context
+from ._llm import Prefix, build_prefix
+from ._taxonomy import RISK_EXAMPLES, RISK_TAXONOMY
+
+_SYSTEM_PROMPT: Final[
+    str
+] = """You are a risk assessment expert analyzing AI decisions for potential risks.
+
+Analyze the provided decision context and identify ALL potential risks, assessing
+each one and the overall risk level according to the governance risk taxonomy.
+Recommend 3-5 specific mitigation actions.
+
+Return your analysis as a JSON object with these exact keys:
+- risks: array of objects with {severity, description, category, likelihood}
+- overall_risk_level: string (low/medium/high/critical)
+- recommended_actions: array of strings
+- confidence_level: string (low/medium/high)
+
+Be thorough - missing a critical risk could have serious consequences."""
 
 
 class Risk(BaseModel):
@@ -40,7 +56,7 @@ class RiskAnalysis(BaseModel):
     )
 
 
-class RiskIdentifier(Skill):
+class RiskIdentifier(LLMSkill):
     """
     Analyze decision context to identify and assess risks.
 
@@ -70,30 +86,30 @@ class RiskIdentifier(Skill):
 
     name = "risk_identifier"
     version = "1.0.0"
+    prompt_version: ClassVar[str] = "v3"
+    prompt_cache_key: ClassVar[str] = "governance:risk_identifier:v1.0.0"
+    # Slightly higher for creative risk identification
+    temperature: ClassVar[float] = 0.2
+
+    output_key: ClassVar[str] = "analysis"
+    output_schema: ClassVar[Type[BaseModel]] = RiskAnalysis
+
+    _PREFIX: ClassVar[Prefix] = build_prefix(
+        _SYSTEM_PROMPT, RISK_TAXONOMY, RISK_EXAMPLES
+    )
     description = "Analyze decision context to identify and assess risks"
 
-    def __init__(self) -> None:
-        super().__init__()
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "OPENAI_API_KEY environment variable must be set to use RiskIdentifier"
-            )
-        self.client = AsyncOpenAI(api_key=api_key)
-        self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-
-    async def execute(self, input: Dict[str, Any]) -> Dict[str, Any]:
+    __slots__ = ()
+
+    def build_user_prompt(self, input: Dict[str, Any]) -> str:
         """
-        Analyze decision context for risks.
+        Build the per-decision user message.
 
         Args:
-            input: Dictionary with:
-                - decision_context (dict): Decision context from DecisionContextExtractor
+            input: Dictionary with decision_context
 
         Returns:
-            Dictionary with:
-                - analysis (dict): Risk analysis results
-                - raw_response (str): Raw LLM response for auditing
+            User message content
 
         Raises:
             ValueError: If decision_context is missing
@@ -102,80 +118,21 @@ class RiskIdentifier(Skill):
         if not decision_context:
             raise ValueError("decision_context is required")
 
-        # Build prompt for risk analysis
-        system_prompt = """You are a risk assessment expert analyzing AI decisions for potential risks.
-
-Analyze the provided decision context and identify ALL potential risks across these categories:
-- Business risks (financial, strategic, operational)
-- Compliance risks (regulatory, legal, policy violations)
-- Operational risks (process failures, dependencies, resource constraints)
-- Reputational risks (brand damage, stakeholder concerns)
-- Technical risks (system failures, data issues)
-- Ethical risks (bias, fairness, transparency concerns)
-
-For each risk:
-1. Assess severity: low, medium, high, or critical
-2. Assess likelihood: low, medium, high
-3. Categorize the risk type
-4. Provide clear description
+        return format_context(decision_context)
 
-Then:
-- Determine overall risk level (highest severity found)
-- Recommend 3-5 specific mitigation actions
+    def placeholder(self) -> RiskAnalysis:
+        """Build the output returned in place of a timed-out response."""
+        return RiskAnalysis(overall_risk_level="unknown", confidence_level="low")
 
-Return your analysis as a JSON object with these exact keys:
-- risks: array of objects with {severity, description, category, likelihood}
-- overall_risk_level: string (low/medium/high/critical)
-- recommended_actions: array of strings
-- confidence_level: string (low/medium/high)
-
-Be thorough - missing a critical risk could have serious consequences."""
-
-        # Format decision context for analysis
-        context_summary = f"""Decision Summary: {decision_context.get('decision_summary', 'Not provided')}
-
-Stakeholders: {', '.join(decision_context.get('stakeholders', []))}
-
-Constraints: {', '.join(decision_context.get('constraints', []))}
-
-Data Sources: {', '.join(decision_context.get('data_sources', []))}
-
-Pre-identified Risk Factors: {', '.join(decision_context.get('risk_factors', []))}"""
-
-        # Call OpenAI
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": context_summary},
-            ],
-            temperature=0.2,  # Slightly higher for creative risk identification
-            response_format={"type": "json_object"},
+    def describe(self, result: RiskAnalysis) -> str:
+        """Summarize a parsed response for the trace reasoning."""
+        risk_count = len(result.risks)
+        high_critical = sum(
+            1 for r in result.risks if r.severity in ["high", "critical"]
+        )
+        return (
+            f"Analyzed decision context using {self.model}. "
+            f"Identified {risk_count} risks ({high_critical} high/critical). "
+            f"Overall risk level: {result.overall_risk_level}. "
+            f"Confidence: {result.confidence_level}"
         )
-
-        raw_response = response.choices[0].message.content or "{}"
-
-        # Parse and validate response
-        try:
-            analysis_data = json.loads(raw_response)
-            analysis = RiskAnalysis(**analysis_data)
-        except (json.JSONDecodeError, ValueError) as e:
-            raise ValueError(f"Failed to parse LLM response: {e}") from e
-
-        # Store reasoning in trace
-        if self._trace:
-            risk_count = len(analysis.risks)
-            high_critical = sum(
-                1 for r in analysis.risks if r.severity in ["high", "critical"]
-            )
-            self._trace.reasoning = (
-                f"Analyzed decision context using {self.model}. "
-                f"Identified {risk_count} risks ({high_critical} high/critical). "
-                f"Overall risk level: {analysis.overall_risk_level}. "
-                f"Confidence: {analysis.confidence_level}"
-            )
-
-        return {
-            "analysis": analysis.model_dump(),
-            "raw_response": raw_response,
-        }
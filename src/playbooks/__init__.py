@@ -1,57 +1,115 @@
-"""Playbook engine - core execution logic."""
-
-from .batch import BatchExecutor, BatchResult, BatchResults
-from .checkpoint import CheckpointManager
-from .engine import ExecutionContext, PlaybookEngine
-from .errors import (
-    CheckpointError,
-    InvalidInputError,
-    PlaybookExecutionError,
-    SkillExecutionError,
-    SkillNotFoundError,
-    TemplateError,
-)
-from .loader import PlaybookLoader, PlaybookLoadError
-from .models import (
-    DecisionBranch,
-    DecisionStep,
-    Playbook,
-    PlaybookMetadata,
-    SkillStep,
-    Step,
-    StepType,
-)
-from .tracer import ExecutionTrace, ExecutionTracer, StepTrace
-from .validator import PlaybookValidator, ValidationLevel, ValidationMessage
-from .visualizer import PlaybookVisualizer
-
-__all__ = [
-    "PlaybookLoader",
-    "PlaybookLoadError",
-    "Playbook",
-    "PlaybookMetadata",
-    "Step",
-    "SkillStep",
-    "DecisionStep",
-    "DecisionBranch",
-    "StepType",
-    "PlaybookEngine",
-    "PlaybookExecutionError",
-    "SkillNotFoundError",
-    "TemplateError",
-    "SkillExecutionError",
-    "InvalidInputError",
-    "CheckpointError",
-    "ExecutionContext",
-    "ExecutionTrace",
-    "ExecutionTracer",
-    "StepTrace",
-    "CheckpointManager",
-    "PlaybookValidator",
-    "ValidationLevel",
-    "ValidationMessage",
-    "PlaybookVisualizer",
-    "BatchExecutor",
-    "BatchResult",
-    "BatchResults",
-]
+"""
+Playbook engine - core execution logic.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+the package, or a single submodule such as the batch CLI, only loads what
+is used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .batch import BatchExecutor, BatchResult, BatchResults
+    from .checkpoint import CheckpointManager
+    from .engine import ExecutionContext, PlaybookEngine
+    from .errors import (
+        CheckpointError,
+        InvalidInputError,
+        PlaybookExecutionError,
+        SkillExecutionError,
+        SkillNotFoundError,
+        TemplateError,
+    )
+    from .loader import PlaybookLoader, PlaybookLoadError
+    from .models import (
+        DecisionBranch,
+        DecisionStep,
+        Playbook,
+        PlaybookMetadata,
+        SkillStep,
+        Step,
+        StepType,
+    )
+    from .tracer import ExecutionTrace, ExecutionTracer, StepTrace
+    from .validator import PlaybookValidator, ValidationLevel, ValidationMessage
+    from .visualizer import PlaybookVisualizer
+
+# Submodule defining each public name
+_EXPORTS = {
+    "BatchExecutor": "batch",
+    "BatchResult": "batch",
+    "BatchResults": "batch",
+    "CheckpointManager": "checkpoint",
+    "ExecutionContext": "engine",
+    "PlaybookEngine": "engine",
+    "CheckpointError": "errors",
+    "InvalidInputError": "errors",
+    "PlaybookExecutionError": "errors",
+    "SkillExecutionError": "errors",
+    "SkillNotFoundError": "errors",
+    "TemplateError": "errors",
+    "PlaybookLoader": "loader",
+    "PlaybookLoadError": "loader",
+    "DecisionBranch": "models",
+    "DecisionStep": "models",
+    "Playbook": "models",
+    "PlaybookMetadata": "models",
+    "SkillStep": "models",
+    "Step": "models",
+    "StepType": "models",
+    "ExecutionTrace": "tracer",
+    "ExecutionTracer": "tracer",
+    "StepTrace": "tracer",
+    "PlaybookValidator": "validator",
+    "ValidationLevel": "validator",
+    "ValidationMessage": "validator",
+    "PlaybookVisualizer": "visualizer",
+}
+
+__all__ = [
+    "PlaybookLoader",
+    "PlaybookLoadError",
+    "Playbook",
+    "PlaybookMetadata",
+    "Step",
+    "SkillStep",
+    "DecisionStep",
+    "DecisionBranch",
+    "StepType",
+    "PlaybookEngine",
+    "PlaybookExecutionError",
+    "SkillNotFoundError",
+    "TemplateError",
+    "SkillExecutionError",
+    "InvalidInputError",
+    "CheckpointError",
+    "ExecutionContext",
+    "ExecutionTrace",
+    "ExecutionTracer",
+    "StepTrace",
+    "CheckpointManager",
+    "PlaybookValidator",
+    "ValidationLevel",
+    "ValidationMessage",
+    "PlaybookVisualizer",
+    "BatchExecutor",
+    "BatchResult",
+    "BatchResults",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names alongside the module attributes."""
+    return sorted({*globals(), *__all__})
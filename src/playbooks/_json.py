@@ -0,0 +1,70 @@
+"""JSON encoding for playbook exports, using orjson when it is installed."""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    # Leave datetimes and dataclasses to `default`, as the stdlib encoder does
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def dumps(
+    obj: Any,
+    indent: Optional[int] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+    sort_keys: bool = False,
+) -> bytes:
+    """
+    Encode an object as UTF-8 JSON.
+
+    Uses orjson (pip install agentic-playbooks[json]) for compact and
+    2-space indented output, and the standard library otherwise.
+
+    Args:
+        obj: Object to encode
+        indent: Indentation level, or None for compact output
+        default: Called for objects JSON cannot encode natively
+        sort_keys: Whether to sort object keys, for canonical output
+
+    Returns:
+        Encoded JSON
+
+    Raises:
+        TypeError: If obj contains a value that cannot be encoded
+    """
+    if orjson is not None and indent in (None, 2):
+        option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the stdlib can encode
+            pass
+    return json.dumps(obj, indent=indent, default=default, sort_keys=sort_keys).encode(
+        "utf-8"
+    )
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Decode JSON.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,18 +2,35 @@
 
 import asyncio
 import csv
+import hashlib
 import json
+import sys
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sized,
+    Tuple,
+)
+
+from . import _json
 from .engine import PlaybookEngine
 from .models import Playbook
 from .tracer import ExecutionTrace
 
+# Seconds between writes of buffered progress lines
+_PROGRESS_FLUSH_INTERVAL_S = 0.1
+
 
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Result of a single playbook execution in a batch."""
 
@@ -22,25 +39,61 @@ class BatchResult:
     trace: Optional[ExecutionTrace] = None
     error: Optional[str] = None
     duration_ms: float = 0.0
+    # Set when the executor ran in lightweight mode and dropped the trace
+    trace_discarded: bool = False
+    # Serialized trace, computed on first to_dict() and tied to that trace
+    _trace_dict: Optional[Tuple[ExecutionTrace, Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def success(self) -> bool:
         """Check if execution was successful."""
-        return self.trace is not None and self.trace.success
+        if self.trace is None:
+            return self.trace_discarded and self.error is None
+        return self.trace.success
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+    def to_dict(self, input_ref: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        The trace is a finished execution record, so its serialized form is
+        computed once and reused when the results are exported repeatedly.
+        A discarded trace is left out entirely.
+
+        Args:
+            input_ref: Position of input_context in a shared inputs table;
+                when given, emitted as input_context_ref instead of the input
+        """
+        result: Dict[str, Any] = {
             "index": self.index,
             "success": self.success,
             "duration_ms": self.duration_ms,
             "error": self.error,
-            "input_context": self.input_context,
-            "trace": self.trace.to_dict() if self.trace else None,
         }
+        if input_ref is None:
+            result["input_context"] = self.input_context
+        else:
+            result["input_context_ref"] = input_ref
+        if self.trace_discarded:
+            return result
+
+        trace_dict = None
+        if self.trace is not None:
+            if self._trace_dict is None or self._trace_dict[0] is not self.trace:
+                self._trace_dict = (self.trace, self.trace.to_dict())
+            trace_dict = self._trace_dict[1]
+        result["trace"] = trace_dict
+        return result
+
+
+class _BatchStats(NamedTuple):
+    success_count: int
+    failure_count: int
+    avg_duration_ms: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchResults:
     """Aggregated results from batch execution."""
 
@@ -55,42 +108,159 @@ class BatchResults:
     @property
     def success_count(self) -> int:
         """Number of successful executions."""
-        return sum(1 for r in self.results if r.success)
+        return self._stats().success_count
 
     @property
     def failure_count(self) -> int:
         """Number of failed executions."""
-        return sum(1 for r in self.results if not r.success)
+        return self._stats().failure_count
 
     @property
     def avg_duration_ms(self) -> float:
         """Average execution duration in milliseconds."""
-        if not self.results:
-            return 0.0
-        return sum(r.duration_ms for r in self.results) / len(self.results)
+        return self._stats().avg_duration_ms
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
+    def _stats(self) -> _BatchStats:
+        """
+        Compute the aggregate statistics in a single pass over the results.
+
+        Not cached: results is a public list that callers may extend.
+        """
+        success_count = 0
+        duration_ms = 0.0
+        for result in self.results:
+            if result.success:
+                success_count += 1
+            duration_ms += result.duration_ms
+
+        total = len(self.results)
+        return _BatchStats(
+            success_count=success_count,
+            failure_count=total - success_count,
+            avg_duration_ms=duration_ms / total if total else 0.0,
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate statistics, without the per-execution results."""
+        stats = self._stats()
         return {
             "total": self.total,
-            "success_count": self.success_count,
-            "failure_count": self.failure_count,
-            "avg_duration_ms": self.avg_duration_ms,
+            "success_count": stats.success_count,
+            "failure_count": stats.failure_count,
+            "avg_duration_ms": stats.avg_duration_ms,
             "total_duration_ms": self.total_duration_ms,
-            "results": [r.to_dict() for r in self.results],
         }
 
-    def to_json(self, output_path: str, indent: int = 2) -> None:
+    def _shared_inputs(self) -> Optional[Tuple[List[Dict[str, Any]], List[int]]]:
+        """
+        Build a table of the input contexts shared by several results.
+
+        Results share an input when they hold the same dict object, as
+        execute_batch() arranges for inputs with equal content.
+
+        Returns:
+            Tuple of (distinct inputs in first-use order, each result's
+            position in that table), or None when no input is shared
+        """
+        positions: Dict[int, int] = {}
+        table: List[Dict[str, Any]] = []
+        refs: List[int] = []
+        for result in self.results:
+            ref = positions.setdefault(id(result.input_context), len(table))
+            if ref == len(table):
+                table.append(result.input_context)
+            refs.append(ref)
+
+        if len(table) == len(refs):
+            return None
+        return table, refs
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        When results share input contexts, each input is emitted once in a
+        top-level "inputs" table and results carry input_context_ref (its
+        position in the table) instead of input_context.
+        """
+        shared = self._shared_inputs()
+        if shared is None:
+            return {
+                **self.summary(),
+                "results": [r.to_dict() for r in self.results],
+            }
+
+        table, refs = shared
+        return {
+            **self.summary(),
+            "inputs": table,
+            "results": [r.to_dict(ref) for r, ref in zip(self.results, refs)],
+        }
+
+    def to_json(self, output_path: str, indent: Optional[int] = 2) -> None:
         """
         Export results to JSON file.
 
+        Results are serialized and written one at a time, so only one
+        execution trace is held in serialized form at once. Encoding uses
+        orjson when it is installed. Shared input contexts are written once,
+        as in to_dict().
+
         Args:
             output_path: Path to output JSON file
-            indent: JSON indentation level (default: 2)
+            indent: JSON indentation level (default: 2); None writes compact
+                single-line JSON, which is faster for large batches
         """
+        shared = self._shared_inputs()
+        refs: List[Optional[int]] = [None] * len(self.results)
+        if shared is not None:
+            refs = list(shared[1])
+
         path = Path(output_path)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=indent)
+        with path.open("wb") as f:
+            # Summary object without its closing brace
+            f.write(_json.dumps(self.summary(), indent=indent)[:-1].rstrip(b"\n"))
+            if indent is None:
+                if shared is not None:
+                    f.write(b', "inputs": ' + _json.dumps(shared[0]))
+                f.write(b', "results": [')
+                separator = b", "
+            else:
+                pad = b" " * indent
+                if shared is not None:
+                    table = _json.dumps(shared[0], indent=indent)
+                    f.write(b",\n" + pad + b'"inputs": ')
+                    f.write(table.replace(b"\n", b"\n" + pad))
+                f.write(b",\n" + pad + b'"results": [')
+                separator = b","
+
+            for i, (result, ref) in enumerate(zip(self.results, refs)):
+                item = _json.dumps(result.to_dict(ref), indent=indent)
+                if indent is not None:
+                    # Nest the item two levels deep, as a single dump would
+                    item = b"\n" + pad * 2 + item.replace(b"\n", b"\n" + pad * 2)
+                f.write(item if i == 0 else separator + item)
+
+            if indent is None:
+                f.write(b"]}")
+            else:
+                f.write(b"\n" + pad + b"]\n}" if self.results else b"]\n}")
+
+    def to_jsonl(self, output_path: str) -> None:
+        """
+        Export results to JSON Lines file, one result per line.
+
+        Unlike to_json(), the file has no enclosing object, so consumers can
+        process results line by line without parsing the whole file.
+
+        Args:
+            output_path: Path to output JSONL file
+        """
+        path = Path(output_path)
+        with path.open("wb") as f:
+            for result in self.results:
+                f.write(_json.dumps(result.to_dict()))
+                f.write(b"\n")
 
     def to_csv(self, output_path: str) -> None:
         """
@@ -101,20 +271,42 @@ class BatchResults:
         """
         path = Path(output_path)
         with path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=["index", "success", "duration_ms", "error"],
+            writer = csv.writer(f)
+            writer.writerow(["index", "success", "duration_ms", "error"])
+            writer.writerows(
+                [result.index, result.success, result.duration_ms, result.error or ""]
+                for result in self.results
             )
-            writer.writeheader()
-            for result in self.results:
-                writer.writerow(
-                    {
-                        "index": result.index,
-                        "success": result.success,
-                        "duration_ms": result.duration_ms,
-                        "error": result.error or "",
-                    }
-                )
+
+
+def _intern_inputs(inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Replace inputs with equal content by the first such input object.
+
+    Parameter sweeps often repeat contexts; sharing one object keeps a
+    single copy in memory and lets exports write it once.
+
+    Args:
+        inputs: Input contexts
+
+    Returns:
+        Input contexts, with duplicates sharing one dict
+    """
+    seen: Dict[bytes, Dict[str, Any]] = {}
+    interned = []
+    for input_context in inputs:
+        try:
+            encoded = _json.dumps(input_context, sort_keys=True)
+        except TypeError:
+            # Not JSON-encodable, so never shared
+            interned.append(input_context)
+            continue
+        key = hashlib.blake2b(encoded, digest_size=16).digest()
+        first = seen.setdefault(key, input_context)
+        # JSON maps some distinct values to one encoding ({1: x} and {"1": x},
+        # tuples and lists), so only share inputs that are actually equal
+        interned.append(first if first == input_context else input_context)
+    return interned
 
 
 class BatchExecutor:
@@ -137,6 +329,7 @@ class BatchExecutor:
         engine: Optional[PlaybookEngine] = None,
         max_concurrency: int = 5,
         show_progress: bool = False,
+        lightweight: bool = False,
     ) -> None:
         """
         Initialize batch executor.
@@ -145,11 +338,14 @@ class BatchExecutor:
             engine: PlaybookEngine to use (creates new one if None)
             max_concurrency: Maximum number of parallel executions
             show_progress: Whether to show progress updates
+            lightweight: Discard each execution trace once its success and
+                error are recorded, keeping batch memory independent of
+                playbook length (for summary-only runs)
         """
         self.engine = engine or PlaybookEngine()
         self.max_concurrency = max_concurrency
         self.show_progress = show_progress
-        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.lightweight = lightweight
 
     async def execute_batch(
         self,
@@ -166,47 +362,27 @@ class BatchExecutor:
             continue_on_error: Continue processing if individual executions fail
 
         Returns:
-            BatchResults with aggregated execution results
+            BatchResults with aggregated execution results, in input order
+
+        Raises:
+            PlaybookExecutionError: The first execution failure, when
+                continue_on_error is False
         """
         if not inputs:
             return BatchResults(results=[], total_duration_ms=0.0)
 
-        # Create semaphore for concurrency control
-        self._semaphore = asyncio.Semaphore(self.max_concurrency)
-
-        # Show initial progress
-        if self.show_progress:
-            print(f"Processing {len(inputs)} inputs...")
-
         # Track total time
-        start_time = time.perf_counter()
+        start_ns = time.monotonic_ns()
 
-        # Create tasks for all inputs
-        tasks = [
-            self._execute_single(playbook, i, input_ctx, continue_on_error)
-            for i, input_ctx in enumerate(inputs)
+        inputs = _intern_inputs(inputs)
+        batch_results: List[BatchResult] = [
+            result
+            async for result in self.stream_batch(playbook, inputs, continue_on_error)
         ]
-
-        # Execute all tasks
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        batch_results.sort(key=lambda r: r.index)
 
         # Calculate total duration
-        total_duration_ms = (time.perf_counter() - start_time) * 1000
-
-        # Handle any exceptions from gather
-        batch_results: List[BatchResult] = []
-        for i, result in enumerate(results):
-            if isinstance(result, BaseException):
-                batch_results.append(
-                    BatchResult(
-                        index=i,
-                        input_context=inputs[i],
-                        error=str(result),
-                        duration_ms=0.0,
-                    )
-                )
-            elif isinstance(result, BatchResult):
-                batch_results.append(result)
+        total_duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
 
         # Show final progress
         if self.show_progress:
@@ -220,6 +396,138 @@ class BatchExecutor:
 
         return BatchResults(results=batch_results, total_duration_ms=total_duration_ms)
 
+    async def stream_batch(
+        self,
+        playbook: Playbook,
+        inputs: Iterable[Dict[str, Any]],
+        continue_on_error: bool = True,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Execute playbook for each input, yielding results as they complete.
+
+        max_concurrency persistent workers pull inputs one at a time, so an
+        input is only consumed once a worker is free and memory stays
+        proportional to max_concurrency rather than to the number of inputs.
+        Results can be written out as they arrive instead of after the whole
+        batch.
+
+        Args:
+            playbook: The playbook to execute
+            inputs: Input contexts (any iterable, consumed lazily)
+            continue_on_error: Continue processing if individual executions fail
+
+        Yields:
+            BatchResult for each input, in completion order
+
+        Raises:
+            PlaybookExecutionError: The first execution failure, when
+                continue_on_error is False
+
+        Example:
+            async for result in executor.stream_batch(playbook, inputs):
+                print(result.index, result.success)
+        """
+        if self.show_progress and isinstance(inputs, Sized):
+            print(f"Processing {len(inputs)} inputs...")
+
+        worker_count = self.max_concurrency
+        if isinstance(inputs, Sized):
+            worker_count = min(worker_count, len(inputs))
+
+        # Compile the playbook's templates once for all executions
+        self.engine.prepare(playbook)
+
+        # Workers pull from one shared iterator, so inputs are only consumed
+        # when a worker is free; each worker reports None when it runs out
+        work = enumerate(inputs)
+        finished: asyncio.Queue[Optional[BatchResult]] = asyncio.Queue()
+        workers = [
+            asyncio.create_task(
+                self._worker(playbook, work, finished, continue_on_error)
+            )
+            for _ in range(worker_count)
+        ]
+
+        # Progress lines are buffered and written together on a timer
+        progress: List[str] = []
+        flusher = (
+            asyncio.create_task(self._flush_progress(progress))
+            if self.show_progress
+            else None
+        )
+
+        try:
+            running = len(workers)
+            while running:
+                result = await finished.get()
+                if result is None:
+                    running -= 1
+                    # A worker that exits early failed (an execution with
+                    # continue_on_error=False, or the inputs iterator);
+                    # awaiting it re-raises that error and stops the batch
+                    for worker in workers:
+                        if worker.done():
+                            await worker
+                    continue
+                if flusher is not None:
+                    progress.append(self._progress_line(result))
+                yield result
+        finally:
+            for worker in workers:
+                worker.cancel()
+            if flusher is not None:
+                flusher.cancel()
+                self._write_progress(progress)
+
+    async def _worker(
+        self,
+        playbook: Playbook,
+        work: Iterator[Tuple[int, Dict[str, Any]]],
+        finished: asyncio.Queue[Optional[BatchResult]],
+        continue_on_error: bool,
+    ) -> None:
+        """
+        Execute inputs from the shared work iterator until it is exhausted.
+
+        Args:
+            playbook: The playbook to execute
+            work: Shared iterator of (index, input context)
+            finished: Queue receiving each BatchResult, then None on exit
+            continue_on_error: Whether to continue on error
+        """
+        try:
+            for index, input_context in work:
+                # Only raises when continue_on_error is False
+                result = await self._execute_single(
+                    playbook, index, input_context, continue_on_error
+                )
+                finished.put_nowait(result)
+        finally:
+            finished.put_nowait(None)
+
+    @staticmethod
+    def _progress_line(result: BatchResult) -> str:
+        """Format the progress line for a finished execution."""
+        if result.success or result.trace is not None:
+            status = "✓" if result.success else "✗"
+            return f"  [{result.index + 1}] {status} ({result.duration_ms:.0f}ms)\n"
+        return f"  [{result.index + 1}] ✗ Error: {result.error}\n"
+
+    @classmethod
+    async def _flush_progress(cls, lines: List[str]) -> None:
+        """Write buffered progress lines every _PROGRESS_FLUSH_INTERVAL_S."""
+        while True:
+            await asyncio.sleep(_PROGRESS_FLUSH_INTERVAL_S)
+            cls._write_progress(lines)
+
+    @staticmethod
+    def _write_progress(lines: List[str]) -> None:
+        """Write and clear buffered progress lines in a single write."""
+        if lines:
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
+            lines.clear()
+
     async def _execute_single(
         self,
         playbook: Playbook,
@@ -239,42 +547,34 @@ class BatchExecutor:
         Returns:
             BatchResult for this execution
         """
-        async with self._semaphore:  # type: ignore
-            start_time = time.perf_counter()
-
-            try:
-                trace = await self.engine.execute(playbook, input_context)
-                duration_ms = (time.perf_counter() - start_time) * 1000
-
-                # Show progress update
-                if self.show_progress:
-                    status = "✓" if trace.success else "✗"
-                    print(f"  [{index + 1}] {status} ({duration_ms:.0f}ms)")
-
-                return BatchResult(
-                    index=index,
-                    input_context=input_context,
-                    trace=trace,
-                    error=trace.error if not trace.success else None,
-                    duration_ms=duration_ms,
-                )
+        start_ns = time.monotonic_ns()
 
-            except Exception as e:
-                duration_ms = (time.perf_counter() - start_time) * 1000
+        try:
+            trace = await self.engine.execute(playbook, input_context)
+            duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+
+            return BatchResult(
+                index=index,
+                input_context=input_context,
+                trace=None if self.lightweight else trace,
+                error=trace.error if not trace.success else None,
+                duration_ms=duration_ms,
+                trace_discarded=self.lightweight,
+            )
 
-                # Show progress update
-                if self.show_progress:
-                    print(f"  [{index + 1}] ✗ Error: {e}")
+        except Exception as e:
+            duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
 
-                if not continue_on_error:
-                    raise
+            if not continue_on_error:
+                raise
 
-                return BatchResult(
-                    index=index,
-                    input_context=input_context,
-                    error=str(e),
-                    duration_ms=duration_ms,
-                )
+            return BatchResult(
+                index=index,
+                input_context=input_context,
+                error=str(e),
+                duration_ms=duration_ms,
+                trace_discarded=self.lightweight,
+            )
 
 
 def main() -> None:
@@ -297,13 +597,18 @@ def main() -> None:
     )
     parser.add_argument(
         "--output",
-        help="Output file path for results (.json or .csv)",
+        help="Output file path for results (.json, .jsonl or .csv)",
     )
     parser.add_argument(
         "--progress",
         action="store_true",
         help="Show progress updates",
     )
+    parser.add_argument(
+        "--no-traces",
+        action="store_true",
+        help="Discard execution traces, keeping only success, error and timing",
+    )
     parser.add_argument(
         "--stop-on-error",
         action="store_true",
@@ -331,6 +636,7 @@ def main() -> None:
             executor = BatchExecutor(
                 max_concurrency=args.max_concurrency,
                 show_progress=args.progress,
+                lightweight=args.no_traces,
             )
             results = await executor.execute_batch(
                 playbook,
@@ -350,9 +656,13 @@ def main() -> None:
             if args.output:
                 output_path = Path(args.output)
                 if output_path.suffix == ".csv":
-                    results.to_csv(str(output_path))
+                    export = results.to_csv
+                elif output_path.suffix == ".jsonl":
+                    export = results.to_jsonl
                 else:
-                    results.to_json(str(output_path))
+                    export = results.to_json
+                # Encoding a large batch is slow; keep it off the event loop
+                await asyncio.to_thread(export, str(output_path))
                 print(f"\nResults saved to: {args.output}")
 
             # Exit with error code if any failures
@@ -1,13 +1,34 @@
 """PlaybookEngine - executes playbooks with skills and decision logic."""
 
+import asyncio
+import copy
+import hashlib
+import logging
+import re
+import time
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
-from jinja2 import Environment, TemplateSyntaxError
+from jinja2 import Environment, Template, TemplateSyntaxError, meta, nodes
+from jinja2.environment import TemplateExpression
+from jinja2.parser import Parser
 
-from ..skills.base import Skill
+from ..skills.base import Skill, SkillTrace
 from ..skills.registry import SkillRegistry
+from . import _json
 from .checkpoint import CheckpointManager
 from .errors import (
     PlaybookExecutionError,
@@ -18,6 +39,134 @@ from .errors import (
 from .models import DecisionStep, Playbook, SkillStep, Step
 from .tracer import ExecutionTrace, StepTrace
 
+logger = logging.getLogger(__name__)
+
+# Shared by every execution context, so compiled templates can be shared too.
+# Templates come from strings, never files, so there is nothing to reload
+_JINJA_ENV = Environment(autoescape=False, auto_reload=False)
+
+# Outputs of pure skills kept per engine, by skill class and input digest
+_RESULT_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(source: str) -> Template:
+    """
+    Compile a template source, reusing earlier compilations of it.
+
+    Skill inputs are rendered again in every step of every execution, so
+    compiling each source once removes Jinja's lex, parse and code
+    generation from the hot path. Template objects are immutable and safe
+    to share.
+
+    Args:
+        source: Jinja2 template source
+
+    Returns:
+        Compiled template
+
+    Raises:
+        TemplateSyntaxError: If the source is not a valid template
+    """
+    return _JINJA_ENV.from_string(source)
+
+
+@lru_cache(maxsize=1024)
+def _compile_condition(condition: str) -> TemplateExpression:
+    """
+    Compile a condition expression, reusing earlier compilations of it.
+
+    Args:
+        condition: Jinja2 expression, without {{ }}
+
+    Returns:
+        Callable evaluating the expression to its Python value, with
+        undefined variables evaluating to None
+
+    Raises:
+        TemplateSyntaxError: If the condition is not a valid expression
+    """
+    return _JINJA_ENV.compile_expression(condition)
+
+
+# Expression nodes whose value can depend on the context or vary per call
+_DYNAMIC_NODES = (nodes.Name, nodes.Call, nodes.Filter, nodes.Test)
+
+
+def _is_constant(condition: str) -> bool:
+    """
+    Check whether a condition always evaluates to the same value.
+
+    Args:
+        condition: Valid Jinja2 expression, without {{ }}
+
+    Returns:
+        True if the expression reads no variables and calls nothing
+    """
+    expression = Parser(_JINJA_ENV, condition, state="variable").parse_expression()
+    if isinstance(expression, _DYNAMIC_NODES):
+        return False
+    return next(expression.find_all(_DYNAMIC_NODES), None) is None
+
+
+# A template that is just a variable path, e.g. "{{ var }}" or "{{ obj.attr }}"
+_VARIABLE_PATH_RE = re.compile(r"\s*\{\{\s*([A-Za-z_][\w.]*)\s*\}\}\s*")
+
+
+@lru_cache(maxsize=1024)
+def _variable_path(template_str: str) -> Optional[Tuple[str, ...]]:
+    """
+    Get the variable path a template consists of, if that is all it is.
+
+    Args:
+        template_str: Template string
+
+    Returns:
+        Path components (e.g. ("obj", "attr")), or None if the template is
+        anything other than a single variable reference
+    """
+    match = _VARIABLE_PATH_RE.fullmatch(template_str)
+    if match is None:
+        return None
+    return tuple(match.group(1).split("."))
+
+
+# Strings that could be numbers; only these are tried with int() and float()
+_NUMERIC_RE = re.compile(
+    r"\s*[-+]?(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][-+]?\d[\d_]*)?\s*"
+)
+
+
+def _has_template_syntax(text: str) -> bool:
+    """Check whether a string contains any Jinja2 delimiters."""
+    return "{{" in text or "{%" in text or "{#" in text
+
+
+# A playbook's parallel flag and each of its step lists with the steps in it
+_Shape = Tuple[bool, Tuple[Tuple[List[Step], Tuple[Step, ...]], ...]]
+
+
+class PreparedPlaybook(NamedTuple):
+    """Compiled templates of a playbook, from PlaybookEngine.prepare()."""
+
+    # Skill input templates by source
+    templates: Dict[str, Template]
+    # Decision conditions by expression
+    conditions: Dict[str, TemplateExpression]
+    # Results of conditions that read no variables, by expression
+    constant_conditions: Dict[str, bool]
+    # Each skill input dict or list with nothing to render, by id(); holding
+    # the objects keeps their ids from being reused
+    static_inputs: Dict[int, Any]
+    # [start, end) ranges of top-level steps that may run concurrently
+    step_groups: List[Tuple[int, int]]
+    # Groups of each branch and default step list of a parallel playbook,
+    # by id() of the list
+    branch_groups: Dict[int, List[Tuple[int, int]]]
+    # The playbook's shape when prepared; holding the step lists keeps
+    # their ids from being reused
+    shape: _Shape
+
 
 class ExecutionContext:
     """
@@ -26,10 +175,57 @@ class ExecutionContext:
     Tracks variables and state throughout execution.
     """
 
-    def __init__(self, initial_variables: Optional[Dict[str, Any]] = None) -> None:
-        """Initialize execution context with optional initial variables."""
+    def __init__(
+        self,
+        initial_variables: Optional[Dict[str, Any]] = None,
+        prepared: Optional[PreparedPlaybook] = None,
+        started_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Initialize execution context with optional initial variables.
+
+        Args:
+            initial_variables: Initial context variables
+            prepared: Precompiled templates and conditions, from
+                PlaybookEngine.prepare(); others are compiled on first use
+                and cached process-wide
+            started_at: Wall-clock time (naive UTC) that timestamp() counts
+                from; defaults to now
+        """
         self.variables: Dict[str, Any] = initial_variables or {}
-        self._jinja_env = Environment(autoescape=False)
+        self._started_ns = time.perf_counter_ns()
+        self._started_at = started_at or datetime.now(timezone.utc).replace(tzinfo=None)
+        self._templates = prepared.templates if prepared else {}
+        self._conditions = prepared.conditions if prepared else {}
+        self._constant_conditions = prepared.constant_conditions if prepared else {}
+        self._static_inputs = prepared.static_inputs if prepared else {}
+        # Read by the engine to run independent branch steps concurrently
+        self.branch_groups = prepared.branch_groups if prepared else {}
+
+    def _template(self, source: str) -> Template:
+        """Get the compiled template for a source string."""
+        template = self._templates.get(source)
+        if template is None:
+            template = _compile_template(source)
+        return template
+
+    def timestamp(self, perf_ns: Optional[int] = None) -> datetime:
+        """
+        Convert a performance counter reading to a wall-clock time.
+
+        Avoids building a datetime from the system clock on every step.
+
+        Args:
+            perf_ns: time.perf_counter_ns() reading (defaults to now)
+
+        Returns:
+            Naive UTC datetime, as used throughout traces
+        """
+        if perf_ns is None:
+            perf_ns = time.perf_counter_ns()
+        return self._started_at + timedelta(
+            microseconds=(perf_ns - self._started_ns) // 1000
+        )
 
     def set_variable(self, name: str, value: Any) -> None:
         """Set a variable in the context."""
@@ -41,10 +237,13 @@ class ExecutionContext:
 
     def evaluate_condition(self, condition: str, step_name: str = "unknown") -> bool:
         """
-        Evaluate a Jinja2 condition template.
+        Evaluate a Jinja2 condition expression.
+
+        The expression is evaluated to its Python value, whose truthiness
+        is the result; undefined variables count as false.
 
         Args:
-            condition: Jinja2 template condition string
+            condition: Jinja2 expression, without {{ }}
             step_name: Name of the step for error context
 
         Returns:
@@ -53,14 +252,17 @@ class ExecutionContext:
         Raises:
             TemplateError: If condition cannot be evaluated
         """
+        constant = self._constant_conditions.get(condition)
+        if constant is not None:
+            return constant
+
         try:
-            template = self._jinja_env.from_string("{{ " + condition + " }}")
-            result = template.render(**self.variables)
-            # Convert string result to boolean
-            if isinstance(result, str):
-                result = result.strip().lower()
-                return result not in ("false", "0", "", "none")
-            return bool(result)
+            expression = self._conditions.get(condition)
+            if expression is None:
+                expression = _compile_condition(condition)
+            # Passed positionally: Jinja copies the mapping into its context
+            # once, where **-unpacking would build a kwargs dict first
+            return bool(expression(self.variables))
         except TemplateSyntaxError as e:
             raise TemplateError(
                 template_str=condition,
@@ -89,17 +291,16 @@ class ExecutionContext:
             Rendered result, preserving original types when possible
         """
         try:
+            # Literal strings (most skill inputs) have nothing for Jinja to do
+            if not _has_template_syntax(template_str):
+                return self._coerce_number(template_str)
+
             # Check if this is a simple variable reference (e.g., "{{ var }}" or "{{ obj.attr }}")
             # If so, return the actual object instead of converting to string
-            stripped = template_str.strip()
-            if stripped.startswith("{{") and stripped.endswith("}}"):
-                # Extract the variable path
-                var_path = stripped[2:-2].strip()
-
+            parts = _variable_path(template_str)
+            if parts is not None:
                 # Try to evaluate the variable path directly to preserve type
                 try:
-                    # Split on dots for nested access
-                    parts = var_path.split(".")
                     value = self.variables.get(parts[0])
 
                     # Navigate nested attributes/keys
@@ -118,32 +319,44 @@ class ExecutionContext:
                     pass  # Fall through to normal rendering
 
             # Normal template rendering
-            template = self._jinja_env.from_string(str(template_str))
-            result = template.render(**self.variables)
-
-            # Try to preserve numeric types if the result looks numeric
-            if isinstance(result, str):
-                # Try to convert to int
-                try:
-                    if "." not in result:
-                        return int(result)
-                except (ValueError, TypeError):
-                    pass
-
-                # Try to convert to float
-                try:
-                    return float(result)
-                except (ValueError, TypeError):
-                    pass
-
-            return result
+            template = self._template(str(template_str))
+            # Passed positionally, as in evaluate_condition()
+            return self._coerce_number(template.render(self.variables))
         except Exception:
             # If rendering fails, return original value
             return template_str
 
+    @staticmethod
+    def _coerce_number(result: str) -> Any:
+        """Convert a rendered string to int or float if it looks numeric."""
+        # Most strings are words or dates, which a regex rejects without
+        # raising
+        if not _NUMERIC_RE.fullmatch(result):
+            return result
+
+        # Try to convert to int
+        try:
+            if "." not in result:
+                return int(result)
+        except (ValueError, TypeError):
+            pass
+
+        # Try to convert to float
+        try:
+            return float(result)
+        except (ValueError, TypeError):
+            pass
+
+        return result
+
     def render_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Recursively render all template strings in a dictionary.
+        Render all template strings in a dictionary, including nested ones.
+
+        Nested dicts and lists of a prepared playbook's skill inputs that
+        have nothing to render are shared with data rather than copied, so
+        skills must not mutate their nested inputs. The returned dictionary
+        itself is always new.
 
         Args:
             data: Dictionary potentially containing template strings
@@ -151,22 +364,91 @@ class ExecutionContext:
         Returns:
             Dictionary with all templates rendered
         """
-        result = {}
-        for key, value in data.items():
-            if isinstance(value, str):
-                result[key] = self.render_template(value)
-            elif isinstance(value, dict):
-                result[key] = self.render_dict(value)
-            elif isinstance(value, list):
-                result[key] = [
-                    self.render_dict(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
-            else:
-                result[key] = value
+        static = self._static_inputs
+        result: Dict[str, Any] = {}
+        # Dicts still to render, each paired with the dict receiving its output
+        pending = [(data, result)]
+        while pending:
+            source, target = pending.pop()
+            for key, value in source.items():
+                if isinstance(value, str):
+                    target[key] = self.render_template(value)
+                elif not isinstance(value, (dict, list)) or id(value) in static:
+                    target[key] = value
+                elif isinstance(value, dict):
+                    target[key] = {}
+                    pending.append((value, target[key]))
+                else:
+                    items: List[Any] = []
+                    for item in value:
+                        if isinstance(item, dict) and id(item) not in static:
+                            items.append({})
+                            pending.append((item, items[-1]))
+                        else:
+                            items.append(item)
+                    target[key] = items
         return result
 
 
+class _CheckpointWriter:
+    """
+    Writes an execution's checkpoints on a worker thread.
+
+    One write runs at a time, so checkpoints land in order. Checkpoints
+    submitted while a write is running are coalesced: only the newest is
+    written next, so fast steps never wait on the disk.
+    """
+
+    def __init__(self, manager: CheckpointManager) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            manager: Checkpoint manager to save with
+        """
+        self._manager = manager
+        # Newest checkpoint not yet being written, as save_checkpoint() kwargs
+        self._latest: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Future[None]] = None
+
+    def submit(self, **checkpoint: Any) -> None:
+        """
+        Queue a checkpoint, replacing any queued one not yet being written.
+
+        The checkpoint is encoded later, on a worker thread, so its
+        arguments and the values in them must not be changed afterwards.
+        Passing shallow copies of the context's variables and steps only
+        guards against variables being added or replaced.
+
+        Args:
+            **checkpoint: Arguments for CheckpointManager.save_checkpoint()
+
+        Raises:
+            CheckpointError: If an earlier write failed
+        """
+        self._latest = checkpoint
+        if self._task is None or self._task.done():
+            if self._task is not None:
+                self._task.result()
+            self._task = asyncio.ensure_future(self._drain())
+
+    async def flush(self) -> None:
+        """
+        Wait until every submitted checkpoint is written.
+
+        Raises:
+            CheckpointError: If a write failed
+        """
+        if self._task is not None:
+            await self._task
+
+    async def _drain(self) -> None:
+        """Write queued checkpoints until none is left."""
+        while self._latest is not None:
+            checkpoint, self._latest = self._latest, None
+            await asyncio.to_thread(self._manager.save_checkpoint, **checkpoint)
+
+
 class PlaybookEngine:
     """
     Executes playbooks with skills and decision logic.
@@ -187,6 +469,241 @@ class PlaybookEngine:
                           uses the global singleton instance.
         """
         self.skill_registry = skill_registry or SkillRegistry.get_instance()
+        # Step handlers by exact step type, so dispatch is one dict lookup
+        self._step_handlers: Dict[
+            type, Callable[[Any, ExecutionContext, List[StepTrace]], Awaitable[None]]
+        ] = {
+            SkillStep: self._execute_skill_step,
+            DecisionStep: self._execute_decision_step,
+        }
+        # Most recently used last: (input, output, reasoning) of pure skill runs
+        self._result_cache: OrderedDict[
+            Tuple[type, bytes],
+            Tuple[Dict[str, Any], Dict[str, Any], Optional[str]],
+        ] = OrderedDict()
+
+    def prepare(self, playbook: Playbook) -> PreparedPlaybook:
+        """
+        Compile a playbook's templates once, ahead of executing it.
+
+        Every condition and templated skill input is compiled when the
+        playbook is first prepared and the result is kept on the playbook,
+        so its executions only look templates up instead of compiling them
+        in each step. Compiled templates are immutable and shared by
+        concurrent executions. execute() prepares playbooks itself; calling
+        this earlier moves the compile cost out of the first execution.
+        Templates that fail to compile are left to report their error when
+        executed. Conditions that read no variables, such as "true", are
+        evaluated here once. Adding, removing or replacing steps, or
+        changing parallel, makes the next call prepare the playbook again;
+        skill inputs are assumed not to change once prepared.
+
+        Args:
+            playbook: The playbook to prepare
+
+        Returns:
+            The playbook's compiled templates and conditions
+        """
+        shape = self._shape(playbook)
+        cached: Optional[PreparedPlaybook] = playbook._prepared
+        if cached is not None and self._same_shape(cached.shape, shape):
+            return cached
+
+        prepared = PreparedPlaybook(
+            templates={},
+            conditions={},
+            constant_conditions={},
+            static_inputs={},
+            step_groups=self._step_groups(playbook.steps, playbook.parallel),
+            branch_groups={},
+            shape=shape,
+        )
+        if playbook.parallel:
+            for steps in self._branch_step_lists(playbook.steps):
+                prepared.branch_groups[id(steps)] = self._step_groups(steps, True)
+        for step in self._skill_steps(playbook.steps):
+            for source in self._input_sources(step.input):
+                if source not in prepared.templates:
+                    try:
+                        prepared.templates[source] = _compile_template(source)
+                    except TemplateSyntaxError:
+                        continue
+            self._collect_static(step.input, prepared.static_inputs)
+        for condition in self._conditions_of(playbook.steps):
+            if condition not in prepared.conditions:
+                try:
+                    expression = _compile_condition(condition)
+                except TemplateSyntaxError:
+                    continue
+                prepared.conditions[condition] = expression
+                if not _is_constant(condition):
+                    continue
+                try:
+                    prepared.constant_conditions[condition] = bool(expression())
+                except Exception:
+                    # e.g. "1 / 0"; left to raise TemplateError when evaluated
+                    continue
+
+        playbook._prepared = prepared
+        return prepared
+
+    def _shape(self, playbook: Playbook) -> _Shape:
+        """Snapshot the step lists a prepared playbook depends on."""
+        step_lists = [playbook.steps, *self._branch_step_lists(playbook.steps)]
+        return playbook.parallel, tuple((steps, tuple(steps)) for steps in step_lists)
+
+    def _same_shape(self, prepared: _Shape, current: _Shape) -> bool:
+        """Check that no step list changed since a playbook was prepared."""
+        if prepared[0] != current[0] or len(prepared[1]) != len(current[1]):
+            return False
+        for (old_list, old_steps), (new_list, new_steps) in zip(
+            prepared[1], current[1]
+        ):
+            if old_list is not new_list or len(old_steps) != len(new_steps):
+                return False
+            if any(old is not new for old, new in zip(old_steps, new_steps)):
+                return False
+        return True
+
+    def _step_groups(self, steps: List[Step], parallel: bool) -> List[Tuple[int, int]]:
+        """
+        Split a list of steps into runs that may execute concurrently.
+
+        Without parallel every step is its own group. Otherwise
+        consecutive skill steps share a group until one reads or writes a
+        variable that another step of the group writes, or writes one that
+        it reads. Decision steps always run alone, as barriers.
+
+        Args:
+            steps: Top-level steps, or the steps of a branch
+            parallel: Whether the playbook allows concurrent steps
+
+        Returns:
+            [start, end) index ranges covering the steps in order
+        """
+        if not parallel:
+            return [(i, i + 1) for i in range(len(steps))]
+
+        groups: List[Tuple[int, int]] = []
+        start = 0
+        reads: set[str] = set()
+        writes: set[str] = set()
+        for i, step in enumerate(steps):
+            access = self._variable_access(step)
+            if access is None:
+                # Barrier: close the open group and run this step alone
+                if start < i:
+                    groups.append((start, i))
+                groups.append((i, i + 1))
+                start = i + 1
+                reads, writes = set(), set()
+                continue
+
+            step_reads, step_writes = access
+            if step_reads & writes or step_writes & (reads | writes):
+                groups.append((start, i))
+                start = i
+                reads, writes = set(), set()
+            reads |= step_reads
+            writes |= step_writes
+
+        if start < len(steps):
+            groups.append((start, len(steps)))
+        return groups
+
+    def _variable_access(self, step: Step) -> Optional[Tuple[set[str], set[str]]]:
+        """
+        Get the context variables a step reads and writes.
+
+        Args:
+            step: Top-level step
+
+        Returns:
+            Tuple of (variables read, variables written), or None when they
+            cannot be determined statically (decision steps, invalid templates)
+        """
+        if not isinstance(step, SkillStep):
+            return None
+
+        reads: set[str] = set()
+        for source in self._input_sources(step.input):
+            try:
+                reads |= meta.find_undeclared_variables(_JINJA_ENV.parse(source))
+            except TemplateSyntaxError:
+                return None
+        writes = {step.output_var} if step.output_var else set()
+        return reads, writes
+
+    def _skill_steps(self, steps: Iterable[Step]) -> Iterable[SkillStep]:
+        """Yield every skill step of the steps, including nested ones."""
+        for step in steps:
+            if isinstance(step, SkillStep):
+                yield step
+            elif isinstance(step, DecisionStep):
+                for branch in step.branches:
+                    yield from self._skill_steps(branch.steps)
+                yield from self._skill_steps(step.default or [])
+
+    def _branch_step_lists(self, steps: Iterable[Step]) -> Iterable[List[Step]]:
+        """Yield the step list of every branch and default, including nested ones."""
+        for step in steps:
+            if isinstance(step, DecisionStep):
+                for branch in step.branches:
+                    yield branch.steps
+                    yield from self._branch_step_lists(branch.steps)
+                if step.default:
+                    yield step.default
+                    yield from self._branch_step_lists(step.default)
+
+    def _conditions_of(self, steps: Iterable[Step]) -> Iterable[str]:
+        """Yield every decision condition of the steps, including nested ones."""
+        for step in steps:
+            if isinstance(step, DecisionStep):
+                for branch in step.branches:
+                    yield branch.condition
+                    yield from self._conditions_of(branch.steps)
+                yield from self._conditions_of(step.default or [])
+
+    def _collect_static(self, value: Any, static: Dict[int, Any]) -> bool:
+        """
+        Find the parts of a skill input that render_dict() would not change.
+
+        Args:
+            value: Skill input, or a value nested in one
+            static: Receives every unchanged dict and list, by id()
+
+        Returns:
+            Whether rendering leaves value unchanged
+        """
+        if isinstance(value, dict):
+            children = value.values()
+        elif isinstance(value, list):
+            # render_dict() only renders the dicts in lists
+            children = (item for item in value if isinstance(item, dict))
+        elif isinstance(value, str):
+            return not _has_template_syntax(value) and (
+                ExecutionContext._coerce_number(value) is value
+            )
+        else:
+            return True
+
+        # Visit every child, so static subtrees of changed values are found
+        unchanged = all([self._collect_static(child, static) for child in children])
+        if unchanged:
+            static[id(value)] = value
+        return unchanged
+
+    def _input_sources(self, data: Dict[str, Any]) -> Iterable[str]:
+        """Yield the templated strings of a skill input, as render_dict() visits them."""
+        for value in data.values():
+            if isinstance(value, str) and _has_template_syntax(value):
+                yield value
+            elif isinstance(value, dict):
+                yield from self._input_sources(value)
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict):
+                        yield from self._input_sources(item)
 
     async def execute(
         self,
@@ -194,6 +711,7 @@ class PlaybookEngine:
         initial_context: Optional[Dict[str, Any]] = None,
         resume_from: Optional[str] = None,
         checkpoint_dir: Optional[str] = None,
+        checkpoint_format: str = "json",
     ) -> ExecutionTrace:
         """
         Execute a playbook with optional checkpoint/resume support.
@@ -203,6 +721,7 @@ class PlaybookEngine:
             initial_context: Optional initial context variables
             resume_from: Optional execution ID to resume from checkpoint
             checkpoint_dir: Optional directory for checkpoint files
+            checkpoint_format: Format of saved checkpoints, "json" or "msgpack"
 
         Returns:
             ExecutionTrace with complete execution details
@@ -213,9 +732,13 @@ class PlaybookEngine:
         """
         # Initialize checkpoint manager if checkpoint_dir provided
         checkpoint_manager = (
-            CheckpointManager(checkpoint_dir) if checkpoint_dir else None
+            CheckpointManager(checkpoint_dir, format=checkpoint_format)
+            if checkpoint_dir
+            else None
         )
 
+        prepared = self.prepare(playbook)
+
         # Resume from checkpoint if requested
         if resume_from and checkpoint_manager:
             checkpoint = checkpoint_manager.load_checkpoint(resume_from)
@@ -226,30 +749,61 @@ class PlaybookEngine:
 
             execution_id = checkpoint["execution_id"]
             trace = self._restore_trace(checkpoint)
-            context = ExecutionContext(checkpoint["context"])
+            context = ExecutionContext(checkpoint["context"], prepared)
             start_step = checkpoint["current_step"]
         else:
             execution_id = str(uuid.uuid4())
             trace = ExecutionTrace(playbook.metadata.name, execution_id)
             context_vars = {**playbook.variables, **(initial_context or {})}
-            context = ExecutionContext(context_vars)
+            context = ExecutionContext(context_vars, prepared, trace.started_at)
             start_step = 0
 
+        # Completed steps never change, so each is serialized for checkpoints
+        # once instead of on every save
+        serialized_steps: List[Dict[str, Any]] = []
+        writer = _CheckpointWriter(checkpoint_manager) if checkpoint_manager else None
+
         try:
-            # Execute steps (starting from checkpoint if resuming)
-            for i, step in enumerate(playbook.steps[start_step:], start=start_step):
-                await self._execute_step(step, context, trace.steps)
+            # Execute steps (starting from checkpoint if resuming), one group
+            # of independent steps at a time
+            for group_start, group_end in prepared.step_groups:
+                if group_end <= start_step:
+                    continue
+                group = playbook.steps[max(group_start, start_step) : group_end]
+                if len(group) == 1:
+                    await self._execute_step(group[0], context, trace.steps)
+                else:
+                    await self._execute_concurrently(group, context, trace.steps)
 
                 # Save checkpoint after each step if enabled
-                if checkpoint_manager:
-                    checkpoint_manager.save_checkpoint(
+                if checkpoint_manager and writer:
+                    new_traces = trace.steps[len(serialized_steps) :]
+                    if all(
+                        t.step_type == "decision" and not t.nested_steps
+                        for t in new_traces
+                    ):
+                        # Routing only, with no variables changed: resuming
+                        # from the previous checkpoint re-takes the decision
+                        continue
+                    serialized_steps.extend(
+                        checkpoint_manager.serialize_step(step_trace)
+                        for step_trace in new_traces
+                    )
+                    # Written off the event loop while the next steps run.
+                    # The copies are shallow: steps may add or replace
+                    # variables meanwhile, but values are shared, so a step
+                    # mutating an earlier step's output can race the write
+                    writer.submit(
                         execution_id=execution_id,
                         playbook_name=playbook.metadata.name,
-                        current_step=i + 1,
-                        context_vars=context.variables,
-                        completed_steps=trace.steps,
+                        current_step=group_end,
+                        context_vars=dict(context.variables),
+                        completed_steps=list(serialized_steps),
                     )
 
+            if writer:
+                await writer.flush()
+
             trace.success = True
 
             # Clean up checkpoint on successful completion
@@ -260,23 +814,31 @@ class PlaybookEngine:
             trace.error = str(e)
             trace.success = False
 
+            # Let the last checkpoint land so the execution can be resumed;
+            # its own failure must not mask this one
+            if writer:
+                await asyncio.gather(writer.flush(), return_exceptions=True)
+
             # Provide helpful message about resuming from checkpoint
             if checkpoint_manager:
-                print(f"\nExecution failed at step {len(trace.steps)}.")
-                print("Resume with:")
-                print(
-                    f"  engine.execute(playbook, resume_from='{execution_id}', "
-                    f"checkpoint_dir='{checkpoint_dir}')"
+                logger.warning(
+                    "Execution failed at step %d. Resume with: "
+                    "engine.execute(playbook, resume_from=%r, checkpoint_dir=%r)",
+                    len(trace.steps),
+                    execution_id,
+                    checkpoint_dir,
                 )
 
             raise
 
         finally:
-            trace.completed_at = datetime.utcnow()
+            trace.completed_at = context.timestamp()
             trace.duration_ms = int(
                 (trace.completed_at - trace.started_at).total_seconds() * 1000
             )
-            trace.final_context = context.variables.copy()
+            # The context is private to this execution and discarded here, so
+            # its variables are handed to the trace rather than copied
+            trace.final_context = context.variables
 
         return trace
 
@@ -297,10 +859,11 @@ class PlaybookEngine:
 
         # Restore completed steps
         for step_data in checkpoint.get("completed_steps", []):
+            started_at = step_data.get("started_at")
             step_trace = StepTrace(
                 step_name=step_data.get("step_name", "unknown"),
                 step_type=step_data.get("step_type", "unknown"),
-                started_at=datetime.fromisoformat(step_data["started_at"]),
+                started_at=datetime.fromisoformat(started_at) if started_at else None,
             )
 
             if step_data.get("completed_at"):
@@ -318,6 +881,83 @@ class PlaybookEngine:
 
         return trace
 
+    async def _execute_branch(
+        self,
+        steps: List[Step],
+        context: ExecutionContext,
+        traces: List[StepTrace],
+    ) -> None:
+        """
+        Execute the steps of a decision branch or default.
+
+        In parallel playbooks, each group of independent steps runs
+        concurrently; otherwise the steps run in order.
+
+        Args:
+            steps: The branch's steps
+            context: Current execution context
+            traces: List to append step traces to
+        """
+        groups = context.branch_groups.get(id(steps))
+        if groups is None:
+            for step in steps:
+                await self._execute_step(step, context, traces)
+            return
+
+        for start, end in groups:
+            if end - start == 1:
+                await self._execute_step(steps[start], context, traces)
+            else:
+                await self._execute_concurrently(steps[start:end], context, traces)
+
+    async def _execute_concurrently(
+        self,
+        steps: List[Step],
+        context: ExecutionContext,
+        traces: List[StepTrace],
+    ) -> None:
+        """
+        Execute independent steps concurrently.
+
+        Step traces are appended in step order, as each step starts. If a
+        step fails, the others are cancelled, their traces recording the
+        error "Cancelled", and its error is raised.
+
+        Args:
+            steps: Steps with no data dependencies on each other
+            context: Current execution context
+            traces: List to append step traces to
+        """
+        tasks = [
+            asyncio.ensure_future(self._execute_step(step, context, traces))
+            for step in steps
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    @staticmethod
+    def _finish_step(step_trace: StepTrace, start_ns: int) -> int:
+        """
+        Record a step's completion time without reading the wall clock again.
+
+        Args:
+            step_trace: Trace of the step, with started_at set
+            start_ns: time.perf_counter_ns() when the step started
+
+        Returns:
+            Step duration in whole milliseconds
+        """
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        step_trace.completed_at = step_trace.started_at + timedelta(
+            microseconds=elapsed_ns // 1000
+        )
+        return elapsed_ns // 1_000_000
+
     async def _execute_step(
         self,
         step: Step,
@@ -332,12 +972,10 @@ class PlaybookEngine:
             context: Current execution context
             traces: List to append step trace to
         """
-        if isinstance(step, SkillStep):
-            await self._execute_skill_step(step, context, traces)
-        elif isinstance(step, DecisionStep):
-            await self._execute_decision_step(step, context, traces)
-        else:
+        handler = self._step_handlers.get(type(step))
+        if handler is None:
             raise PlaybookExecutionError(f"Unknown step type: {type(step)}")
+        await handler(step, context, traces)
 
     async def _execute_skill_step(
         self,
@@ -356,10 +994,11 @@ class PlaybookEngine:
         Raises:
             PlaybookExecutionError: If skill not found or execution fails
         """
+        start_ns = time.perf_counter_ns()
         step_trace = StepTrace(
             step_name=step.name,
             step_type="skill",
-            started_at=datetime.utcnow(),
+            started_at=context.timestamp(start_ns),
         )
         traces.append(step_trace)
 
@@ -374,14 +1013,11 @@ class PlaybookEngine:
                     playbook_name="unknown",  # Will be set by execute() context
                 )
 
-            # Instantiate skill
-            skill: Skill = skill_class()
-
             # Render input templates with current context
             rendered_input = context.render_dict(step.input)
 
             # Execute skill
-            output, skill_trace = await skill.run(rendered_input)
+            output, skill_trace = await self._run_skill(skill_class, rendered_input)
 
             # Store output in context if output_var specified
             if step.output_var:
@@ -389,20 +1025,22 @@ class PlaybookEngine:
 
             # Record trace
             step_trace.skill_trace = skill_trace
-            step_trace.completed_at = datetime.utcnow()
-            step_trace.duration_ms = int(
-                (step_trace.completed_at - step_trace.started_at).total_seconds() * 1000
-            )
+            step_trace.duration_ms = self._finish_step(step_trace, start_ns)
 
+        except asyncio.CancelledError:
+            # A concurrent sibling failed; record how far this step got
+            step_trace.error = "Cancelled"
+            step_trace.duration_ms = self._finish_step(step_trace, start_ns)
+            raise
         except SkillNotFoundError:
             # Re-raise SkillNotFoundError as-is
             step_trace.error = "Skill not found"
-            step_trace.completed_at = datetime.utcnow()
+            self._finish_step(step_trace, start_ns)
             raise
         except Exception as e:
             # Wrap other exceptions in SkillExecutionError
             step_trace.error = str(e)
-            step_trace.completed_at = datetime.utcnow()
+            self._finish_step(step_trace, start_ns)
 
             # Extract reasoning from skill trace if available
             reasoning = None
@@ -417,6 +1055,63 @@ class PlaybookEngine:
                 reasoning=reasoning,
             ) from e
 
+    async def _run_skill(
+        self, skill_class: type[Skill], input: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], SkillTrace]:
+        """
+        Run a skill, reusing the outputs of pure skills for repeated inputs.
+
+        Outputs of skills declaring pure = True are cached by a digest of
+        their canonical JSON input, and served only to inputs equal to the
+        one they were computed from, so they are shared between the runs
+        they serve and must not be mutated. Inputs that are not JSON
+        serializable and runs that fail are never cached.
+
+        Args:
+            skill_class: Skill to run
+            input: Rendered skill input
+
+        Returns:
+            Tuple of (output, trace)
+        """
+        if not skill_class.pure:
+            return await skill_class().run(input)
+
+        try:
+            digest = hashlib.blake2b(
+                _json.dumps(input, sort_keys=True), digest_size=16
+            ).digest()
+        except TypeError:
+            return await skill_class().run(input)
+
+        key = (skill_class, digest)
+        cached = self._result_cache.get(key)
+        # JSON maps some distinct inputs to one encoding ({1: x} and {"1": x},
+        # tuples and lists), so a digest match alone is not a hit
+        if cached is None or cached[0] != input:
+            # Copied before the run, which may mutate its input
+            cached_input = copy.deepcopy(input)
+            output, skill_trace = await skill_class().run(input)
+            self._result_cache[key] = (cached_input, output, skill_trace.reasoning)
+            self._result_cache.move_to_end(key)
+            if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+            return output, skill_trace
+
+        self._result_cache.move_to_end(key)
+        _, output, reasoning = cached
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return output, SkillTrace(
+            skill_name=skill_class.name,
+            execution_id=str(uuid.uuid4()),
+            input=input,
+            output=output,
+            reasoning=reasoning,
+            started_at=now,
+            completed_at=now,
+            duration_ms=0,
+        )
+
     async def _execute_decision_step(
         self,
         step: DecisionStep,
@@ -431,10 +1126,11 @@ class PlaybookEngine:
             context: Current execution context
             traces: List to append step trace to
         """
+        start_ns = time.perf_counter_ns()
         step_trace = StepTrace(
             step_name=step.name,
             step_type="decision",
-            started_at=datetime.utcnow(),
+            started_at=context.timestamp(start_ns),
         )
         traces.append(step_trace)
 
@@ -445,27 +1141,26 @@ class PlaybookEngine:
                 if context.evaluate_condition(branch.condition, step_name=step.name):
                     step_trace.decision_taken = f"branch_{i}: {branch.condition}"
                     # Execute branch steps
-                    for branch_step in branch.steps:
-                        await self._execute_step(
-                            branch_step, context, step_trace.nested_steps
-                        )
+                    await self._execute_branch(
+                        branch.steps, context, step_trace.nested_steps
+                    )
                     branch_taken = True
                     break
 
             # Execute default if no branch matched
             if not branch_taken and step.default:
                 step_trace.decision_taken = "default"
-                for default_step in step.default:
-                    await self._execute_step(
-                        default_step, context, step_trace.nested_steps
-                    )
+                await self._execute_branch(
+                    step.default, context, step_trace.nested_steps
+                )
 
-            step_trace.completed_at = datetime.utcnow()
-            step_trace.duration_ms = int(
-                (step_trace.completed_at - step_trace.started_at).total_seconds() * 1000
-            )
+            step_trace.duration_ms = self._finish_step(step_trace, start_ns)
 
+        except asyncio.CancelledError:
+            step_trace.error = "Cancelled"
+            step_trace.duration_ms = self._finish_step(step_trace, start_ns)
+            raise
         except Exception as e:
             step_trace.error = str(e)
-            step_trace.completed_at = datetime.utcnow()
+            self._finish_step(step_trace, start_ns)
             raise
@@ -1,10 +1,97 @@
 """Custom exceptions for playbook execution with enhanced error context."""
 
+import heapq
+import reprlib
+from abc import ABC, abstractmethod
 from difflib import get_close_matches
+from itertools import islice
 from typing import Any, Dict, List, Optional, Type
 
 from pydantic import BaseModel, ValidationError
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - optional dependency
+    process = None  # type: ignore[assignment]
+
+# Skills listed in SkillNotFoundError messages, alphabetically from the first
+_MAX_LISTED_SKILLS = 50
+# Longest value preview in error messages
+_MAX_PREVIEW = 100
+
+
+class _PreviewRepr(reprlib.Repr):
+    """reprlib.Repr that keeps dict keys in insertion order, as str() does."""
+
+    def repr_dict(self, x: Dict[Any, Any], level: int) -> str:
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{...}"
+        pieces = [
+            f"{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}"
+            for key, value in islice(x.items(), self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append("...")
+        return "{" + ", ".join(pieces) + "}"
+
+
+# Renders at most a few items of the first levels of a container, so the
+# cost of a preview does not grow with the size of the input
+_REPR = _PreviewRepr()
+_REPR.maxlevel = 3
+_REPR.maxdict = _REPR.maxlist = _REPR.maxtuple = 5
+_REPR.maxset = _REPR.maxfrozenset = 5
+_REPR.maxstring = _REPR.maxlong = _REPR.maxother = _MAX_PREVIEW
+
+
+def _preview(value: Any, limit: int = _MAX_PREVIEW) -> str:
+    """
+    Render a value for an error message, truncated to a maximum length.
+
+    Args:
+        value: Value to render
+        limit: Maximum length of the preview, at most _MAX_PREVIEW
+
+    Returns:
+        The value as str() renders it, with containers abbreviated by
+        reprlib, cut to limit characters with "..."
+    """
+    if isinstance(value, str):
+        text = value
+    elif isinstance(value, (dict, list, tuple, set, frozenset)):
+        text = _REPR.repr(value)
+    else:
+        text = str(value)
+    if len(text) > limit:
+        text = text[: limit - 3] + "..."
+    return text
+
+
+def _close_matches(word: str, candidates: List[str]) -> List[str]:
+    """
+    Find up to three candidates similar to a word, best first.
+
+    Uses rapidfuzz (pip install agentic-playbooks[fuzzy]) when installed,
+    and difflib otherwise.
+
+    Args:
+        word: Word to match
+        candidates: Possible matches
+
+    Returns:
+        Candidates scoring at least 0.6 similarity
+    """
+    if process is None:
+        return get_close_matches(word, candidates, n=3, cutoff=0.6)
+    return [
+        match
+        for match, _, _ in process.extract(
+            word, candidates, scorer=fuzz.ratio, limit=3, score_cutoff=60
+        )
+    ]
+
 
 class PlaybookExecutionError(Exception):
     """Base exception for playbook execution errors."""
@@ -12,7 +99,43 @@ class PlaybookExecutionError(Exception):
     pass
 
 
-class SkillNotFoundError(PlaybookExecutionError):
+class _DetailedError(PlaybookExecutionError, ABC):
+    """
+    Base for errors with a detailed, multi-line message.
+
+    The message is built on first use by str() or repr(), so errors that
+    are caught and never displayed cost no formatting. Subclasses keep
+    shallow copies of the dicts and lists they are given, so the message
+    describes them as they were when the error was raised, and pass their
+    constructor arguments to __init__() as args, which keeps them
+    picklable.
+    """
+
+    _message: Optional[str] = None
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "_DetailedError":
+        # BaseException.__new__() skips the abstract method check of object's
+        if cls.__abstractmethods__:
+            raise TypeError(
+                f"Can't instantiate abstract class {cls.__name__} with abstract "
+                f"method {', '.join(sorted(cls.__abstractmethods__))}"
+            )
+        return super().__new__(cls, *args, **kwargs)
+
+    @abstractmethod
+    def _build_message(self) -> str:
+        """Build the detailed message from the error's attributes."""
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = self._build_message()
+        return self._message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+
+class SkillNotFoundError(_DetailedError):
     """
     Raised when a skill is not found in the registry.
 
@@ -37,34 +160,48 @@ class SkillNotFoundError(PlaybookExecutionError):
         """
         self.skill_name = skill_name
         self.step_name = step_name
-        self.available_skills = available_skills
+        self.available_skills = list(available_skills)
         self.playbook_name = playbook_name
 
-        # Find close matches using Levenshtein distance
-        suggestions = get_close_matches(skill_name, available_skills, n=3, cutoff=0.6)
+        super().__init__(skill_name, step_name, self.available_skills, playbook_name)
+
+    def _build_message(self) -> str:
+        """Build the message with close matches and the available skills."""
+        skill_name = self.skill_name
+        available_skills = self.available_skills
 
-        message = f"Skill '{skill_name}' not found in registry\n"
-        message += f"  Playbook: {playbook_name}\n"
-        message += f"  Step: {step_name}\n\n"
+        # Find close matches by edit similarity
+        suggestions = _close_matches(skill_name, available_skills)
+
+        lines = [
+            f"Skill '{skill_name}' not found in registry",
+            f"  Playbook: {self.playbook_name}",
+            f"  Step: {self.step_name}",
+            "",
+        ]
 
         if suggestions:
-            message += "Did you mean one of these?\n"
-            for suggestion in suggestions:
-                message += f"  - {suggestion}\n"
-            message += "\n"
+            lines.append("Did you mean one of these?")
+            lines.extend(f"  - {suggestion}" for suggestion in suggestions)
+            lines.append("")
 
-        message += f"Available skills ({len(available_skills)}):\n"
-        for skill in sorted(available_skills):
-            message += f"  - {skill}\n"
+        lines.append(f"Available skills ({len(available_skills)}):")
+        listed = heapq.nsmallest(_MAX_LISTED_SKILLS, available_skills)
+        lines.extend(f"  - {skill}" for skill in listed)
+        if len(available_skills) > len(listed):
+            lines.append(f"  ... and {len(available_skills) - len(listed)} more")
 
-        message += "\nTip: Register your skill with:\n"
-        message += "  registry = SkillRegistry.get_instance()\n"
-        message += "  registry.register(YourSkillClass)\n"
+        lines += [
+            "",
+            "Tip: Register your skill with:",
+            "  registry = SkillRegistry.get_instance()",
+            "  registry.register(YourSkillClass)",
+        ]
 
-        super().__init__(message)
+        return "\n".join(lines) + "\n"
 
 
-class TemplateError(PlaybookExecutionError):
+class TemplateError(_DetailedError):
     """
     Raised when a Jinja2 template fails to render.
 
@@ -93,38 +230,46 @@ class TemplateError(PlaybookExecutionError):
         self.original_error = error
         self.step_name = step_name
         self.field_name = field_name
-        self.available_vars = available_vars
+        self.available_vars = dict(available_vars)
 
-        message = f"Template error in step '{step_name}', field '{field_name}'\n"
-        message += f"  Template: {template_str}\n"
-        message += f"  Error: {type(error).__name__}: {error}\n\n"
+        super().__init__(
+            template_str, error, step_name, field_name, self.available_vars
+        )
 
-        message += "Available variables:\n"
+    def _build_message(self) -> str:
+        """Build the message with the template and the available variables."""
+        error = self.original_error
+        available_vars = self.available_vars
+
+        lines = [
+            f"Template error in step '{self.step_name}', field '{self.field_name}'",
+            f"  Template: {self.template_str}",
+            f"  Error: {type(error).__name__}: {error}",
+            "",
+            "Available variables:",
+        ]
         if available_vars:
             for key, value in sorted(available_vars.items()):
-                # Truncate long values for readability
-                value_str = str(value)
-                if len(value_str) > 80:
-                    value_preview = value_str[:77] + "..."
-                else:
-                    value_preview = value_str
-
-                # Show type for objects
+                # Show type for objects, truncated values otherwise
                 if isinstance(value, dict):
-                    message += f"  - {key}: dict with {len(value)} keys\n"
+                    lines.append(f"  - {key}: dict with {len(value)} keys")
                 elif isinstance(value, list):
-                    message += f"  - {key}: list with {len(value)} items\n"
+                    lines.append(f"  - {key}: list with {len(value)} items")
                 else:
-                    message += f"  - {key}: {value_preview}\n"
+                    lines.append(f"  - {key}: {_preview(value, 80)}")
         else:
-            message += "  (no variables available)\n"
+            lines.append("  (no variables available)")
 
-        message += "\nTip: Check variable names and ensure data is available from previous steps.\n"
+        lines += [
+            "",
+            "Tip: Check variable names and ensure data is available from previous "
+            "steps.",
+        ]
 
-        super().__init__(message)
+        return "\n".join(lines) + "\n"
 
 
-class SkillExecutionError(PlaybookExecutionError):
+class SkillExecutionError(_DetailedError):
     """
     Raised when a skill's execute() method fails.
 
@@ -151,49 +296,57 @@ class SkillExecutionError(PlaybookExecutionError):
         """
         self.skill_name = skill_name
         self.step_name = step_name
-        self.input_data = input_data
+        self.input_data = dict(input_data)
         self.original_error = original_error
         self.reasoning = reasoning
 
-        message = f"Skill execution failed: {skill_name}\n"
-        message += f"  Step: {step_name}\n"
-        message += f"  Error: {type(original_error).__name__}: {original_error}\n\n"
-
-        message += "Input data:\n"
-        message += self._format_dict(input_data, indent=2)
-        message += "\n"
-
-        if reasoning:
-            message += "\nSkill reasoning:\n"
-            message += f"  {reasoning}\n"
-
-        message += (
-            "\nTip: Check the skill's execute() method and input data validation.\n"
+        super().__init__(
+            skill_name, step_name, self.input_data, original_error, reasoning
         )
 
-        super().__init__(message)
+    def _build_message(self) -> str:
+        """Build the message with the failed skill's input and reasoning."""
+        original_error = self.original_error
+
+        lines = [
+            f"Skill execution failed: {self.skill_name}",
+            f"  Step: {self.step_name}",
+            f"  Error: {type(original_error).__name__}: {original_error}",
+            "",
+            "Input data:",
+        ]
+        self._format_dict(self.input_data, lines, indent=2)
+
+        if self.reasoning:
+            lines += ["", "Skill reasoning:", f"  {self.reasoning}"]
+
+        lines += [
+            "",
+            "Tip: Check the skill's execute() method and input data validation.",
+        ]
+
+        return "\n".join(lines) + "\n"
+
+    def _format_dict(
+        self, d: Dict[str, Any], lines: List[str], indent: int = 0
+    ) -> None:
+        """Append a dictionary's lines, nested dicts indented, to lines."""
+        if not d:
+            lines.append("")
+            return
 
-    def _format_dict(self, d: Dict[str, Any], indent: int = 0) -> str:
-        """Format dictionary for readable error messages."""
-        lines = []
         prefix = " " * indent
-
         for key, value in d.items():
             if isinstance(value, dict):
                 lines.append(f"{prefix}{key}:")
-                lines.append(self._format_dict(value, indent + 2))
+                self._format_dict(value, lines, indent + 2)
             elif isinstance(value, list):
                 lines.append(f"{prefix}{key}: [{len(value)} items]")
             else:
-                value_str = str(value)
-                if len(value_str) > 100:
-                    value_str = value_str[:97] + "..."
-                lines.append(f"{prefix}{key}: {value_str}")
-
-        return "\n".join(lines)
+                lines.append(f"{prefix}{key}: {_preview(value)}")
 
 
-class InvalidInputError(PlaybookExecutionError):
+class InvalidInputError(_DetailedError):
     """
     Raised when skill input validation fails.
 
@@ -218,30 +371,33 @@ class InvalidInputError(PlaybookExecutionError):
         """
         self.skill_name = skill_name
         self.schema = schema
-        self.input_data = input_data
+        self.input_data = dict(input_data)
         self.validation_error = validation_error
 
-        message = f"Invalid input for skill '{skill_name}'\n"
-        message += f"  Schema: {schema.__name__}\n\n"
-
-        message += "Validation errors:\n"
-        for error in validation_error.errors():
+        super().__init__(skill_name, schema, self.input_data, validation_error)
+
+    def _build_message(self) -> str:
+        """Build the message with the validation errors and the input."""
+        lines = [
+            f"Invalid input for skill '{self.skill_name}'",
+            f"  Schema: {self.schema.__name__}",
+            "",
+            "Validation errors:",
+        ]
+        for error in self.validation_error.errors():
             field = " -> ".join(str(loc) for loc in error["loc"])
-            message += f"  - {field}: {error['msg']}\n"
+            lines.append(f"  - {field}: {error['msg']}")
 
-        message += "\nInput data:\n"
-        for key, value in input_data.items():
-            value_str = str(value)
-            if len(value_str) > 100:
-                value_str = value_str[:97] + "..."
-            message += f"  {key}: {value_str}\n"
+        lines += ["", "Input data:"]
+        for key, value in self.input_data.items():
+            lines.append(f"  {key}: {_preview(value)}")
 
-        message += "\nTip: Check input data types and required fields.\n"
+        lines += ["", "Tip: Check input data types and required fields."]
 
-        super().__init__(message)
+        return "\n".join(lines) + "\n"
 
 
-class CheckpointError(PlaybookExecutionError):
+class CheckpointError(_DetailedError):
     """
     Raised when checkpoint save/load operations fail.
     """
@@ -259,7 +415,14 @@ class CheckpointError(PlaybookExecutionError):
         self.execution_id = execution_id
         self.original_error = original_error
 
-        message = f"Checkpoint {operation} failed for execution '{execution_id}'\n"
-        message += f"  Error: {type(original_error).__name__}: {original_error}\n"
+        super().__init__(operation, execution_id, original_error)
 
-        super().__init__(message)
+    def _build_message(self) -> str:
+        """Build the message with the failed operation and its cause."""
+        original_error = self.original_error
+
+        return (
+            f"Checkpoint {self.operation} failed for execution "
+            f"'{self.execution_id}'\n"
+            f"  Error: {type(original_error).__name__}: {original_error}\n"
+        )
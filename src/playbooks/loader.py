@@ -1,13 +1,24 @@
 """PlaybookLoader - loads and validates playbook definitions from YAML files."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import yaml
 from jinja2 import Environment, TemplateSyntaxError
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from .models import DecisionStep, Playbook, SkillStep, Step, StepType
+from .models import Playbook, Step, StepType
+
+try:
+    # libyaml's parser, bundled with most PyYAML wheels
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Validates a whole step list, nested branches included, in one call
+_STEPS_ADAPTER = TypeAdapter(List[Step])
+_STEP_TYPES = [step_type.value for step_type in StepType]
 
 
 class PlaybookLoadError(Exception):
@@ -45,6 +56,9 @@ class PlaybookLoader:
             autoescape=False,
             undefined=ChainableUndefined,  # Keep undefined variables as-is for runtime evaluation
         )
+        # Compiled templates by content, so reloading a playbook with new
+        # variables only renders it
+        self._compile_template = lru_cache(maxsize=128)(self._jinja_env.from_string)
 
     def load_from_file(
         self, file_path: Union[str, Path], variables: Optional[Dict[str, Any]] = None
@@ -96,14 +110,14 @@ class PlaybookLoader:
         # Process Jinja2 template variables if provided
         # Note: This only substitutes variables at load-time. Runtime template variables
         # (in step inputs, decision conditions, etc.) are preserved for execution time.
-        if variables:
+        if variables and any(marker in yaml_content for marker in ("{{", "{%", "{#")):
             processed_content = self._process_template(yaml_content, variables)
         else:
             processed_content = yaml_content
 
         # Parse YAML
         try:
-            data = yaml.safe_load(processed_content)
+            data = yaml.load(processed_content, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise PlaybookLoadError(f"Failed to parse YAML: {e}")
 
@@ -166,8 +180,6 @@ class PlaybookLoader:
         if not isinstance(steps_data, list):
             raise PlaybookLoadError("'steps' must be a list")
 
-        parsed_steps: List[Step] = []
-
         for i, step_data in enumerate(steps_data):
             if not isinstance(step_data, dict):
                 raise PlaybookLoadError(f"Step {i} must be a dictionary")
@@ -176,35 +188,17 @@ class PlaybookLoader:
                 raise PlaybookLoadError(f"Step {i} must have a 'type' field")
 
             step_type = step_data["type"]
+            if step_type not in _STEP_TYPES:
+                raise PlaybookLoadError(
+                    f"Step {i} has unknown type '{step_type}'. "
+                    f"Must be one of: {_STEP_TYPES}"
+                )
 
-            try:
-                step: Step
-                if step_type == StepType.SKILL.value:
-                    step = SkillStep(**step_data)
-                elif step_type == StepType.DECISION.value:
-                    # Recursively parse branches
-                    if "branches" in step_data:
-                        for branch in step_data["branches"]:
-                            if "steps" in branch:
-                                branch["steps"] = self._parse_steps(branch["steps"])
-
-                    # Parse default steps if present
-                    if "default" in step_data and step_data["default"]:
-                        step_data["default"] = self._parse_steps(step_data["default"])
-
-                    step = DecisionStep(**step_data)
-                else:
-                    raise PlaybookLoadError(
-                        f"Step {i} has unknown type '{step_type}'. "
-                        f"Must be one of: {[t.value for t in StepType]}"
-                    )
-
-                parsed_steps.append(step)
-
-            except ValidationError as e:
-                raise PlaybookLoadError(f"Step {i} validation failed: {e}")
-
-        return parsed_steps
+        try:
+            return _STEPS_ADAPTER.validate_python(steps_data)
+        except ValidationError as e:
+            i = e.errors()[0]["loc"][0]
+            raise PlaybookLoadError(f"Step {i} validation failed: {e}")
 
     def _process_template(self, content: str, variables: Dict[str, Any]) -> str:
         """
@@ -221,7 +215,7 @@ class PlaybookLoader:
             PlaybookLoadError: If template processing fails
         """
         try:
-            template = self._jinja_env.from_string(content)
+            template = self._compile_template(content)
             return template.render(**variables)
         except TemplateSyntaxError as e:
             raise PlaybookLoadError(f"Template syntax error: {e}")
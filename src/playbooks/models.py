@@ -1,9 +1,17 @@
 """Pydantic models for playbook structure validation."""
 
+import sys
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Discriminator,
+    Field,
+    PrivateAttr,
+    Tag,
+    field_validator,
+)
 
 
 class StepType(str, Enum):
@@ -32,6 +40,12 @@ class SkillStep(BaseModel):
             raise ValueError(f"SkillStep must have type='{StepType.SKILL.value}'")
         return v
 
+    @field_validator("skill")
+    @classmethod
+    def intern_skill(cls, v: str) -> str:
+        """Intern the skill name, so registry lookups match it by identity."""
+        return sys.intern(v)
+
 
 class DecisionBranch(BaseModel):
     """A branch in a decision step."""
@@ -63,8 +77,23 @@ class DecisionStep(BaseModel):
         return v
 
 
-# Union type for all step types
-Step = Union[SkillStep, DecisionStep]
+def _step_type(value: Any) -> Optional[str]:
+    """Get the type tag of a step model or of raw step data."""
+    step_type = (
+        value.get("type") if isinstance(value, dict) else getattr(value, "type", None)
+    )
+    return step_type.value if isinstance(step_type, StepType) else step_type
+
+
+# Union type for all step types. Raw data is validated against the model
+# its "type" names, rather than trying each model in turn
+Step = Annotated[
+    Union[
+        Annotated[SkillStep, Tag(StepType.SKILL.value)],
+        Annotated[DecisionStep, Tag(StepType.DECISION.value)],
+    ],
+    Discriminator(_step_type),
+]
 
 # Update forward references
 DecisionBranch.model_rebuild()
@@ -94,6 +123,15 @@ class Playbook(BaseModel):
         default_factory=dict, description="Template variables"
     )
     steps: List[Step] = Field(..., description="Sequential steps to execute")
+    parallel: bool = Field(
+        False,
+        description=(
+            "Run consecutive skill steps concurrently when none reads or "
+            "writes another's output variable"
+        ),
+    )
+    # Compiled templates and conditions, filled in by PlaybookEngine.prepare()
+    _prepared: Optional[Any] = PrivateAttr(default=None)
 
     @field_validator("steps")
     @classmethod
@@ -103,5 +141,13 @@ class Playbook(BaseModel):
             raise ValueError("Playbook must have at least one step")
         return v
 
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> "Playbook":
+        """Copy the playbook, leaving the copy to be prepared afresh."""
+        copy = super().model_copy(update=update, deep=deep)
+        copy._prepared = None
+        return copy
+
     def __repr__(self) -> str:
         return f"<Playbook name='{self.metadata.name}' version='{self.metadata.version}' steps={len(self.steps)}>"
@@ -15,11 +15,23 @@ class StepTrace:
     timing, inputs/outputs, decisions, and any errors.
     """
 
+    __slots__ = (
+        "step_name",
+        "step_type",
+        "started_at",
+        "completed_at",
+        "duration_ms",
+        "skill_trace",
+        "decision_taken",
+        "error",
+        "nested_steps",
+    )
+
     def __init__(
         self,
         step_name: str,
         step_type: str,
-        started_at: datetime,
+        started_at: Optional[datetime],
     ) -> None:
         """
         Initialize step trace.
@@ -27,7 +39,8 @@ class StepTrace:
         Args:
             step_name: Name of the step
             step_type: Type of step (skill, decision, etc.)
-            started_at: When step execution started
+            started_at: When step execution started, or None when unknown
+                (e.g. restored from a checkpoint that did not record it)
         """
         self.step_name = step_name
         self.step_type = step_type
@@ -49,7 +62,7 @@ class StepTrace:
         result: Dict[str, Any] = {
             "step_name": self.step_name,
             "step_type": self.step_type,
-            "started_at": self.started_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": (
                 self.completed_at.isoformat() if self.completed_at else None
             ),
@@ -91,6 +104,18 @@ class ExecutionTrace:
     final context, and success/error status.
     """
 
+    __slots__ = (
+        "playbook_name",
+        "execution_id",
+        "started_at",
+        "completed_at",
+        "duration_ms",
+        "steps",
+        "final_context",
+        "error",
+        "success",
+    )
+
     def __init__(self, playbook_name: str, execution_id: str) -> None:
         """
         Initialize execution trace.
@@ -1,8 +1,9 @@
 """Base Skill class - foundation for all skills."""
 
+import time
 import uuid
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
 from pydantic import BaseModel
@@ -56,6 +57,12 @@ class Skill(ABC):
     name: str = "base_skill"
     version: str = "0.0.0"
     description: str = ""
+    # Whether the output depends on the input alone, so the engine may
+    # reuse the output of an earlier run with the same input
+    pure: bool = False
+
+    # Subclasses that declare __slots__ too carry no per-instance __dict__
+    __slots__ = ("_trace",)
 
     def __init__(self) -> None:
         self._trace: Optional[SkillTrace] = None
@@ -85,6 +92,7 @@ class Skill(ABC):
         """
         execution_id = str(uuid.uuid4())
         started_at = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
 
         self._trace = SkillTrace(
             skill_name=self.name,
@@ -95,19 +103,21 @@ class Skill(ABC):
 
         try:
             output = await self.execute(input)
-            completed_at = datetime.utcnow()
+            elapsed_ns = time.perf_counter_ns() - start_ns
 
             self._trace.output = output
-            self._trace.completed_at = completed_at
-            self._trace.duration_ms = int(
-                (completed_at - started_at).total_seconds() * 1000
+            self._trace.completed_at = started_at + timedelta(
+                microseconds=elapsed_ns // 1000
             )
+            self._trace.duration_ms = elapsed_ns // 1_000_000
 
             return output, self._trace
 
         except Exception as e:
             self._trace.error = str(e)
-            self._trace.completed_at = datetime.utcnow()
+            self._trace.completed_at = started_at + timedelta(
+                microseconds=(time.perf_counter_ns() - start_ns) // 1000
+            )
             raise
 
     def get_trace(self) -> Optional[SkillTrace]:
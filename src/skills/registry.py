@@ -1,5 +1,6 @@
 """Skill Registry - registration and discovery of skills."""
 
+import sys
 from typing import Dict, Optional, Type
 
 from .base import Skill
@@ -52,7 +53,8 @@ class SkillRegistry:
         if not issubclass(skill_class, Skill):
             raise TypeError(f"{skill_class} must be a subclass of Skill")
 
-        name = skill_class.name
+        # Interned, like the step names looked up against it
+        name = sys.intern(skill_class.name)
         if name in self._skills:
             raise ValueError(f"Skill '{name}' is already registered")
 
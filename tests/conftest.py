@@ -0,0 +1,34 @@
+"""Shared pytest fixtures."""
+
+from typing import Iterator
+
+import pytest
+
+from src.modules.governance.skills import _llm
+from src.modules.governance.skills._client import reset_clients
+from src.modules.governance.skills._response_cache import get_response_cache
+from src.modules.governance.skills._semantic_cache import reset_semantic_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache() -> Iterator[None]:
+    """Isolate tests from LLM responses cached by earlier tests."""
+    get_response_cache().clear()
+    reset_semantic_cache()
+    yield
+    get_response_cache().clear()
+    reset_semantic_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_openai_clients() -> Iterator[None]:
+    """Make each test build the shared OpenAI client from its own patches."""
+    reset_clients()
+    yield
+    reset_clients()
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip the backoff between LLM retry attempts."""
+    monkeypatch.setattr(_llm, "RETRY_BACKOFF_SECONDS", 0.0)
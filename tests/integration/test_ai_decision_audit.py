@@ -117,7 +117,7 @@ def mock_openai_client(
         """Mock the create method based on the prompt content."""
         messages = kwargs.get("messages", [])
         system_content = messages[0]["content"] if len(messages) > 0 else ""
-        user_content = messages[1]["content"] if len(messages) > 1 else ""
+        user_content = messages[-1]["content"] if len(messages) > 1 else ""
 
         # Determine which response to return based on content
         # Check for leadership questions FIRST (before Decision Summary check)
@@ -171,15 +171,7 @@ class TestAIDecisionAuditPlaybook:
         with (
             patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
             patch(
-                "src.modules.governance.skills.decision_context_extractor.AsyncOpenAI",
-                return_value=mock_openai_client,
-            ),
-            patch(
-                "src.modules.governance.skills.risk_identifier.AsyncOpenAI",
-                return_value=mock_openai_client,
-            ),
-            patch(
-                "src.modules.governance.skills.leadership_questions_generator.AsyncOpenAI",
+                "src.modules.governance.skills._client.AsyncOpenAI",
                 return_value=mock_openai_client,
             ),
         ):
@@ -257,15 +249,7 @@ class TestAIDecisionAuditPlaybook:
         with (
             patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
             patch(
-                "src.modules.governance.skills.decision_context_extractor.AsyncOpenAI",
-                return_value=mock_openai_client,
-            ),
-            patch(
-                "src.modules.governance.skills.risk_identifier.AsyncOpenAI",
-                return_value=mock_openai_client,
-            ),
-            patch(
-                "src.modules.governance.skills.leadership_questions_generator.AsyncOpenAI",
+                "src.modules.governance.skills._client.AsyncOpenAI",
                 return_value=mock_openai_client,
             ),
         ):
@@ -302,15 +286,7 @@ class TestAIDecisionAuditPlaybook:
         with (
             patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
             patch(
-                "src.modules.governance.skills.decision_context_extractor.AsyncOpenAI",
-                return_value=mock_openai_client,
-            ),
-            patch(
-                "src.modules.governance.skills.risk_identifier.AsyncOpenAI",
-                return_value=mock_openai_client,
-            ),
-            patch(
-                "src.modules.governance.skills.leadership_questions_generator.AsyncOpenAI",
+                "src.modules.governance.skills._client.AsyncOpenAI",
                 return_value=mock_openai_client,
             ),
         ):
@@ -4,7 +4,8 @@ import asyncio
 import json
 import tempfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+from unittest.mock import patch
 
 import pytest
 
@@ -14,6 +15,7 @@ from src.playbooks import (
     BatchResults,
     Playbook,
     PlaybookEngine,
+    PlaybookExecutionError,
     PlaybookMetadata,
     SkillStep,
 )
@@ -43,6 +45,25 @@ class FailingSkill(Skill):
         raise ValueError("Intentional failure")
 
 
+class SleepySkill(Skill):
+    """Skill that sleeps for a given delay and records concurrency."""
+
+    name = "sleepy_skill"
+    version = "1.0.0"
+    running = 0
+    max_running = 0
+
+    async def execute(self, input: Dict[str, Any]) -> Dict[str, Any]:
+        cls = type(self)
+        cls.running += 1
+        cls.max_running = max(cls.max_running, cls.running)
+        try:
+            await asyncio.sleep(float(input.get("delay") or 0.01))
+        finally:
+            cls.running -= 1
+        return {"result": "done"}
+
+
 class TestBatchResult:
     """Test suite for BatchResult."""
 
@@ -97,6 +118,32 @@ class TestBatchResult:
         assert result_dict["input_context"] == {"value": "test"}
         assert result_dict["trace"] is None
 
+    def test_batch_result_has_no_instance_dict(self) -> None:
+        """Test BatchResult uses __slots__ instead of a per-instance dict."""
+        result = BatchResult(index=0, input_context={})
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unknown = True  # type: ignore[attr-defined]
+
+    def test_batch_result_to_dict_serializes_trace_once(self) -> None:
+        """Test the trace is serialized once and re-serialized if replaced."""
+        from src.playbooks.tracer import ExecutionTrace
+
+        trace = ExecutionTrace(playbook_name="test", execution_id="test-123")
+        result = BatchResult(index=0, input_context={}, trace=trace)
+
+        with patch.object(
+            ExecutionTrace, "to_dict", autospec=True, return_value={"id": 1}
+        ) as to_dict:
+            result.to_dict()
+            result.to_dict()
+            assert to_dict.call_count == 1
+
+            result.trace = ExecutionTrace(playbook_name="test", execution_id="other")
+            result.to_dict()
+            assert to_dict.call_count == 2
+
 
 class TestBatchResults:
     """Test suite for BatchResults."""
@@ -201,6 +248,70 @@ class TestBatchResults:
         finally:
             Path(temp_path).unlink()
 
+    @pytest.mark.parametrize("indent", [2, None])
+    def test_batch_results_to_json_matches_json_dump(
+        self, indent: Optional[int], tmp_path: Path
+    ) -> None:
+        """Test the streamed JSON export decodes to to_dict()."""
+        from src.playbooks.tracer import ExecutionTrace
+
+        trace = ExecutionTrace(playbook_name="test", execution_id="test-123")
+        trace.success = True
+        trace.final_context = {"nested": {"items": [1, 2]}}
+
+        results = BatchResults(
+            results=[
+                BatchResult(index=0, input_context={}, error="Error"),
+                BatchResult(index=1, input_context={"v": 1}, trace=trace),
+            ],
+            total_duration_ms=200.0,
+        )
+        path = tmp_path / "results.json"
+
+        results.to_json(str(path), indent=indent)
+
+        assert json.loads(path.read_text()) == results.to_dict()
+        assert ("\n" in path.read_text()) is (indent is not None)
+
+    @pytest.mark.parametrize("indent", [2, None])
+    def test_batch_results_share_repeated_inputs(
+        self, indent: Optional[int], tmp_path: Path
+    ) -> None:
+        """Test inputs shared by several results are exported once."""
+        shared = {"v": 1}
+        results = BatchResults(
+            results=[
+                BatchResult(index=0, input_context=shared),
+                BatchResult(index=1, input_context={"v": 2}),
+                BatchResult(index=2, input_context=shared),
+            ]
+        )
+        path = tmp_path / "results.json"
+
+        results_dict = results.to_dict()
+        results.to_json(str(path), indent=indent)
+
+        assert results_dict["inputs"] == [{"v": 1}, {"v": 2}]
+        assert [r["input_context_ref"] for r in results_dict["results"]] == [0, 1, 0]
+        assert all("input_context" not in r for r in results_dict["results"])
+        assert json.loads(path.read_text()) == results_dict
+
+    def test_batch_results_to_jsonl(self, tmp_path: Path) -> None:
+        """Test BatchResults JSON Lines export writes one result per line."""
+        results = BatchResults(
+            results=[
+                BatchResult(index=0, input_context={}, error="Error"),
+                BatchResult(index=1, input_context={"v": 1}, duration_ms=5.0),
+            ]
+        )
+        path = tmp_path / "results.jsonl"
+
+        results.to_jsonl(str(path))
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["index"] for line in lines] == [0, 1]
+        assert json.loads(lines[0])["error"] == "Error"
+
     def test_batch_results_to_csv(self) -> None:
         """Test BatchResults CSV export."""
         results = BatchResults(
@@ -384,6 +495,72 @@ class TestBatchExecutor:
         assert results.total == 3
         assert results.failure_count == 3
 
+    @pytest.mark.asyncio
+    async def test_execute_batch_stop_on_error(self) -> None:
+        """Test the first failure propagates when continue_on_error is False."""
+        registry = SkillRegistry()
+        registry.register(FailingSkill)
+
+        engine = PlaybookEngine(registry)
+        executor = BatchExecutor(engine=engine, max_concurrency=1)
+
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="test", version="1.0.0"),
+            steps=[SkillStep(name="step1", skill="failing_skill", input={})],
+        )
+        inputs = [{"value": i} for i in range(3)]
+
+        with (
+            patch.object(engine, "execute", wraps=engine.execute) as execute,
+            pytest.raises(PlaybookExecutionError),
+        ):
+            await executor.execute_batch(playbook, inputs, continue_on_error=False)
+
+        assert execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_interns_equal_inputs(self) -> None:
+        """Test inputs with equal content share one dict in the results."""
+        registry = SkillRegistry()
+        registry.register(DummySkill)
+
+        engine = PlaybookEngine(registry)
+        executor = BatchExecutor(engine=engine)
+
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="test", version="1.0.0"),
+            steps=[SkillStep(name="step1", skill="dummy_skill", input={})],
+        )
+        inputs = [{"a": 1, "b": 2}, {"a": 3}, {"b": 2, "a": 1}]
+
+        results = await executor.execute_batch(playbook, inputs)
+
+        first, second, third = results.results
+        assert first.input_context is third.input_context
+        assert first.input_context is not second.input_context
+        assert results.to_dict()["inputs"] == [{"a": 1, "b": 2}, {"a": 3}]
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_keeps_inputs_with_equal_json(self) -> None:
+        """Test inputs that only encode to the same JSON are not shared."""
+        registry = SkillRegistry()
+        registry.register(DummySkill)
+
+        engine = PlaybookEngine(registry)
+        executor = BatchExecutor(engine=engine)
+
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="test", version="1.0.0"),
+            steps=[SkillStep(name="step1", skill="dummy_skill", input={})],
+        )
+        inputs = [{1: "x"}, {"1": "x"}, {"v": (1, 2)}, {"v": [1, 2]}]
+
+        results = await executor.execute_batch(playbook, inputs)
+
+        assert [result.input_context for result in results.results] == inputs
+        for result, input_context in zip(results.results, inputs):
+            assert result.input_context is input_context
+
     @pytest.mark.asyncio
     async def test_execute_batch_timing(self) -> None:
         """Test that batch execution tracks timing correctly."""
@@ -431,7 +608,9 @@ class TestBatchExecutor:
             assert result.input_context["value"] == i
 
     @pytest.mark.asyncio
-    async def test_execute_batch_with_progress(self) -> None:
+    async def test_execute_batch_with_progress(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test batch execution with progress tracking."""
         registry = SkillRegistry()
         registry.register(DummySkill)
@@ -446,12 +625,21 @@ class TestBatchExecutor:
 
         inputs = [{"value": i} for i in range(3)]
 
-        # Should print progress messages (we can't easily test console output)
         results = await executor.execute_batch(playbook, inputs)
 
         assert results.total == 3
         assert results.success_count == 3
 
+        # Buffered per-execution lines are flushed before the summary
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == "Processing 3 inputs..."
+        assert sorted(line.split("]")[0] for line in lines[1:4]) == [
+            "  [1",
+            "  [2",
+            "  [3",
+        ]
+        assert lines[4].startswith("Completed: Success: 3, Failed: 0")
+
     @pytest.mark.asyncio
     async def test_execute_batch_concurrency_limit(self) -> None:
         """Test that concurrency limit is respected."""
@@ -473,3 +661,91 @@ class TestBatchExecutor:
         # With concurrency=1, should execute sequentially
         assert results.total == 5
         assert results.success_count == 5
+
+    @pytest.mark.asyncio
+    async def test_stream_batch_yields_in_completion_order(self) -> None:
+        """Test stream_batch yields each result as soon as it completes."""
+        registry = SkillRegistry()
+        registry.register(SleepySkill)
+
+        engine = PlaybookEngine(registry)
+        executor = BatchExecutor(engine=engine, max_concurrency=3)
+
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="test", version="1.0.0"),
+            steps=[
+                SkillStep(
+                    name="step1",
+                    skill="sleepy_skill",
+                    input={"delay": "{{ delay }}"},
+                )
+            ],
+        )
+
+        inputs = [{"delay": 0.05}, {"delay": 0.01}, {"delay": 0.03}]
+
+        indices = [r.index async for r in executor.stream_batch(playbook, inputs)]
+
+        assert indices == [1, 2, 0]
+
+    @pytest.mark.asyncio
+    async def test_stream_batch_bounds_in_flight_executions(self) -> None:
+        """Test max_concurrency workers consume the inputs lazily."""
+        registry = SkillRegistry()
+        registry.register(SleepySkill)
+
+        engine = PlaybookEngine(registry)
+        executor = BatchExecutor(engine=engine, max_concurrency=2)
+
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="test", version="1.0.0"),
+            steps=[SkillStep(name="step1", skill="sleepy_skill", input={})],
+        )
+
+        consumed = []
+
+        def inputs():
+            for i in range(6):
+                consumed.append(i)
+                yield {"value": i}
+
+        SleepySkill.max_running = 0
+        stream = executor.stream_batch(playbook, inputs())
+        first = await anext(stream)
+        # Inputs are pulled as workers free up, not all up front
+        assert len(consumed) <= 4
+        rest = [r async for r in stream]
+
+        assert SleepySkill.max_running == 2
+        assert sorted([first.index] + [r.index for r in rest]) == list(range(6))
+
+    @pytest.mark.asyncio
+    async def test_lightweight_discards_traces(self, tmp_path: Path) -> None:
+        """Test lightweight mode keeps success and errors but not traces."""
+        registry = SkillRegistry()
+        registry.register(DummySkill)
+        registry.register(FailingSkill)
+
+        engine = PlaybookEngine(registry)
+        executor = BatchExecutor(engine=engine, lightweight=True)
+
+        def playbook(skill: str) -> Playbook:
+            return Playbook(
+                metadata=PlaybookMetadata(name="test", version="1.0.0"),
+                steps=[SkillStep(name="step1", skill=skill, input={})],
+            )
+
+        passed = await executor.execute_batch(playbook("dummy_skill"), [{}])
+        failed = await executor.execute_batch(playbook("failing_skill"), [{}])
+        results = BatchResults(results=passed.results + failed.results)
+
+        assert [r.trace for r in results.results] == [None, None]
+        assert results.success_count == 1
+        assert results.results[0].error is None
+        assert results.results[1].error is not None
+
+        path = tmp_path / "results.json"
+        results.to_json(str(path))
+        exported = json.loads(path.read_text())["results"]
+        assert [r["success"] for r in exported] == [True, False]
+        assert all("trace" not in r for r in exported)
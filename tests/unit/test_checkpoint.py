@@ -1,10 +1,13 @@
 """Tests for checkpoint management."""
 
 import json
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from src.playbooks import checkpoint as checkpoint_module
 from src.playbooks.checkpoint import CheckpointManager
 from src.playbooks.errors import CheckpointError
 from src.playbooks.tracer import StepTrace
@@ -103,6 +106,15 @@ class TestCheckpointManager:
         assert "id-2" in checkpoints
         assert "id-3" in checkpoints
 
+    def test_list_checkpoints_skips_other_entries(self, manager, checkpoint_dir):
+        """Test temporary files, other files and directories are not listed."""
+        manager.save_checkpoint("id-1", "test", 0, {}, [])
+        (Path(checkpoint_dir) / "id-2.json.tmp").write_text("{}")
+        (Path(checkpoint_dir) / "notes.txt").write_text("")
+        (Path(checkpoint_dir) / "archive.json").mkdir()
+
+        assert manager.list_checkpoints() == ["id-1"]
+
     def test_list_checkpoints_empty(self, manager):
         """Test listing checkpoints when none exist."""
         checkpoints = manager.list_checkpoints()
@@ -163,6 +175,37 @@ class TestCheckpointManager:
         assert data["execution_id"] == "format-test"
         assert data["context"]["key"] == "value"
 
+    def test_save_replaces_checkpoint_atomically(self, manager, checkpoint_dir):
+        """Test saves go through a temporary file that is renamed into place."""
+        manager.save_checkpoint("atomic", "test", 0, {"step": 0}, [])
+        manager.save_checkpoint("atomic", "test", 1, {"step": 1}, [])
+
+        assert [p.name for p in Path(checkpoint_dir).iterdir()] == ["atomic.json"]
+        assert manager.load_checkpoint("atomic")["context"] == {"step": 1}
+
+    def test_failed_save_keeps_previous_checkpoint(self, manager, checkpoint_dir):
+        """Test a failed save leaves the last checkpoint and no temporary file."""
+        manager.save_checkpoint("keep", "test", 0, {"step": 0}, [])
+
+        with patch(
+            "src.playbooks.checkpoint.os.replace", side_effect=OSError("disk full")
+        ):
+            with pytest.raises(CheckpointError):
+                manager.save_checkpoint("keep", "test", 1, {"step": 1}, [])
+
+        assert [p.name for p in Path(checkpoint_dir).iterdir()] == ["keep.json"]
+        assert manager.load_checkpoint("keep")["context"] == {"step": 0}
+
+    def test_fsync_option(self, checkpoint_dir):
+        """Test fsync=True flushes the checkpoint to disk before replacing."""
+        manager = CheckpointManager(checkpoint_dir, fsync=True)
+
+        with patch("src.playbooks.checkpoint.os.fsync") as fsync:
+            manager.save_checkpoint("durable", "test", 0, {}, [])
+
+        fsync.assert_called_once()
+        assert manager.load_checkpoint("durable")["execution_id"] == "durable"
+
     def test_checkpoint_error_on_corrupted_file(self, manager, checkpoint_dir):
         """Test that loading corrupted checkpoint raises CheckpointError."""
         # Create a corrupted checkpoint file
@@ -174,3 +217,44 @@ class TestCheckpointManager:
 
         assert exc_info.value.operation == "load"
         assert exc_info.value.execution_id == "corrupted"
+
+    def test_unknown_format_rejected(self, checkpoint_dir):
+        """Test an unknown checkpoint format raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown checkpoint format"):
+            CheckpointManager(checkpoint_dir, format="xml")
+
+    def test_msgpack_format_requires_msgpack(self, checkpoint_dir):
+        """Test the msgpack format fails clearly without msgpack installed."""
+        with patch.object(checkpoint_module, "msgpack", None):
+            with pytest.raises(ImportError, match="msgpack"):
+                CheckpointManager(checkpoint_dir, format="msgpack")
+
+    def test_msgpack_round_trip(self, manager, checkpoint_dir):
+        """Test msgpack checkpoints save, list, load and delete."""
+        pytest.importorskip("msgpack")
+        msgpack_manager = CheckpointManager(checkpoint_dir, format="msgpack")
+        manager.save_checkpoint("json-id", "test", 0, {"a": 1}, [])
+
+        msgpack_manager.save_checkpoint("mp-id", "test", 1, {"b": [1, 2]}, [])
+
+        assert (Path(checkpoint_dir) / "mp-id.msgpack").exists()
+        assert sorted(msgpack_manager.list_checkpoints()) == ["json-id", "mp-id"]
+        assert msgpack_manager.load_checkpoint("mp-id")["context"] == {"b": [1, 2]}
+        # Existing JSON checkpoints still load
+        assert msgpack_manager.load_checkpoint("json-id")["context"] == {"a": 1}
+        assert manager.load_checkpoint("mp-id")["current_step"] == 1
+        assert msgpack_manager.delete_checkpoint("mp-id") is True
+        assert msgpack_manager.load_checkpoint("mp-id") is None
+
+    def test_serialize_step_fallback_keeps_missing_timestamps_empty(self, manager):
+        """Test steps without to_dict() get None rather than invented timestamps."""
+        from types import SimpleNamespace
+
+        started = datetime(2024, 1, 2, 3, 4, 5)
+        step = SimpleNamespace(step_name="s1", step_type="skill", started_at=started)
+
+        serialized = manager.serialize_step(step)
+
+        assert serialized["started_at"] == started.isoformat()
+        assert serialized["completed_at"] is None
+        assert manager.serialize_step(SimpleNamespace())["started_at"] is None
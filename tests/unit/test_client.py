@@ -0,0 +1,71 @@
+"""Unit tests for the shared governance OpenAI client."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.modules.governance.skills._client import (
+    get_client,
+    reset_clients,
+    resolve_client,
+)
+from src.modules.governance.skills.leadership_questions_generator import (
+    LeadershipQuestionsGenerator,
+)
+from src.modules.governance.skills.risk_identifier import RiskIdentifier
+
+
+class TestGetClient:
+    """Test suite for get_client()."""
+
+    def test_same_key_returns_same_client(self) -> None:
+        """Test clients are reused per API key."""
+        assert get_client("key-a") is get_client("key-a")
+
+    def test_different_keys_get_different_clients(self) -> None:
+        """Test clients are not shared across API keys."""
+        assert get_client("key-a") is not get_client("key-b")
+
+    def test_reset_clients(self) -> None:
+        """Test reset_clients() forces a new client."""
+        client = get_client("key-a")
+        reset_clients()
+        assert get_client("key-a") is not client
+
+    def test_skills_share_client(self) -> None:
+        """Test all skill instances reuse one connection pool."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            risk_identifier = RiskIdentifier()
+            questions_generator = LeadershipQuestionsGenerator()
+            second_risk_identifier = RiskIdentifier()
+
+        assert risk_identifier.client is questions_generator.client
+        assert risk_identifier.client is second_risk_identifier.client
+
+
+class TestResolveClient:
+    """Test suite for resolve_client()."""
+
+    def test_reads_model_from_environment(self) -> None:
+        """Test the configured model is returned with the shared client."""
+        with patch.dict(
+            os.environ, {"OPENAI_API_KEY": "key-a", "OPENAI_MODEL": "gpt-4o"}
+        ):
+            client, model = resolve_client("Owner")
+
+        assert client is get_client("key-a")
+        assert model == "gpt-4o"
+
+    def test_missing_api_key(self) -> None:
+        """Test the owner is named when the API key is missing."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError, match="to use Owner"):
+                resolve_client("Owner")
+
+    def test_skills_have_no_instance_dict(self) -> None:
+        """Test skill instances use __slots__ instead of a per-instance dict."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            skill = RiskIdentifier()
+
+        assert not hasattr(skill, "__dict__")
@@ -0,0 +1,60 @@
+"""Unit tests for decision context formatting."""
+
+import os
+from unittest.mock import patch
+
+from src.modules.governance.skills._context_fmt import format_context
+from src.modules.governance.skills.leadership_questions_generator import (
+    LeadershipQuestionsGenerator,
+)
+from src.modules.governance.skills.risk_identifier import RiskIdentifier
+
+
+class TestFormatContext:
+    """Test suite for format_context()."""
+
+    def test_formats_each_field(self) -> None:
+        """Test each field is rendered on its own line."""
+        result = format_context(
+            {
+                "decision_summary": "Approved loan",
+                "stakeholders": ["applicant", "bank"],
+                "constraints": [],
+                "data_sources": ["credit report"],
+                "risk_factors": ["high DTI"],
+            }
+        )
+
+        assert result == (
+            "Decision Summary: Approved loan\n"
+            "Stakeholders: applicant, bank\n"
+            "Constraints: \n"
+            "Data Sources: credit report\n"
+            "Pre-identified Risk Factors: high DTI"
+        )
+
+    def test_missing_fields(self) -> None:
+        """Test missing fields use defaults and empty risk factors are omitted."""
+        result = format_context({"risk_factors": None})
+
+        assert result.startswith("Decision Summary: Not provided\n")
+        assert "Risk Factors" not in result
+
+    def test_unhashable_values(self) -> None:
+        """Test contexts that cannot be memoized are still formatted."""
+        result = format_context({"decision_summary": ["a", "b"]})
+
+        assert result.startswith("Decision Summary: ['a', 'b']\n")
+
+    def test_skills_share_formatting(self) -> None:
+        """Test both analysis skills describe a context identically."""
+        context = {"decision_summary": "Approved loan", "stakeholders": ["bank"]}
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            risk_prompt = RiskIdentifier().build_user_prompt(
+                {"decision_context": context}
+            )
+            questions_prompt = LeadershipQuestionsGenerator().build_user_prompt(
+                {"decision_context": context}
+            )
+
+        assert risk_prompt == questions_prompt == format_context(context)
@@ -1,5 +1,6 @@
 """Unit tests for DecisionContextExtractor skill."""
 
+import asyncio
 import json
 import os
 from typing import Any, Dict
@@ -7,6 +8,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.modules.governance.skills._llm import response_format
+from src.modules.governance.skills._taxonomy import (
+    EXTRACTION_EXAMPLES,
+    EXTRACTION_SCHEMA,
+)
 from src.modules.governance.skills.decision_context_extractor import (
     DecisionContext,
     DecisionContextExtractor,
@@ -136,15 +142,20 @@ class TestDecisionContextExtractor:
             call_kwargs = mock_openai_client.chat.completions.create.call_args[1]
             assert call_kwargs["model"] == "gpt-4o-mini"
             assert call_kwargs["temperature"] == 0.1
-            assert call_kwargs["response_format"] == {"type": "json_object"}
+            assert call_kwargs["response_format"] == response_format(DecisionContext)
 
             # Verify messages
             messages = call_kwargs["messages"]
-            assert len(messages) == 2
+            assert len(messages) == 3 + 2 * len(EXTRACTION_EXAMPLES)
             assert messages[0]["role"] == "system"
             assert "governance analyst" in messages[0]["content"].lower()
-            assert messages[1]["role"] == "user"
-            assert decision_text in messages[1]["content"]
+            assert messages[1] == {"role": "system", "content": EXTRACTION_SCHEMA}
+            assert [m["role"] for m in messages[2:-1]] == [
+                "user",
+                "assistant",
+            ] * len(EXTRACTION_EXAMPLES)
+            assert messages[-1]["role"] == "user"
+            assert decision_text in messages[-1]["content"]
 
             # Verify output
             assert "context" in result
@@ -176,7 +187,7 @@ class TestDecisionContextExtractor:
 
             # Verify additional context was included in prompt
             call_kwargs = mock_openai_client.chat.completions.create.call_args[1]
-            user_message = call_kwargs["messages"][1]["content"]
+            user_message = call_kwargs["messages"][-1]["content"]
             assert "Additional Context" in user_message
             assert "Customer has been with bank for 10 years" in user_message
 
@@ -329,3 +340,230 @@ class TestDecisionContextExtractor:
             assert context["data_sources"] == []
             assert context["risk_factors"] is None
             assert context["confidence_level"] is None
+
+    @pytest.mark.asyncio
+    async def test_execute_serves_repeat_requests_from_cache(
+        self, mock_openai_client: AsyncMock, mock_openai_response: Dict[str, Any]
+    ) -> None:
+        """Test that an identical request is answered without calling OpenAI."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            skill = DecisionContextExtractor()
+            skill.client = mock_openai_client
+
+            first = await skill.execute({"decision_text": "Test decision"})
+            second = await skill.execute({"decision_text": "Test decision"})
+
+            mock_openai_client.chat.completions.create.assert_called_once()
+            assert second == first
+
+    @pytest.mark.asyncio
+    async def test_execute_evicts_cache_entry_on_schema_drift(
+        self, mock_openai_client: AsyncMock
+    ) -> None:
+        """Test that cached entries failing validation are refetched."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            skill = DecisionContextExtractor()
+            skill.client = mock_openai_client
+
+            await skill.execute({"decision_text": "Test decision"})
+            for entry in skill.cache._entries.values():
+                entry["value"]["context"] = {"unexpected": "shape"}
+
+            result = await skill.execute({"decision_text": "Test decision"})
+
+            assert mock_openai_client.chat.completions.create.call_count == 2
+            assert result["context"]["decision_summary"]
+
+    def test_cache_key_covers_examples_and_schema(self) -> None:
+        """Test that editing the few-shot examples or schema changes the cache key."""
+
+        class FewerExamples(DecisionContextExtractor):
+            _PREFIX = DecisionContextExtractor._PREFIX[:-2]
+
+        class NarrowerContext(DecisionContext):
+            extra_field: str = ""
+
+        class OtherSchema(DecisionContextExtractor):
+            output_schema = NarrowerContext
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            keys = {
+                skill_class()._cache_key("Decision Text:\nApproved")
+                for skill_class in (
+                    DecisionContextExtractor,
+                    FewerExamples,
+                    OtherSchema,
+                )
+            }
+
+        assert len(keys) == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_serves_paraphrases_from_semantic_cache(
+        self, mock_openai_client: AsyncMock
+    ) -> None:
+        """Test that a paraphrased decision reuses the earlier response."""
+        mock_openai_client.embeddings.create = AsyncMock(
+            return_value=MagicMock(data=[MagicMock(embedding=[1.0, 0.0, 0.0])])
+        )
+        with patch.dict(
+            os.environ,
+            {"OPENAI_API_KEY": "test-key", "GOVERNANCE_SEMANTIC_CACHE": "0.9"},
+        ):
+            skill = DecisionContextExtractor()
+            skill.client = mock_openai_client
+
+            first = await skill.execute(
+                {"decision_text": "Approved $400k loan for Acme"}
+            )
+            second = await skill.execute(
+                {"decision_text": "Loan approval: $400,000 to Acme"}
+            )
+
+            mock_openai_client.chat.completions.create.assert_called_once()
+            assert second == first
+
+    @pytest.mark.asyncio
+    async def test_execute_semantic_cache_lookup_runs_off_loop(
+        self, mock_openai_client: AsyncMock
+    ) -> None:
+        """Test that the semantic cache is scanned in a worker thread."""
+        mock_openai_client.embeddings.create = AsyncMock(
+            return_value=MagicMock(data=[MagicMock(embedding=[1.0, 0.0, 0.0])])
+        )
+        with patch.dict(
+            os.environ,
+            {"OPENAI_API_KEY": "test-key", "GOVERNANCE_SEMANTIC_CACHE": "0.9"},
+        ):
+            skill = DecisionContextExtractor()
+            skill.client = mock_openai_client
+
+            with patch(
+                "src.modules.governance.skills.decision_context_extractor"
+                ".asyncio.to_thread",
+                wraps=asyncio.to_thread,
+            ) as to_thread:
+                await skill.execute({"decision_text": "Approved $400k loan for Acme"})
+
+            to_thread.assert_called_once()
+            assert to_thread.call_args.args[0] == skill.semantic_cache.get
+
+    @pytest.mark.asyncio
+    async def test_execute_semantic_cache_rejects_different_amounts(
+        self, mock_openai_client: AsyncMock
+    ) -> None:
+        """Test that similar decisions with different figures are not reused."""
+        mock_openai_client.embeddings.create = AsyncMock(
+            return_value=MagicMock(data=[MagicMock(embedding=[1.0, 0.0, 0.0])])
+        )
+        with patch.dict(
+            os.environ,
+            {"OPENAI_API_KEY": "test-key", "GOVERNANCE_SEMANTIC_CACHE": "0.9"},
+        ):
+            skill = DecisionContextExtractor()
+            skill.client = mock_openai_client
+
+            await skill.execute({"decision_text": "Approved $400k loan for Acme"})
+            await skill.execute({"decision_text": "Approved $40k loan for Acme"})
+
+            assert mock_openai_client.chat.completions.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_semantic_cache_evicts_invalid_entries(
+        self, mock_openai_client: AsyncMock
+    ) -> None:
+        """Test that semantic cache entries failing validation are refetched."""
+        mock_openai_client.embeddings.create = AsyncMock(
+            return_value=MagicMock(data=[MagicMock(embedding=[1.0, 0.0, 0.0])])
+        )
+        with patch.dict(
+            os.environ,
+            {"OPENAI_API_KEY": "test-key", "GOVERNANCE_SEMANTIC_CACHE": "0.9"},
+        ):
+            skill = DecisionContextExtractor()
+            skill.client = mock_openai_client
+
+            await skill.execute({"decision_text": "Approved $400k loan for Acme"})
+            for entry in skill.semantic_cache._entries:
+                entry.value["context"] = {"unexpected": "shape"}
+
+            result = await skill.execute(
+                {"decision_text": "Loan approval: $400,000 to Acme"}
+            )
+
+            assert mock_openai_client.chat.completions.create.call_count == 2
+            assert result["context"]["decision_summary"]
+            assert all(
+                "decision_summary" in entry.value["context"]
+                for entry in skill.semantic_cache._entries
+            )
+
+    @pytest.mark.asyncio
+    async def test_execute_semantic_cache_skipped_on_embedding_timeout(
+        self, mock_openai_client: AsyncMock
+    ) -> None:
+        """Test that a slow embedding request falls through to the completion."""
+
+        async def slow_embedding(**kwargs: Any) -> MagicMock:
+            await asyncio.sleep(10)
+            return MagicMock()
+
+        mock_openai_client.embeddings.create = AsyncMock(side_effect=slow_embedding)
+        with patch.dict(
+            os.environ,
+            {
+                "OPENAI_API_KEY": "test-key",
+                "GOVERNANCE_SEMANTIC_CACHE": "0.9",
+                "OPENAI_TIMEOUT_S": "0.05",
+            },
+        ):
+            skill = DecisionContextExtractor()
+            skill.client = mock_openai_client
+
+            result = await skill.execute({"decision_text": "Test decision"})
+
+            assert "degraded" not in result
+            mock_openai_client.chat.completions.create.assert_called_once()
+            assert len(skill.semantic_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_execute_stream_uses_semantic_cache(
+        self, mock_openai_client: AsyncMock
+    ) -> None:
+        """Test that streaming serves paraphrases as execute() does."""
+        mock_openai_client.embeddings.create = AsyncMock(
+            return_value=MagicMock(data=[MagicMock(embedding=[1.0, 0.0, 0.0])])
+        )
+        with patch.dict(
+            os.environ,
+            {"OPENAI_API_KEY": "test-key", "GOVERNANCE_SEMANTIC_CACHE": "0.9"},
+        ):
+            skill = DecisionContextExtractor()
+            skill.client = mock_openai_client
+
+            first = await skill.execute(
+                {"decision_text": "Approved $400k loan for Acme"}
+            )
+            events = [
+                event
+                async for event in skill.execute_stream(
+                    {"decision_text": "Loan approval: $400,000 to Acme"}
+                )
+            ]
+
+            mock_openai_client.chat.completions.create.assert_called_once()
+            assert events == [{"type": "result", "output": first}]
+
+    @pytest.mark.asyncio
+    async def test_execute_semantic_cache_disabled_by_default(
+        self, mock_openai_client: AsyncMock
+    ) -> None:
+        """Test that no embeddings are requested unless enabled."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            skill = DecisionContextExtractor()
+            skill.client = mock_openai_client
+
+            await skill.execute({"decision_text": "Test decision"})
+
+            assert skill.semantic_cache is None
+            mock_openai_client.embeddings.create.assert_not_called()
@@ -1,7 +1,12 @@
 """Tests for custom error classes."""
 
+import pickle
+from unittest.mock import patch
+
+import pytest
 from pydantic import BaseModel, ValidationError
 
+from src.playbooks import errors
 from src.playbooks.errors import (
     CheckpointError,
     InvalidInputError,
@@ -56,6 +61,44 @@ class TestSkillNotFoundError:
         assert "add_numbers" in error_msg
         assert "multiply_numbers" in error_msg
 
+    def test_error_message_truncates_long_skill_lists(self):
+        """Test only the first skills alphabetically are listed."""
+        available_skills = [f"skill_{i:03d}" for i in reversed(range(120))]
+
+        error_msg = str(
+            SkillNotFoundError(
+                skill_name="missing",
+                step_name="step",
+                available_skills=available_skills,
+                playbook_name="playbook",
+            )
+        )
+
+        assert "Available skills (120):" in error_msg
+        assert "  - skill_000\n" in error_msg
+        assert "  - skill_049\n" in error_msg
+        assert "skill_050" not in error_msg
+        assert "  ... and 70 more\n" in error_msg
+
+    def test_suggestions_without_rapidfuzz(self):
+        """Test difflib provides suggestions when rapidfuzz is missing."""
+        with patch.object(errors, "process", None):
+            error = SkillNotFoundError(
+                "ad_numbers", "step", ["add_numbers", "subtract"], "playbook"
+            )
+
+            assert "Did you mean one of these?\n  - add_numbers\n" in str(error)
+
+    def test_suggestions_with_rapidfuzz(self):
+        """Test rapidfuzz suggestions rank the closest names first."""
+        pytest.importorskip("rapidfuzz")
+        available_skills = ["multiply_numbers", "add_number", "add_numbers", "zzz"]
+
+        suggestions = errors._close_matches("ad_numbers", available_skills)
+
+        assert suggestions[:2] == ["add_numbers", "add_number"]
+        assert "zzz" not in suggestions
+
 
 class TestTemplateError:
     """Test TemplateError."""
@@ -245,6 +288,58 @@ class TestInvalidInputError:
             assert error.validation_error == e
             assert error.schema == TestSchema
 
+    def _message(self, input_data):
+        """Build the message of an InvalidInputError for the given input."""
+
+        class TestSchema(BaseModel):
+            required_field: str
+
+        try:
+            TestSchema(**input_data)
+        except ValidationError as e:
+            return str(
+                InvalidInputError(
+                    skill_name="test",
+                    schema=TestSchema,
+                    input_data=input_data,
+                    validation_error=e,
+                )
+            )
+
+    def test_error_message_abbreviates_large_containers(self):
+        """Test large container inputs show only their first few items."""
+        error_msg = self._message(
+            {
+                "values": list(range(100_000)),
+                "mapping": {f"k{i}": i for i in range(100_000)},
+            }
+        )
+
+        assert "  values: [0, 1, 2, 3, 4, ...]\n" in error_msg
+        assert (
+            "  mapping: {'k0': 0, 'k1': 1, 'k2': 2, 'k3': 3, 'k4': 4, ...}\n"
+            in error_msg
+        )
+
+    def test_error_message_bounds_nested_container_previews(self):
+        """Test previewing a deeply nested input visits only a few of its values."""
+        visited = []
+
+        class Leaf:
+            def __repr__(self):
+                visited.append(self)
+                return "leaf"
+
+        nested = {
+            i: {j: {k: Leaf() for k in range(70)} for j in range(70)} for i in range(70)
+        }
+
+        error_msg = self._message({"nested": nested})
+
+        (line,) = [line for line in error_msg.splitlines() if "nested:" in line]
+        assert len(line) <= len("  nested: ") + 100
+        assert len(visited) <= 5**3
+
 
 class TestCheckpointError:
     """Test CheckpointError."""
@@ -280,3 +375,69 @@ class TestCheckpointError:
         assert "load" in error_msg
         assert "xyz-789" in error_msg
         assert "FileNotFoundError" in error_msg
+
+
+class TestLazyMessages:
+    """Test detailed messages are built on demand."""
+
+    def test_message_built_once_on_first_str(self):
+        """Test constructing an error does not format its message."""
+        with patch.object(
+            SkillNotFoundError,
+            "_build_message",
+            autospec=True,
+            return_value="message",
+        ) as build_message:
+            error = SkillNotFoundError("missing", "step", ["a", "b"], "playbook")
+            assert build_message.call_count == 0
+
+            assert str(error) == "message"
+            assert str(error) == "message"
+            assert build_message.call_count == 1
+
+    def test_repr_includes_message(self):
+        """Test repr shows the detailed message, not the raw arguments."""
+        error = CheckpointError("save", "exec-1", OSError("disk full"))
+
+        assert repr(error) == f"CheckpointError({str(error)!r})"
+
+    def test_errors_pickle(self):
+        """Test errors survive a pickle round trip with their message."""
+        error = SkillExecutionError(
+            skill_name="adder",
+            step_name="add",
+            input_data={"a": 1},
+            original_error=ValueError("bad"),
+            reasoning="because",
+        )
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert str(restored) == str(error)
+        assert restored.step_name == "add"
+
+    def test_message_describes_inputs_when_raised(self):
+        """Test changes made to the inputs after raising do not reach the message."""
+        variables = {"company": "Acme"}
+        error = TemplateError(
+            template_str="{{ missing }}",
+            error=ValueError("undefined"),
+            step_name="render",
+            field_name="name",
+            available_vars=variables,
+        )
+
+        variables["added_later"] = 1
+        variables["company"] = "Other"
+
+        assert "added_later" not in str(error)
+        assert "company: Acme" in str(error)
+
+    def test_detailed_errors_must_build_a_message(self):
+        """Test a detailed error without _build_message() cannot be created."""
+
+        class Incomplete(errors._DetailedError):
+            pass
+
+        with pytest.raises(TypeError, match="_build_message"):
+            Incomplete()
@@ -0,0 +1,171 @@
+"""Unit tests for BatchGovernanceRunner."""
+
+import json
+import os
+from typing import Any, Dict, Iterator, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.modules.governance import BatchGovernanceRunner
+
+CONTEXT_RESPONSE = {
+    "decision_summary": "Approved $400k loan",
+    "stakeholders": ["applicant", "bank"],
+}
+
+
+def output_line(custom_id: str, content: str, status_code: int = 200) -> str:
+    """Create one line of a Batch API output file."""
+    return json.dumps(
+        {
+            "custom_id": custom_id,
+            "response": {
+                "status_code": status_code,
+                "body": {"choices": [{"message": {"content": content}}]},
+            },
+            "error": None,
+        }
+    )
+
+
+@pytest.fixture
+def mock_client() -> AsyncMock:
+    """Create a mock OpenAI client with a batch that completes on first poll."""
+    client = AsyncMock()
+    client.files.create = AsyncMock(return_value=MagicMock(id="file-in"))
+    client.batches.create = AsyncMock(
+        return_value=MagicMock(id="batch-1", status="validating")
+    )
+    client.batches.retrieve = AsyncMock(
+        return_value=MagicMock(
+            id="batch-1",
+            status="completed",
+            output_file_id="file-out",
+            error_file_id=None,
+        )
+    )
+    return client
+
+
+@pytest.fixture
+def runner(mock_client: AsyncMock) -> Iterator[BatchGovernanceRunner]:
+    """Create a runner using the mock client."""
+    with (
+        patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
+        patch(
+            "src.modules.governance.skills._client.AsyncOpenAI",
+            return_value=mock_client,
+        ),
+    ):
+        yield BatchGovernanceRunner(poll_interval=0)
+
+
+def set_output(mock_client: AsyncMock, lines: List[str]) -> None:
+    """Set the content of the batch output file."""
+    mock_client.files.content = AsyncMock(
+        return_value=MagicMock(text="\n".join(lines) + "\n")
+    )
+
+
+class TestBatchGovernanceRunner:
+    """Test suite for BatchGovernanceRunner."""
+
+    def test_missing_api_key(self) -> None:
+        """Test that the runner requires an API key."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError, match="OPENAI_API_KEY"):
+                BatchGovernanceRunner()
+
+    def test_add_unknown_skill(self, runner: BatchGovernanceRunner) -> None:
+        """Test that unknown skills are rejected."""
+        with pytest.raises(ValueError, match="Unknown governance skill"):
+            runner.add("no_such_skill", {})
+
+    def test_add_validates_input(self, runner: BatchGovernanceRunner) -> None:
+        """Test that invalid input is rejected when queued."""
+        with pytest.raises(ValueError, match="decision_context is required"):
+            runner.add("risk_identifier", {})
+
+    def test_to_jsonl_matches_live_requests(
+        self, runner: BatchGovernanceRunner
+    ) -> None:
+        """Test the batch body matches what the live skill would send."""
+        runner.add("decision_context_extractor", {"decision_text": "Loan approved"})
+
+        lines = runner.to_jsonl().splitlines()
+        request: Dict[str, Any] = json.loads(lines[0])
+
+        assert len(lines) == 1
+        assert request["custom_id"] == "request-0"
+        assert request["url"] == "/v1/chat/completions"
+        body = request["body"]
+        assert body["temperature"] == 0.1
+        assert body["response_format"]["json_schema"]["name"] == "DecisionContext"
+        assert [m["role"] for m in body["messages"][:2]] == ["system", "system"]
+        assert body["messages"][-1]["role"] == "user"
+        assert "Loan approved" in body["messages"][-1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_run(
+        self, runner: BatchGovernanceRunner, mock_client: AsyncMock
+    ) -> None:
+        """Test a batch is submitted, polled and parsed."""
+        runner.add("decision_context_extractor", {"decision_text": "Loan approved"})
+        runner.add("decision_context_extractor", {"decision_text": "Loan denied"})
+        set_output(
+            mock_client,
+            [
+                output_line("request-1", "Not valid JSON"),
+                output_line("request-0", json.dumps(CONTEXT_RESPONSE)),
+            ],
+        )
+
+        results = await runner.run()
+
+        mock_client.batches.create.assert_called_once()
+        assert mock_client.batches.create.call_args.kwargs["completion_window"] == (
+            "24h"
+        )
+        assert [r.custom_id for r in results] == ["request-0", "request-1"]
+        assert results[0].success
+        assert results[0].output is not None
+        assert results[0].output["context"]["decision_summary"] == (
+            "Approved $400k loan"
+        )
+        assert not results[1].success
+        assert results[1].error is not None
+        assert "Failed to parse LLM response" in results[1].error
+
+    @pytest.mark.asyncio
+    async def test_run_reports_missing_and_failed_requests(
+        self, runner: BatchGovernanceRunner, mock_client: AsyncMock
+    ) -> None:
+        """Test requests without a successful response are reported as errors."""
+        runner.add("decision_context_extractor", {"decision_text": "A"})
+        runner.add("decision_context_extractor", {"decision_text": "B"})
+        set_output(mock_client, [output_line("request-0", "{}", status_code=500)])
+
+        results = await runner.run()
+
+        assert results[0].error is not None
+        assert results[1].error == "No response in batch output"
+
+    @pytest.mark.asyncio
+    async def test_run_failed_batch(
+        self, runner: BatchGovernanceRunner, mock_client: AsyncMock
+    ) -> None:
+        """Test a failed batch raises."""
+        runner.add("decision_context_extractor", {"decision_text": "A"})
+        mock_client.batches.retrieve = AsyncMock(
+            return_value=MagicMock(id="batch-1", status="failed")
+        )
+
+        with pytest.raises(RuntimeError, match="batch-1 failed"):
+            await runner.run()
+
+    @pytest.mark.asyncio
+    async def test_run_empty(self, runner: BatchGovernanceRunner) -> None:
+        """Test running with nothing queued raises."""
+        with pytest.raises(ValueError, match="No requests queued"):
+            await runner.run()
@@ -0,0 +1,231 @@
+"""Unit tests for concurrent governance analysis."""
+
+import asyncio
+import json
+import os
+from typing import Any, AsyncIterator, Dict
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.modules.governance import RiskIdentifier, analyze, audit
+
+RISK_RESPONSE = {
+    "risks": [
+        {
+            "severity": "high",
+            "description": "Default risk",
+            "category": "business",
+            "likelihood": "medium",
+        }
+    ],
+    "overall_risk_level": "high",
+    "recommended_actions": ["Require collateral"],
+    "confidence_level": "high",
+}
+
+EXTRACTION_RESPONSE = json.dumps(
+    {
+        "decision_summary": "Approved $400k loan",
+        "stakeholders": ["applicant", "bank"],
+        "constraints": [],
+        "data_sources": ["credit report"],
+        "risk_factors": ["high debt-to-income ratio"],
+        "confidence_level": "high",
+    }
+)
+
+QUESTIONS_RESPONSE = {
+    "strategic_questions": ["Q1"],
+    "ethical_questions": ["Q2"],
+    "operational_questions": ["Q3"],
+}
+
+
+@pytest.fixture
+def decision_context() -> Dict[str, Any]:
+    """Create a decision context."""
+    return {
+        "decision_summary": "Approved $400k loan",
+        "stakeholders": ["applicant", "bank"],
+        "risk_factors": ["high debt-to-income ratio"],
+    }
+
+
+class FakeCompletions:
+    """Fake chat.completions endpoint that records call overlap."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls: list = []
+        self.delays = {"risk": 0.01, "questions": 0.01}
+        self.cancelled: list = []
+        self.extraction = EXTRACTION_RESPONSE
+        self.extraction_stall = 0.0
+        self.log: list = []
+
+    async def create(self, **kwargs: Any) -> Any:
+        self.calls.append(kwargs)
+        if "governance analyst" in kwargs["messages"][0]["content"]:
+            return self._stream(self.extraction)
+        kind = (
+            "risk"
+            if "risk assessment" in kwargs["messages"][0]["content"]
+            else "questions"
+        )
+        self.log.append(kind)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays[kind])
+        except asyncio.CancelledError:
+            self.cancelled.append(kind)
+            raise
+        finally:
+            self.in_flight -= 1
+
+        if kind == "risk":
+            content = json.dumps(RISK_RESPONSE)
+        else:
+            content = json.dumps(QUESTIONS_RESPONSE)
+        completion = MagicMock()
+        completion.choices = [MagicMock(message=MagicMock(content=content))]
+        return completion
+
+    async def _stream(self, document: str) -> AsyncIterator[MagicMock]:
+        for i in range(0, len(document), 16):
+            await asyncio.sleep(0.01 if i == 0 else 0.01 + self.extraction_stall)
+            chunk = MagicMock()
+            chunk.choices = [MagicMock(delta=MagicMock(content=document[i : i + 16]))]
+            yield chunk
+        self.log.append("extraction_done")
+
+
+@pytest.fixture
+def fake_completions() -> FakeCompletions:
+    """Patch both skills to use a shared fake OpenAI client."""
+    completions = FakeCompletions()
+    client = MagicMock()
+    client.chat.completions = completions
+    with (
+        patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
+        patch(
+            "src.modules.governance.skills._client.AsyncOpenAI",
+            return_value=client,
+        ),
+    ):
+        yield completions
+
+
+class TestAnalyze:
+    """Test suite for analyze()."""
+
+    @pytest.mark.asyncio
+    async def test_runs_skills_concurrently(
+        self, decision_context: Dict[str, Any], fake_completions: FakeCompletions
+    ) -> None:
+        """Test risk and question generation overlap."""
+        result = await analyze(decision_context)
+
+        assert fake_completions.max_in_flight == 2
+        assert result["risk_analysis"]["analysis"]["overall_risk_level"] == "high"
+        assert result["leadership_review"]["questions"]["strategic_questions"] == ["Q1"]
+        assert len(result["traces"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_questions_use_risk_runs_in_two_stages(
+        self, decision_context: Dict[str, Any], fake_completions: FakeCompletions
+    ) -> None:
+        """Test the risk analysis is fed into question generation."""
+        await analyze(decision_context, questions_use_risk=True)
+
+        assert fake_completions.max_in_flight == 1
+        questions_prompt = fake_completions.calls[1]["messages"][-1]["content"]
+        assert "Overall Risk Level: high" in questions_prompt
+
+    @pytest.mark.asyncio
+    async def test_slow_skill_degrades_without_failing_sibling(
+        self, decision_context: Dict[str, Any], fake_completions: FakeCompletions
+    ) -> None:
+        """Test a timed-out skill returns a degraded output alongside the other."""
+        fake_completions.delays["risk"] = 10
+        with patch.dict(os.environ, {"OPENAI_TIMEOUT_S": "0.05"}):
+            result = await analyze(decision_context)
+
+        assert result["risk_analysis"]["degraded"] is True
+        assert result["risk_analysis"]["analysis"]["confidence_level"] == "low"
+        assert "degraded" not in result["leadership_review"]
+        assert result["leadership_review"]["questions"]["strategic_questions"] == ["Q1"]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_sibling(
+        self, decision_context: Dict[str, Any], fake_completions: FakeCompletions
+    ) -> None:
+        """Test a failing skill cancels the other and raises its own error."""
+        fake_completions.delays["questions"] = 10
+        fake_completions.delays["risk"] = 0
+
+        with patch.object(
+            RiskIdentifier,
+            "build_user_prompt",
+            side_effect=ValueError("bad context"),
+        ):
+            with pytest.raises(ValueError, match="bad context"):
+                await analyze(decision_context)
+
+        assert fake_completions.cancelled == ["questions"]
+
+
+class TestAudit:
+    """Test suite for audit()."""
+
+    @pytest.mark.asyncio
+    async def test_analysis_starts_before_extraction_finishes(
+        self, fake_completions: FakeCompletions
+    ) -> None:
+        """Test analysis is speculatively started from the streamed context."""
+        result = await audit({"decision_text": "Approved a $400k loan"})
+
+        log = fake_completions.log
+        assert log.index("risk") < log.index("extraction_done")
+        assert log.index("questions") < log.index("extraction_done")
+        assert log.count("risk") == 1
+        assert result["extraction"]["context"]["confidence_level"] == "high"
+        assert result["risk_analysis"]["analysis"]["overall_risk_level"] == "high"
+        assert result["leadership_review"]["questions"]["strategic_questions"] == ["Q1"]
+
+    @pytest.mark.asyncio
+    async def test_mismatched_speculation_is_rerun(
+        self, fake_completions: FakeCompletions
+    ) -> None:
+        """Test analysis reruns when the final context differs from the guess."""
+        # A repeated key overrides the value the speculation started from
+        fake_completions.extraction = EXTRACTION_RESPONSE[:-1] + (
+            ', "decision_summary": "Declined $400k loan"}'
+        )
+
+        result = await audit({"decision_text": "Declined a $400k loan"})
+
+        assert fake_completions.log.count("risk") == 2
+        assert result["extraction"]["context"]["decision_summary"] == (
+            "Declined $400k loan"
+        )
+        risk_prompt = fake_completions.calls[-1]["messages"][-1]["content"]
+        assert "Decision Summary: Declined $400k loan" in risk_prompt
+
+    @pytest.mark.asyncio
+    async def test_stalled_extraction_degrades(
+        self, fake_completions: FakeCompletions
+    ) -> None:
+        """Test a stream that stops producing chunks ends in a degraded extraction."""
+        fake_completions.extraction_stall = 10
+        with patch.dict(os.environ, {"OPENAI_TIMEOUT_S": "0.2"}):
+            result = await asyncio.wait_for(
+                audit({"decision_text": "Approved a $400k loan"}), timeout=5
+            )
+
+        assert result["extraction"]["degraded"] is True
+        assert result["extraction"]["context"]["confidence_level"] == "low"
+        assert "extraction_done" not in fake_completions.log
+        assert result["risk_analysis"]["analysis"]["overall_risk_level"] == "high"
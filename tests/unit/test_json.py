@@ -0,0 +1,72 @@
+"""Unit tests for playbook JSON encoding."""
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.playbooks import _json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request: pytest.FixtureRequest) -> str:
+    """Run a test with and without orjson."""
+    if request.param == "stdlib":
+        with patch.object(_json, "orjson", None):
+            yield request.param
+    else:
+        if _json.orjson is None:
+            pytest.skip("orjson not installed")
+        yield request.param
+
+
+class TestDumps:
+    """Test suite for _json.dumps()."""
+
+    def test_round_trips(self, encoder: str) -> None:
+        """Test compact and indented output decode to the input."""
+        data = {"name": "café", "values": [1, 2.5, None, True], 1: "int key"}
+
+        for indent in (None, 2):
+            encoded = _json.dumps(data, indent=indent)
+            assert isinstance(encoded, bytes)
+            assert json.loads(encoded) == json.loads(json.dumps(data))
+
+    def test_datetimes_use_default(self, encoder: str) -> None:
+        """Test datetimes go through default, matching the stdlib encoder."""
+        moment = datetime(2024, 1, 2, 3, 4, 5)
+
+        encoded = _json.dumps({"at": moment}, default=str)
+
+        assert json.loads(encoded) == {"at": str(moment)}
+
+    def test_unencodable_value_raises_type_error(self, encoder: str) -> None:
+        """Test values without a default raise TypeError."""
+        with pytest.raises(TypeError):
+            _json.dumps({"at": datetime(2024, 1, 1)})
+
+    def test_sort_keys_is_canonical(self, encoder: str) -> None:
+        """Test sort_keys encodes equal dicts identically regardless of order."""
+        first = _json.dumps({"b": 1, "a": {"d": 2, "c": 3}}, sort_keys=True)
+        second = _json.dumps({"a": {"c": 3, "d": 2}, "b": 1}, sort_keys=True)
+
+        assert first == second
+
+    def test_large_integers_fall_back_to_stdlib(self, encoder: str) -> None:
+        """Test integers beyond 64 bits are still encoded."""
+        assert json.loads(_json.dumps({"n": 2**70})) == {"n": 2**70}
+
+
+class TestLoads:
+    """Test suite for _json.loads()."""
+
+    def test_decodes_bytes_and_str(self, encoder: str) -> None:
+        """Test both bytes and str documents are decoded."""
+        assert _json.loads(b'{"a": [1]}') == {"a": [1]}
+        assert _json.loads('{"a": [1]}') == {"a": [1]}
+
+    def test_invalid_json_raises_json_decode_error(self, encoder: str) -> None:
+        """Test invalid input raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            _json.loads(b"{not json")
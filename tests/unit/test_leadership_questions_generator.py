@@ -171,7 +171,7 @@ class TestLeadershipQuestionsGenerator:
         with (
             patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
             patch(
-                "src.modules.governance.skills.leadership_questions_generator.AsyncOpenAI",
+                "src.modules.governance.skills._client.AsyncOpenAI",
                 return_value=mock_openai_client,
             ),
         ):
@@ -198,7 +198,7 @@ class TestLeadershipQuestionsGenerator:
         with (
             patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
             patch(
-                "src.modules.governance.skills.leadership_questions_generator.AsyncOpenAI",
+                "src.modules.governance.skills._client.AsyncOpenAI",
                 return_value=mock_openai_client,
             ),
         ):
@@ -214,7 +214,7 @@ class TestLeadershipQuestionsGenerator:
             # Verify OpenAI was called with context including risk analysis
             mock_openai_client.chat.completions.create.assert_called_once()
             call_args = mock_openai_client.chat.completions.create.call_args
-            user_content = call_args.kwargs["messages"][1]["content"]
+            user_content = call_args.kwargs["messages"][-1]["content"]
             assert "Overall Risk Level: high" in user_content
             assert "High/Critical Risks:" in user_content
 
@@ -226,7 +226,7 @@ class TestLeadershipQuestionsGenerator:
         with (
             patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
             patch(
-                "src.modules.governance.skills.leadership_questions_generator.AsyncOpenAI",
+                "src.modules.governance.skills._client.AsyncOpenAI",
                 return_value=mock_openai_client,
             ),
         ):
@@ -243,7 +243,7 @@ class TestLeadershipQuestionsGenerator:
         with (
             patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
             patch(
-                "src.modules.governance.skills.leadership_questions_generator.AsyncOpenAI",
+                "src.modules.governance.skills._client.AsyncOpenAI",
                 return_value=mock_openai_client,
             ),
         ):
@@ -255,7 +255,7 @@ class TestLeadershipQuestionsGenerator:
             assert "questions" in output
             # Verify it handles missing optional fields gracefully
             call_args = mock_openai_client.chat.completions.create.call_args
-            user_content = call_args.kwargs["messages"][1]["content"]
+            user_content = call_args.kwargs["messages"][-1]["content"]
             assert "Decision Summary: Test" in user_content
 
     @pytest.mark.asyncio
@@ -272,7 +272,7 @@ class TestLeadershipQuestionsGenerator:
         with (
             patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
             patch(
-                "src.modules.governance.skills.leadership_questions_generator.AsyncOpenAI",
+                "src.modules.governance.skills._client.AsyncOpenAI",
                 return_value=mock_client,
             ),
         ):
@@ -303,7 +303,7 @@ class TestLeadershipQuestionsGenerator:
         with (
             patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
             patch(
-                "src.modules.governance.skills.leadership_questions_generator.AsyncOpenAI",
+                "src.modules.governance.skills._client.AsyncOpenAI",
                 return_value=mock_client,
             ),
         ):
@@ -324,7 +324,7 @@ class TestLeadershipQuestionsGenerator:
         with (
             patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
             patch(
-                "src.modules.governance.skills.leadership_questions_generator.AsyncOpenAI",
+                "src.modules.governance.skills._client.AsyncOpenAI",
                 return_value=mock_openai_client,
             ),
         ):
@@ -347,7 +347,7 @@ class TestLeadershipQuestionsGenerator:
         with (
             patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
             patch(
-                "src.modules.governance.skills.leadership_questions_generator.AsyncOpenAI",
+                "src.modules.governance.skills._client.AsyncOpenAI",
                 return_value=mock_openai_client,
             ),
         ):
@@ -355,7 +355,7 @@ class TestLeadershipQuestionsGenerator:
             await skill.run({"decision_context": mock_decision_context})
 
             call_args = mock_openai_client.chat.completions.create.call_args
-            user_content = call_args.kwargs["messages"][1]["content"]
+            user_content = call_args.kwargs["messages"][-1]["content"]
             assert "Risk Factors:" in user_content
             assert "high debt-to-income ratio" in user_content
             assert "new business venture" in user_content
@@ -371,7 +371,7 @@ class TestLeadershipQuestionsGenerator:
         with (
             patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
             patch(
-                "src.modules.governance.skills.leadership_questions_generator.AsyncOpenAI",
+                "src.modules.governance.skills._client.AsyncOpenAI",
                 return_value=mock_openai_client,
             ),
         ):
@@ -384,7 +384,7 @@ class TestLeadershipQuestionsGenerator:
             )
 
             call_args = mock_openai_client.chat.completions.create.call_args
-            user_content = call_args.kwargs["messages"][1]["content"]
+            user_content = call_args.kwargs["messages"][-1]["content"]
             assert "High/Critical Risks:" in user_content
             assert "[high]" in user_content
             assert "High debt-to-income ratio increases default risk" in user_content
@@ -397,7 +397,7 @@ class TestLeadershipQuestionsGenerator:
         with (
             patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
             patch(
-                "src.modules.governance.skills.leadership_questions_generator.AsyncOpenAI",
+                "src.modules.governance.skills._client.AsyncOpenAI",
                 return_value=mock_openai_client,
             ),
         ):
@@ -406,4 +406,28 @@ class TestLeadershipQuestionsGenerator:
 
             call_args = mock_openai_client.chat.completions.create.call_args
             assert call_args.kwargs["temperature"] == 0.3
-            assert call_args.kwargs["response_format"] == {"type": "json_object"}
+            assert call_args.kwargs["response_format"]["type"] == "json_schema"
+            assert call_args.kwargs["response_format"]["json_schema"]["strict"]
+
+    @pytest.mark.asyncio
+    async def test_execute_uses_stable_cacheable_prefix(
+        self, mock_decision_context: Dict[str, Any], mock_openai_client: AsyncMock
+    ) -> None:
+        """Test that only the user message varies between decisions."""
+        with (
+            patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
+            patch(
+                "src.modules.governance.skills._client.AsyncOpenAI",
+                return_value=mock_openai_client,
+            ),
+        ):
+            skill = LeadershipQuestionsGenerator()
+            await skill.run({"decision_context": mock_decision_context})
+            await skill.run({"decision_context": {"decision_summary": "Other"}})
+
+            first, second = mock_openai_client.chat.completions.create.call_args_list
+            assert first.kwargs["messages"][:-1] == second.kwargs["messages"][:-1]
+            assert first.kwargs["messages"][-1] != second.kwargs["messages"][-1]
+            assert first.kwargs["extra_body"] == {
+                "prompt_cache_key": "governance:leadership_questions_generator:v1.0.0"
+            }
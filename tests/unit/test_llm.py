@@ -0,0 +1,280 @@
+"""Unit tests for structured JSON completions."""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel, Field
+
+from src.modules.governance.skills._llm import (
+    ArrayItemScanner,
+    build_messages,
+    build_prefix,
+    complete_json,
+    response_format,
+    stream_json,
+    strict_json_schema,
+)
+
+
+class Answer(BaseModel):
+    """Schema used by the tests."""
+
+    answer: str
+
+
+def make_completion(content: str) -> MagicMock:
+    """Create a mock chat completion."""
+    completion = MagicMock()
+    completion.choices = [MagicMock(message=MagicMock(content=content))]
+    return completion
+
+
+def make_client(*contents: str) -> AsyncMock:
+    """Create a mock client returning the given responses in order."""
+    client = AsyncMock()
+    client.chat.completions.create = AsyncMock(
+        side_effect=[make_completion(content) for content in contents]
+    )
+    return client
+
+
+MESSAGES = [
+    {"role": "system", "content": "Answer in JSON."},
+    {"role": "user", "content": "Question"},
+]
+
+
+class TestCompleteJson:
+    """Test suite for complete_json()."""
+
+    @pytest.mark.asyncio
+    async def test_valid_first_response(self) -> None:
+        """Test a valid response is returned without retrying."""
+        client = make_client(json.dumps({"answer": "42"}))
+
+        result, raw = await complete_json(
+            client,
+            model="gpt-4o-mini",
+            messages=MESSAGES,
+            schema=Answer,
+            temperature=0.1,
+            prompt_cache_key="test",
+        )
+
+        assert result.answer == "42"
+        assert raw == '{"answer": "42"}'
+        assert client.chat.completions.create.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_with_validation_feedback(self) -> None:
+        """Test an invalid response is sent back with the error for correction."""
+        client = make_client("Not valid JSON", json.dumps({"answer": "42"}))
+
+        result, _ = await complete_json(
+            client,
+            model="gpt-4o-mini",
+            messages=MESSAGES,
+            schema=Answer,
+            temperature=0.1,
+            prompt_cache_key="test",
+        )
+
+        assert result.answer == "42"
+        retry_messages = client.chat.completions.create.call_args_list[1].kwargs[
+            "messages"
+        ]
+        assert retry_messages[:2] == MESSAGES
+        assert retry_messages[2] == {"role": "assistant", "content": "Not valid JSON"}
+        assert retry_messages[3]["role"] == "user"
+        assert "Your output had error" in retry_messages[3]["content"]
+        # Caller's messages are left untouched
+        assert len(MESSAGES) == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self) -> None:
+        """Test ValueError is raised once all attempts fail validation."""
+        client = make_client("{}", "{}", "{}")
+
+        with pytest.raises(ValueError, match="Failed to parse LLM response"):
+            await complete_json(
+                client,
+                model="gpt-4o-mini",
+                messages=MESSAGES,
+                schema=Answer,
+                temperature=0.1,
+                prompt_cache_key="test",
+            )
+
+        assert client.chat.completions.create.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_timeout_bounds_all_attempts(self) -> None:
+        """Test TimeoutError is raised once the time budget is spent."""
+
+        async def slow_create(**kwargs: Any) -> MagicMock:
+            await asyncio.sleep(10)
+            return make_completion("{}")
+
+        client = AsyncMock()
+        client.chat.completions.create = AsyncMock(side_effect=slow_create)
+
+        with pytest.raises(TimeoutError):
+            await complete_json(
+                client,
+                model="gpt-4o-mini",
+                messages=MESSAGES,
+                schema=Answer,
+                temperature=0.1,
+                prompt_cache_key="test",
+                timeout=0.01,
+            )
+
+        assert client.chat.completions.create.call_args.kwargs["timeout"] == 0.01
+
+
+class TestStreamJson:
+    """Test suite for stream_json()."""
+
+    @pytest.mark.asyncio
+    async def test_timeout_bounds_stalled_stream(self) -> None:
+        """Test TimeoutError is raised when the stream stops producing chunks."""
+
+        async def stalled_stream() -> AsyncIterator[MagicMock]:
+            yield MagicMock(choices=[MagicMock(delta=MagicMock(content='{"a'))])
+            await asyncio.sleep(10)
+
+        client = AsyncMock()
+        client.chat.completions.create = AsyncMock(return_value=stalled_stream())
+
+        events = []
+        with pytest.raises(TimeoutError):
+            async for event in stream_json(
+                client,
+                model="gpt-4o-mini",
+                messages=MESSAGES,
+                schema=Answer,
+                temperature=0.1,
+                prompt_cache_key="test",
+                timeout=0.05,
+            ):
+                events.append(event)
+
+        assert events == [{"type": "delta", "content": '{"a'}]
+        assert client.chat.completions.create.call_args.kwargs["timeout"] == 0.05
+
+
+class TestBuildMessages:
+    """Test suite for build_messages()."""
+
+    def test_examples_precede_user_prompt(self) -> None:
+        """Test few-shot examples sit between the static prompts and the input."""
+        prefix = build_prefix(
+            "Instructions", "Reference", (("Example in", "Example out"),)
+        )
+        messages = build_messages(prefix, "Input")
+
+        assert messages == [
+            {"role": "system", "content": "Instructions"},
+            {"role": "system", "content": "Reference"},
+            {"role": "user", "content": "Example in"},
+            {"role": "assistant", "content": "Example out"},
+            {"role": "user", "content": "Input"},
+        ]
+
+    def test_prefix_messages_are_shared(self) -> None:
+        """Test requests reuse the prefix message objects instead of copying."""
+        prefix = build_prefix("Instructions", "Reference", ())
+
+        first = build_messages(prefix, "First")
+        second = build_messages(prefix, "Second")
+
+        assert first[0] is second[0] is prefix[0]
+        assert first[1] is second[1] is prefix[1]
+        assert len(prefix) == 2
+
+
+class TestResponseFormat:
+    """Test suite for response_format()."""
+
+    def test_strict_json_schema(self) -> None:
+        """Test the output model is sent as a strict JSON schema."""
+        result = response_format(Answer)
+
+        assert result["type"] == "json_schema"
+        assert result["json_schema"]["name"] == "Answer"
+        assert result["json_schema"]["strict"] is True
+        assert result["json_schema"]["schema"]["required"] == ["answer"]
+        assert result["json_schema"]["schema"]["additionalProperties"] is False
+
+    def test_nested_models_are_strict(self) -> None:
+        """Test nested and optional models are strict, with described refs inlined."""
+
+        class Inner(BaseModel):
+            value: int
+            note: Optional[str] = None
+
+        class Outer(BaseModel):
+            inner: Inner = Field(..., description="Described reference")
+            items: List[Inner]
+
+        schema = strict_json_schema(Outer)
+
+        inner = schema["properties"]["inner"]
+        assert "$ref" not in inner
+        assert inner["description"] == "Described reference"
+        assert inner["required"] == ["value", "note"]
+        assert inner["additionalProperties"] is False
+        assert "default" not in inner["properties"]["note"]
+        definition = schema["$defs"]["Inner"]
+        assert definition["required"] == ["value", "note"]
+        assert definition["additionalProperties"] is False
+        assert schema["properties"]["items"]["items"] == {"$ref": "#/$defs/Inner"}
+
+
+class TestArrayItemScanner:
+    """Test suite for ArrayItemScanner."""
+
+    def test_reports_elements_as_they_complete(self) -> None:
+        """Test elements are reported once their delimiter arrives."""
+        scanner = ArrayItemScanner()
+
+        assert scanner.feed('{"risks": [{"severity": "high"}') == []
+        assert scanner.feed(", ") == [("risks", {"severity": "high"})]
+        assert scanner.feed('"x"]') == [("risks", "x")]
+
+    def test_ignores_delimiters_in_strings(self) -> None:
+        """Test commas, brackets and escaped quotes inside strings are skipped."""
+        document = json.dumps({"actions": ['a, "b" ] }', "c"], "level": "high"})
+        scanner = ArrayItemScanner()
+
+        items = []
+        for i in range(0, len(document), 3):
+            items += scanner.feed(document[i : i + 3])
+
+        assert items == [("actions", 'a, "b" ] }'), ("actions", "c")]
+
+    def test_nested_arrays_are_part_of_the_element(self) -> None:
+        """Test only top-level array fields are split into elements."""
+        scanner = ArrayItemScanner()
+
+        items = scanner.feed('{"risks": [{"tags": [1, 2]}], "empty": []}')
+
+        assert items == [("risks", {"tags": [1, 2]})]
+
+    def test_collects_completed_top_level_fields(self) -> None:
+        """Test top-level fields are collected once their value is complete."""
+        scanner = ArrayItemScanner()
+
+        scanner.feed('{"summary": "a, b", "tags": ["x"')
+        assert scanner.fields == {"summary": "a, b"}
+
+        scanner.feed('], "meta": {"n": [1]}, "score": 0.5}')
+        assert scanner.fields == {
+            "summary": "a, b",
+            "tags": ["x"],
+            "meta": {"n": [1]},
+            "score": 0.5,
+        }
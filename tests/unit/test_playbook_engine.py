@@ -1,20 +1,31 @@
 """Unit tests for PlaybookEngine."""
 
-from typing import Any, Dict
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import patch
 
 import pytest
 
+from src.playbooks.checkpoint import CheckpointManager
 from src.playbooks.engine import (
     ExecutionContext,
     PlaybookEngine,
 )
+from src.playbooks.errors import SkillExecutionError
 from src.playbooks.models import (
     DecisionBranch,
     DecisionStep,
     Playbook,
     PlaybookMetadata,
     SkillStep,
+    Step,
 )
+from src.playbooks.tracer import StepTrace
 from src.skills.base import Skill
 from src.skills.registry import SkillRegistry
 
@@ -69,6 +80,46 @@ class ErrorSkill(Skill):
         raise ValueError("Intentional error for testing")
 
 
+class SlowEchoSkill(Skill):
+    """Test skill that yields to the event loop and tracks concurrency."""
+
+    name = "slow_echo"
+    version = "1.0.0"
+    description = "Echoes its input after a short sleep"
+
+    running = 0
+    max_running = 0
+
+    async def execute(self, input: Dict[str, Any]) -> Dict[str, Any]:
+        """Echo the value."""
+        cls = type(self)
+        cls.running += 1
+        cls.max_running = max(cls.max_running, cls.running)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            cls.running -= 1
+        return {"value": input["value"]}
+
+
+class PureSquareSkill(Skill):
+    """Test skill that squares a number and counts its executions."""
+
+    name = "pure_square"
+    version = "1.0.0"
+    description = "Squares a number"
+    pure = True
+
+    calls = 0
+
+    async def execute(self, input: Dict[str, Any]) -> Dict[str, Any]:
+        """Square the number."""
+        type(self).calls += 1
+        if self._trace:
+            self._trace.reasoning = "Squared"
+        return {"result": input["n"] ** 2}
+
+
 @pytest.fixture
 def skill_registry() -> SkillRegistry:
     """Create a skill registry with test skills."""
@@ -77,6 +128,8 @@ def skill_registry() -> SkillRegistry:
     registry.register(MultiplySkill)
     registry.register(GreetingSkill)
     registry.register(ErrorSkill)
+    registry.register(SlowEchoSkill)
+    registry.register(PureSquareSkill)
     return registry
 
 
@@ -117,6 +170,15 @@ class TestExecutionContext:
         assert context.evaluate_condition("x + y > 25") is True
         assert context.evaluate_condition("x == 10 and y == 20") is True
 
+    def test_evaluate_condition_uses_python_truthiness(self) -> None:
+        """Test conditions are judged on their value, not its string form."""
+        context = ExecutionContext({"empty": [], "items": [1], "zero": 0.0})
+
+        assert context.evaluate_condition("empty") is False
+        assert context.evaluate_condition("items") is True
+        assert context.evaluate_condition("zero") is False
+        assert context.evaluate_condition("undefined_variable") is False
+
     def test_evaluate_condition_invalid_syntax(self) -> None:
         """Test invalid condition syntax."""
         from src.playbooks.errors import TemplateError
@@ -131,6 +193,81 @@ class TestExecutionContext:
         result = context.render_template("Hello, {{ name }}!")
         assert result == "Hello, Alice!"
 
+    def test_templates_compiled_once_across_contexts(self) -> None:
+        """Test contexts share compiled templates instead of recompiling them."""
+        from jinja2 import Environment
+
+        with patch.object(
+            Environment,
+            "from_string",
+            autospec=True,
+            side_effect=Environment.from_string,
+        ) as from_string:
+            for score in (70, 90, 95):
+                context = ExecutionContext({"score": score})
+                context.evaluate_condition("score > 87")
+                context.render_template("Score: {{ score }} of 87")
+
+        assert from_string.call_count == 2
+
+    def test_render_template_literal_skips_jinja(self) -> None:
+        """Test literal strings are returned without compiling a template."""
+        context = ExecutionContext({"x": 1})
+
+        with patch("src.playbooks.engine._compile_template") as compile_template:
+            assert context.render_template("plain text") == "plain text"
+            assert context.render_template("42") == 42
+            assert context.render_template("{x}") == "{x}"
+
+        compile_template.assert_not_called()
+
+    def test_timestamp_offsets_from_start(self) -> None:
+        """Test timestamps are the start time plus elapsed counter time."""
+        started_at = datetime(2024, 1, 1)
+        context = ExecutionContext(started_at=started_at)
+        start_ns = time.perf_counter_ns()
+
+        assert context.timestamp(start_ns + 1_500_000) >= started_at + timedelta(
+            microseconds=1500
+        )
+        assert context.timestamp() - started_at < timedelta(seconds=1)
+
+    def test_render_template_variable_path_preserves_type(self) -> None:
+        """Test single variable references return the referenced object."""
+        context = ExecutionContext({"obj": {"items": [1, 2], "n": 3}})
+
+        assert context.render_template("{{ obj.items }}") == [1, 2]
+        assert context.render_template("  {{obj}}  ") == {"items": [1, 2], "n": 3}
+        assert context.render_template("{{ obj.n + 1 }}") == 4
+        assert context.render_template("{{ obj.n }} and {{ obj.n }}") == "3 and 3"
+
+    def test_render_template_numeric_coercion(self) -> None:
+        """Test numeric-looking results become numbers and words stay strings."""
+        context = ExecutionContext({"n": 7})
+
+        assert context.render_template("{{ n }}0") == 70
+        assert context.render_template(" -1.5 ") == -1.5
+        assert context.render_template(".5") == 0.5
+        assert context.render_template("1e3") == 1000.0
+        assert context.render_template("12 monkeys") == "12 monkeys"
+        assert context.render_template("nan") == "nan"
+        assert context.render_template("Infinity") == "Infinity"
+
+    def test_render_template_dates_not_converted(self) -> None:
+        """Test strings that only start like numbers are never tried as numbers."""
+        context = ExecutionContext()
+
+        with (
+            patch("src.playbooks.engine.int", create=True) as to_int,
+            patch("src.playbooks.engine.float", create=True) as to_float,
+        ):
+            assert context.render_template("2024-01-15") == "2024-01-15"
+            assert context.render_template("3.14.15") == "3.14.15"
+            assert context.render_template("12 monkeys") == "12 monkeys"
+
+        to_int.assert_not_called()
+        to_float.assert_not_called()
+
     def test_render_dict(self) -> None:
         """Test rendering templates in a dictionary."""
         context = ExecutionContext({"x": 10, "y": 20})
@@ -443,6 +580,9 @@ class TestPlaybookEngine:
         assert step_trace.started_at is not None
         assert step_trace.completed_at is not None
         assert step_trace.duration_ms is not None
+        assert step_trace.completed_at >= step_trace.started_at
+        elapsed = step_trace.completed_at - step_trace.started_at
+        assert abs(elapsed.total_seconds() * 1000 - step_trace.duration_ms) <= 1
 
     @pytest.mark.asyncio
     async def test_execute_with_playbook_variables(
@@ -547,3 +687,614 @@ class TestPlaybookEngine:
         assert trace.steps[1].decision_taken == "branch_0: score.result > 50"
         # The nested decision should have taken the high branch (90 > 80)
         assert trace.final_context["final"]["message"] == "Hello, Very High!"
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_serialize_each_step_once(
+        self, engine: PlaybookEngine, skill_registry: SkillRegistry, tmp_path: Path
+    ) -> None:
+        """Test checkpointing does not re-serialize earlier steps on every save."""
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="checkpointed"),
+            steps=[
+                SkillStep(
+                    name=f"add_{i}",
+                    skill="add_numbers",
+                    input={"a": i, "b": 1},
+                    output_var=f"sum_{i}",
+                )
+                for i in range(3)
+            ],
+        )
+        saved_steps = []
+        original_save = CheckpointManager.save_checkpoint
+
+        def save_checkpoint(manager: CheckpointManager, **kwargs: Any) -> None:
+            saved_steps.append([s["step_name"] for s in kwargs["completed_steps"]])
+            original_save(manager, **kwargs)
+
+        with (
+            patch.object(
+                StepTrace, "to_dict", autospec=True, side_effect=StepTrace.to_dict
+            ) as to_dict,
+            patch.object(CheckpointManager, "save_checkpoint", save_checkpoint),
+        ):
+            trace = await engine.execute(playbook, checkpoint_dir=str(tmp_path))
+
+        assert trace.success is True
+        assert to_dict.call_count == 3
+        assert saved_steps[-1] == ["add_0", "add_1", "add_2"]
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_coalesce_while_writing(
+        self, engine: PlaybookEngine, tmp_path: Path
+    ) -> None:
+        """Test steps don't wait on a slow write and only the newest state is queued."""
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="slow_disk"),
+            steps=[
+                SkillStep(
+                    name=f"add_{i}",
+                    skill="add_numbers",
+                    input={"a": i, "b": 1},
+                    output_var=f"sum_{i}",
+                )
+                for i in range(5)
+            ]
+            + [SkillStep(name="fail", skill="error_skill", input={})],
+        )
+        saved_steps = []
+        original_save = CheckpointManager.save_checkpoint
+
+        def save_checkpoint(manager: CheckpointManager, **kwargs: Any) -> None:
+            time.sleep(0.05)
+            saved_steps.append(kwargs["current_step"])
+            original_save(manager, **kwargs)
+
+        with patch.object(CheckpointManager, "save_checkpoint", save_checkpoint):
+            with pytest.raises(Exception):
+                await engine.execute(playbook, checkpoint_dir=str(tmp_path))
+
+        manager = CheckpointManager(str(tmp_path))
+        (execution_id,) = manager.list_checkpoints()
+        assert saved_steps[-1] == 5
+        assert len(saved_steps) < 5
+        assert manager.load_checkpoint(execution_id)["current_step"] == 5
+
+    @pytest.mark.asyncio
+    async def test_prepared_playbook_reuses_compiled_templates(
+        self, engine: PlaybookEngine, skill_registry: SkillRegistry
+    ) -> None:
+        """Test executions of a prepared playbook compile no templates."""
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="prepared"),
+            steps=[
+                SkillStep(
+                    name="calculate",
+                    skill="add_numbers",
+                    input={"a": "{{ x }}", "b": "{{ x + 1 }}"},
+                    output_var="total",
+                ),
+                DecisionStep(
+                    name="check_total",
+                    branches=[
+                        DecisionBranch(
+                            condition="total.result > 4",
+                            steps=[
+                                SkillStep(
+                                    name="greet",
+                                    skill="greeting",
+                                    input={"name": "{{ 'High' }} Score"},
+                                    output_var="message",
+                                )
+                            ],
+                        )
+                    ],
+                ),
+            ],
+        )
+
+        engine.prepare(playbook)
+        with patch(
+            "src.playbooks.engine.Environment.from_string",
+            side_effect=AssertionError("template compiled during execution"),
+        ):
+            trace = await engine.execute(playbook, {"x": 2})
+
+        assert trace.success is True
+        assert trace.final_context["total"]["result"] == 5
+        assert trace.final_context["message"]["message"] == "Hello, High Score!"
+
+    @pytest.mark.asyncio
+    async def test_execute_prepares_playbook_once(
+        self, engine: PlaybookEngine, skill_registry: SkillRegistry
+    ) -> None:
+        """Test execute() compiles the playbook's templates onto the playbook."""
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="auto_prepared"),
+            steps=[
+                SkillStep(
+                    name="calculate",
+                    skill="add_numbers",
+                    input={"a": "{{ x }}", "b": 1},
+                    output_var="total",
+                )
+            ],
+        )
+
+        await engine.execute(playbook, {"x": 1})
+        prepared = playbook._prepared
+        await engine.execute(playbook, {"x": 2})
+
+        assert prepared is not None
+        assert set(prepared.templates) == {"{{ x }}"}
+        assert engine.prepare(playbook) is prepared
+
+    @pytest.mark.asyncio
+    async def test_steps_added_after_execution_run(
+        self, engine: PlaybookEngine, skill_registry: SkillRegistry
+    ) -> None:
+        """Test steps appended to a prepared playbook are planned and run."""
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="grown"),
+            steps=[
+                SkillStep(
+                    name="calculate",
+                    skill="add_numbers",
+                    input={"a": "{{ x }}", "b": 1},
+                    output_var="total",
+                )
+            ],
+        )
+        await engine.execute(playbook, {"x": 1})
+
+        playbook.steps.append(
+            SkillStep(
+                name="greet",
+                skill="greeting",
+                input={"name": "{{ total.result }}"},
+                output_var="message",
+            )
+        )
+        trace = await engine.execute(playbook, {"x": 1})
+
+        assert [step.step_name for step in trace.steps] == ["calculate", "greet"]
+        assert trace.final_context["message"]["message"] == "Hello, 2!"
+
+    @pytest.mark.asyncio
+    async def test_model_copy_is_prepared_afresh(
+        self, engine: PlaybookEngine, skill_registry: SkillRegistry
+    ) -> None:
+        """Test a copy with replaced steps runs its own steps, not the original's."""
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="original"),
+            steps=[
+                SkillStep(
+                    name="calculate",
+                    skill="add_numbers",
+                    input={"a": "{{ x }}", "b": 1},
+                    output_var="total",
+                )
+            ],
+        )
+        await engine.execute(playbook, {"x": 1})
+
+        copy = playbook.model_copy(
+            update={
+                "steps": [
+                    SkillStep(
+                        name="greet",
+                        skill="greeting",
+                        input={"name": "{{ x }}"},
+                        output_var="message",
+                    )
+                ]
+            }
+        )
+        trace = await engine.execute(copy, {"x": "Ada"})
+
+        assert copy._prepared is not playbook._prepared
+        assert [step.step_name for step in trace.steps] == ["greet"]
+        assert trace.final_context["message"]["message"] == "Hello, Ada!"
+
+    def test_prepared_render_shares_static_subtrees(
+        self, engine: PlaybookEngine
+    ) -> None:
+        """Test nested inputs with nothing to render are not copied."""
+        config = {"model": "gpt", "limits": [{"name": "a"}], "flags": ["x", "1"]}
+        templated = {"name": "{{ who }}", "static": {"k": "v"}}
+        numeric = {"n": "5"}
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="shared"),
+            steps=[
+                SkillStep(
+                    name="s",
+                    skill="greeting",
+                    input={"config": config, "templated": templated, "num": numeric},
+                )
+            ],
+        )
+        step_input = playbook.steps[0].input
+        context = ExecutionContext({"who": "Ada"}, engine.prepare(playbook))
+
+        rendered = context.render_dict(step_input)
+
+        assert rendered is not step_input
+        assert rendered["config"] is step_input["config"]
+        assert rendered["templated"] == {"name": "Ada", "static": {"k": "v"}}
+        assert rendered["templated"]["static"] is step_input["templated"]["static"]
+        assert rendered["num"] == {"n": 5}
+
+    @pytest.mark.asyncio
+    async def test_final_context_independent_of_inputs(
+        self, engine: PlaybookEngine, skill_registry: SkillRegistry
+    ) -> None:
+        """Test the final context does not alias the caller's or playbook's dicts."""
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="isolated"),
+            variables={"b": 2},
+            steps=[
+                SkillStep(
+                    name="add",
+                    skill="add_numbers",
+                    input={"a": "{{ a }}", "b": "{{ b }}"},
+                    output_var="total",
+                )
+            ],
+        )
+        initial_context = {"a": 1}
+
+        trace = await engine.execute(playbook, initial_context)
+        trace.final_context["a"] = 100
+
+        assert initial_context == {"a": 1}
+        assert playbook.variables == {"b": 2}
+        assert trace.final_context["total"] == {"result": 3}
+
+    @pytest.mark.asyncio
+    async def test_failed_execution_leaves_latest_checkpoint(
+        self,
+        engine: PlaybookEngine,
+        tmp_path: Path,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test background checkpoint writes finish before a failure surfaces."""
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="fails_late"),
+            steps=[
+                SkillStep(
+                    name=f"add_{i}",
+                    skill="add_numbers",
+                    input={"a": i, "b": 1},
+                    output_var=f"sum_{i}",
+                )
+                for i in range(2)
+            ]
+            + [SkillStep(name="fail", skill="error_skill", input={})],
+        )
+
+        with caplog.at_level(logging.WARNING, logger="src.playbooks.engine"):
+            with pytest.raises(Exception) as exc_info:
+                await engine.execute(playbook, checkpoint_dir=str(tmp_path))
+
+        manager = CheckpointManager(str(tmp_path))
+        (execution_id,) = manager.list_checkpoints()
+        checkpoint = manager.load_checkpoint(execution_id)
+        assert "Intentional error" in str(exc_info.value)
+        assert checkpoint["current_step"] == 2
+        assert checkpoint["context"]["sum_1"] == {"result": 2}
+        assert [s["step_name"] for s in checkpoint["completed_steps"]] == [
+            "add_0",
+            "add_1",
+        ]
+        assert f"resume_from='{execution_id}'" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_resume_from_fallback_serialized_steps(
+        self, engine: PlaybookEngine, skill_registry: SkillRegistry, tmp_path: Path
+    ) -> None:
+        """Test resuming from steps saved without timestamps leaves them unset."""
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="resumed"),
+            steps=[
+                SkillStep(
+                    name=f"add_{i}",
+                    skill="add_numbers",
+                    input={"a": i, "b": 1},
+                    output_var=f"sum_{i}",
+                )
+                for i in range(2)
+            ],
+        )
+        manager = CheckpointManager(str(tmp_path))
+        manager.save_checkpoint(
+            execution_id="fallback-id",
+            playbook_name="resumed",
+            current_step=1,
+            context_vars={"sum_0": {"result": 1}},
+            completed_steps=[SimpleNamespace(step_name="add_0", step_type="skill")],
+        )
+
+        trace = await engine.execute(
+            playbook, resume_from="fallback-id", checkpoint_dir=str(tmp_path)
+        )
+
+        assert trace.success is True
+        assert trace.steps[0].step_name == "add_0"
+        assert trace.steps[0].started_at is None
+        assert trace.steps[0].to_dict()["started_at"] is None
+        assert trace.final_context["sum_1"] == {"result": 2}
+
+    def test_step_groups_sequential_by_default(self, engine: PlaybookEngine) -> None:
+        """Test every step runs alone unless the playbook opts in."""
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="sequential"),
+            steps=[
+                SkillStep(name=f"s{i}", skill="slow_echo", input={"value": i})
+                for i in range(3)
+            ],
+        )
+
+        assert engine.prepare(playbook).step_groups == [(0, 1), (1, 2), (2, 3)]
+
+    def test_step_groups_split_on_dependencies(self, engine: PlaybookEngine) -> None:
+        """Test groups break at data dependencies and around decision steps."""
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="grouped"),
+            parallel=True,
+            steps=[
+                SkillStep(
+                    name="a", skill="slow_echo", input={"value": 1}, output_var="a"
+                ),
+                SkillStep(
+                    name="b", skill="slow_echo", input={"value": 2}, output_var="b"
+                ),
+                SkillStep(
+                    name="c",
+                    skill="slow_echo",
+                    input={"value": "{{ a.value }}"},
+                    output_var="c",
+                ),
+                DecisionStep(
+                    name="d",
+                    branches=[DecisionBranch(condition="c.value > 0", steps=[])],
+                ),
+                SkillStep(
+                    name="e", skill="slow_echo", input={"value": 3}, output_var="e"
+                ),
+                SkillStep(
+                    name="f", skill="slow_echo", input={"value": 4}, output_var="e"
+                ),
+            ],
+        )
+
+        assert engine.prepare(playbook).step_groups == [
+            (0, 2),
+            (2, 3),
+            (3, 4),
+            (4, 5),
+            (5, 6),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_parallel_playbook_overlaps_independent_steps(
+        self, engine: PlaybookEngine
+    ) -> None:
+        """Test independent steps run concurrently and dependents wait."""
+        SlowEchoSkill.max_running = 0
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="fan_out"),
+            parallel=True,
+            steps=[
+                SkillStep(
+                    name=f"fetch_{i}",
+                    skill="slow_echo",
+                    input={"value": i},
+                    output_var=f"fetch_{i}",
+                )
+                for i in range(3)
+            ]
+            + [
+                SkillStep(
+                    name="combine",
+                    skill="add_numbers",
+                    input={"a": "{{ fetch_1.value }}", "b": "{{ fetch_2.value }}"},
+                    output_var="total",
+                )
+            ],
+        )
+
+        trace = await engine.execute(playbook)
+
+        assert SlowEchoSkill.max_running == 3
+        assert trace.success is True
+        assert trace.final_context["total"] == {"result": 3}
+        assert [s.step_name for s in trace.steps] == [
+            "fetch_0",
+            "fetch_1",
+            "fetch_2",
+            "combine",
+        ]
+
+    def test_prepare_folds_constant_conditions(self, engine: PlaybookEngine) -> None:
+        """Test conditions without variables or calls are evaluated once."""
+        conditions = ["true", "1 > 2", "x > 1", "[1, 2] | random", "1 / 0"]
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="constants"),
+            steps=[
+                DecisionStep(
+                    name="decide",
+                    branches=[
+                        DecisionBranch(condition=condition, steps=[])
+                        for condition in conditions
+                    ],
+                )
+            ],
+        )
+
+        prepared = engine.prepare(playbook)
+        context = ExecutionContext({"x": 2}, prepared)
+        del prepared.conditions["true"]
+
+        assert prepared.constant_conditions == {"true": True, "1 > 2": False}
+        with patch(
+            "src.playbooks.engine._compile_condition", side_effect=AssertionError
+        ):
+            assert context.evaluate_condition("true") is True
+        assert context.evaluate_condition("x > 1") is True
+
+    @pytest.mark.asyncio
+    async def test_decision_without_steps_skips_checkpoint(
+        self, engine: PlaybookEngine, tmp_path: Path
+    ) -> None:
+        """Test a decision that runs no steps does not write a checkpoint."""
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="routing"),
+            steps=[
+                SkillStep(
+                    name="add",
+                    skill="add_numbers",
+                    input={"a": 1, "b": 2},
+                    output_var="total",
+                ),
+                DecisionStep(
+                    name="route",
+                    branches=[DecisionBranch(condition="total.result > 0", steps=[])],
+                ),
+                SkillStep(name="fail", skill="error_skill", input={}),
+            ],
+        )
+
+        with patch.object(
+            CheckpointManager,
+            "save_checkpoint",
+            autospec=True,
+            side_effect=CheckpointManager.save_checkpoint,
+        ) as save:
+            with pytest.raises(Exception):
+                await engine.execute(playbook, checkpoint_dir=str(tmp_path))
+
+        manager = CheckpointManager(str(tmp_path))
+        (execution_id,) = manager.list_checkpoints()
+        assert save.call_count == 1
+        assert manager.load_checkpoint(execution_id)["current_step"] == 1
+
+    @pytest.mark.asyncio
+    async def test_pure_skill_outputs_reused(self, engine: PlaybookEngine) -> None:
+        """Test pure skills run once per distinct input across executions."""
+        PureSquareSkill.calls = 0
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="pure"),
+            steps=[
+                SkillStep(
+                    name="square",
+                    skill="pure_square",
+                    input={"n": "{{ n }}"},
+                    output_var="square",
+                )
+            ],
+        )
+
+        first = await engine.execute(playbook, {"n": 3})
+        second = await engine.execute(playbook, {"n": 3})
+        third = await engine.execute(playbook, {"n": 4})
+
+        assert PureSquareSkill.calls == 2
+        assert second.final_context["square"] == {"result": 9}
+        assert third.final_context["square"] == {"result": 16}
+        cached_trace = second.steps[0].skill_trace
+        assert cached_trace is not None
+        assert cached_trace.reasoning == "Squared"
+        assert cached_trace.duration_ms == 0
+        assert cached_trace.execution_id != first.steps[0].skill_trace.execution_id
+
+    @pytest.mark.asyncio
+    async def test_pure_skill_outputs_not_reused_for_equal_json(
+        self, engine: PlaybookEngine
+    ) -> None:
+        """Test inputs that only encode to the same JSON each run the skill."""
+        PureSquareSkill.calls = 0
+
+        await engine._run_skill(PureSquareSkill, {"n": 3, "m": {1: "x"}})
+        await engine._run_skill(PureSquareSkill, {"n": 3, "m": {"1": "x"}})
+        await engine._run_skill(PureSquareSkill, {"n": 3, "v": (1, 2)})
+        await engine._run_skill(PureSquareSkill, {"n": 3, "v": [1, 2]})
+        await engine._run_skill(PureSquareSkill, {"n": 3, "v": [1, 2]})
+
+        assert PureSquareSkill.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_impure_skill_outputs_not_reused(
+        self, engine: PlaybookEngine
+    ) -> None:
+        """Test skills run every time unless they declare themselves pure."""
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="impure"),
+            steps=[SkillStep(name="greet", skill="greeting", input={"name": "A"})],
+        )
+
+        with patch.object(
+            GreetingSkill, "execute", autospec=True, return_value={"message": "Hi"}
+        ) as execute:
+            await engine.execute(playbook)
+            await engine.execute(playbook)
+
+        assert execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_failure_records_cancelled_siblings(
+        self, engine: PlaybookEngine
+    ) -> None:
+        """Test steps cancelled by a failing sibling finish their traces."""
+        steps: List[Step] = [
+            SkillStep(name="slow", skill="slow_echo", input={"value": 1}),
+            SkillStep(name="fail", skill="error_skill", input={}),
+        ]
+        traces: List[StepTrace] = []
+
+        with pytest.raises(SkillExecutionError):
+            await engine._execute_concurrently(steps, ExecutionContext(), traces)
+
+        slow, fail = traces
+        assert slow.error == "Cancelled"
+        assert slow.completed_at is not None
+        assert slow.duration_ms is not None
+        assert fail.error == "Intentional error for testing"
+
+    @pytest.mark.asyncio
+    async def test_parallel_playbook_overlaps_branch_steps(
+        self, engine: PlaybookEngine
+    ) -> None:
+        """Test independent steps of a taken branch run concurrently."""
+        SlowEchoSkill.max_running = 0
+        playbook = Playbook(
+            metadata=PlaybookMetadata(name="branch_fan_out"),
+            parallel=True,
+            steps=[
+                DecisionStep(
+                    name="route",
+                    branches=[
+                        DecisionBranch(
+                            condition="true",
+                            steps=[
+                                SkillStep(
+                                    name=f"fetch_{i}",
+                                    skill="slow_echo",
+                                    input={"value": i},
+                                    output_var=f"fetch_{i}",
+                                )
+                                for i in range(2)
+                            ],
+                        )
+                    ],
+                )
+            ],
+        )
+
+        trace = await engine.execute(playbook)
+
+        assert SlowEchoSkill.max_running == 2
+        assert trace.final_context["fetch_1"] == {"value": 1}
+        assert [s.step_name for s in trace.steps[0].nested_steps] == [
+            "fetch_0",
+            "fetch_1",
+        ]
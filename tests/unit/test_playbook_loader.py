@@ -2,6 +2,7 @@
 
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from unittest.mock import patch
 
 import pytest
 
@@ -327,6 +328,41 @@ steps:
         with pytest.raises(PlaybookLoadError, match="Template syntax error"):
             loader.load_from_string(yaml_bad_template, variables={"some": "var"})
 
+    def test_template_compiled_once_per_content(self, loader: PlaybookLoader) -> None:
+        """Test reloading the same content with new variables reuses its template."""
+        yaml_template = """
+metadata:
+  name: "{{ name }}"
+  version: 1.0.0
+steps:
+  - type: skill
+    name: test
+    skill: test_skill
+"""
+        first = loader.load_from_string(yaml_template, variables={"name": "first"})
+        second = loader.load_from_string(yaml_template, variables={"name": "second"})
+
+        assert first.metadata.name == "first"
+        assert second.metadata.name == "second"
+        assert loader._compile_template.cache_info().misses == 1
+
+    def test_template_free_content_skips_jinja(self, loader: PlaybookLoader) -> None:
+        """Test content without template markers is not processed by Jinja."""
+        yaml_plain = """
+metadata:
+  name: plain
+  version: 1.0.0
+steps:
+  - type: skill
+    name: test
+    skill: test_skill
+"""
+        with patch.object(loader, "_process_template") as process_template:
+            playbook = loader.load_from_string(yaml_plain, variables={"a": 1})
+
+        process_template.assert_not_called()
+        assert playbook.metadata.name == "plain"
+
     def test_undefined_template_variable(self, loader: PlaybookLoader) -> None:
         """Test that undefined variables become None and fail validation."""
         yaml_undefined_var = """
@@ -363,6 +399,50 @@ steps:
         assert playbook.metadata.name == "dict_playbook"
         assert len(playbook.steps) == 1
 
+    def test_load_from_dict_leaves_data_unchanged(self, loader: PlaybookLoader) -> None:
+        """Test nested step data is validated without being replaced in place."""
+        branch_steps = [{"type": "skill", "name": "inner", "skill": "test_skill"}]
+        data = {
+            "metadata": {"name": "nested", "version": "1.0.0"},
+            "steps": [
+                {
+                    "type": "decision",
+                    "name": "decide",
+                    "branches": [{"condition": "true", "steps": branch_steps}],
+                }
+            ],
+        }
+
+        playbook = loader.load_from_dict(data)
+
+        assert data["steps"][0]["branches"][0]["steps"] is branch_steps
+        assert isinstance(branch_steps[0], dict)
+        decision = playbook.steps[0]
+        assert isinstance(decision, DecisionStep)
+        assert isinstance(decision.branches[0].steps[0], SkillStep)
+
+    def test_nested_step_missing_type(self, loader: PlaybookLoader) -> None:
+        """Test nested steps must also declare their type."""
+        data = {
+            "metadata": {"name": "nested", "version": "1.0.0"},
+            "steps": [
+                {"type": "skill", "name": "first", "skill": "test_skill"},
+                {
+                    "type": "decision",
+                    "name": "decide",
+                    "branches": [
+                        {
+                            "condition": "true",
+                            "steps": [{"name": "inner", "skill": "test_skill"}],
+                        }
+                    ],
+                },
+            ],
+        }
+
+        with pytest.raises(PlaybookLoadError, match="Step 1 validation failed"):
+            loader.load_from_dict(data)
+
     def test_nested_decision_steps(self, loader: PlaybookLoader) -> None:
         """Test decision steps with nested decisions."""
         yaml_nested = """
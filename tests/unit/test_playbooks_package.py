@@ -0,0 +1,38 @@
+"""Unit tests for the playbooks package's lazy exports."""
+
+import subprocess
+import sys
+from importlib import import_module
+
+import pytest
+
+import src.playbooks as playbooks
+
+
+class TestLazyExports:
+    """Test suite for the package's PEP 562 exports."""
+
+    def test_import_loads_no_submodules(self) -> None:
+        """Test importing the package does not import the engine and friends."""
+        code = (
+            "import sys, src.playbooks; "
+            "print(sorted(m for m in sys.modules if m.startswith('src.playbooks.')))"
+        )
+
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "[]"
+
+    @pytest.mark.parametrize("name", playbooks.__all__)
+    def test_public_names_resolve(self, name: str) -> None:
+        """Test every name in __all__ is importable from the package."""
+        module = import_module(f"src.playbooks.{playbooks._EXPORTS[name]}")
+
+        assert getattr(playbooks, name) is getattr(module, name)
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        """Test unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError, match="no_such_name"):
+            playbooks.no_such_name  # noqa: B018
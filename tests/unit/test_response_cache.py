@@ -0,0 +1,120 @@
+"""Unit tests for the governance ResponseCache."""
+
+import asyncio
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from src.modules.governance.skills._response_cache import (
+    ResponseCache,
+    make_cache_key,
+)
+
+
+class TestMakeCacheKey:
+    """Test suite for make_cache_key."""
+
+    def test_key_is_deterministic(self) -> None:
+        """Test identical fields produce identical keys."""
+        assert make_cache_key("gpt-4o-mini", "v1", "sys", "user") == make_cache_key(
+            "gpt-4o-mini", "v1", "sys", "user"
+        )
+
+    def test_key_is_length_prefixed(self) -> None:
+        """Test field boundaries are part of the key."""
+        assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache."""
+
+    @pytest.mark.asyncio
+    async def test_get_miss(self) -> None:
+        """Test lookup of a missing key."""
+        cache = ResponseCache()
+        assert await cache.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_set_and_get(self) -> None:
+        """Test a stored value is returned and isolated from the caller."""
+        cache = ResponseCache()
+        value = {"context": {"stakeholders": ["bank"]}}
+
+        await cache.set("key", value, model="gpt-4o-mini")
+        value["context"]["stakeholders"].append("mutated")
+
+        assert await cache.get("key") == {"context": {"stakeholders": ["bank"]}}
+
+    @pytest.mark.asyncio
+    async def test_delete(self) -> None:
+        """Test evicting a value."""
+        cache = ResponseCache()
+        await cache.set("key", {"a": 1}, model="gpt-4o-mini")
+
+        await cache.delete("key")
+
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self) -> None:
+        """Test the in-memory layer is bounded."""
+        cache = ResponseCache(max_entries=2)
+        await cache.set("a", {"v": 1}, model="m")
+        await cache.set("b", {"v": 2}, model="m")
+        await cache.get("a")
+        await cache.set("c", {"v": 3}, model="m")
+
+        assert len(cache) == 2
+        assert await cache.get("b") is None
+        assert await cache.get("a") == {"v": 1}
+
+    @pytest.mark.asyncio
+    async def test_persistent_entries(self, tmp_path) -> None:
+        """Test entries survive across cache instances with a cache_dir."""
+        cache = ResponseCache(cache_dir=str(tmp_path))
+        await cache.set("key", {"v": 1}, model="m")
+
+        reopened = ResponseCache(cache_dir=str(tmp_path))
+
+        assert await reopened.get("key") == {"v": 1}
+        await reopened.delete("key")
+        assert not (tmp_path / "key.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_of_one_key(self, tmp_path) -> None:
+        """Test overlapping writes of a key each use their own temporary file."""
+        cache = ResponseCache(cache_dir=str(tmp_path))
+
+        await asyncio.gather(*(cache.set("key", {"v": i}, model="m") for i in range(8)))
+
+        reopened = ResponseCache(cache_dir=str(tmp_path))
+        assert (await reopened.get("key"))["v"] in range(8)
+        assert [path.name for path in tmp_path.iterdir()] == ["key.json"]
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_logged_not_raised(
+        self, tmp_path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test a value is still cached in memory when persisting it fails."""
+        cache = ResponseCache(cache_dir=str(tmp_path))
+
+        with (
+            patch("os.replace", side_effect=PermissionError("read-only")),
+            caplog.at_level(logging.WARNING),
+        ):
+            await cache.set("key", {"v": 1}, model="m")
+
+        assert await cache.get("key") == {"v": 1}
+        assert "read-only" in caplog.text
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_unreadable_entry_is_a_miss(self, tmp_path) -> None:
+        """Test entries that cannot be decoded are treated as misses."""
+        (tmp_path / "key.json").write_bytes(b"\xff\xfe")
+        (tmp_path / "dir.json").mkdir()
+        cache = ResponseCache(cache_dir=str(tmp_path))
+
+        assert await cache.get("key") is None
+        assert await cache.get("dir") is None
@@ -1,7 +1,9 @@
 """Unit tests for RiskIdentifier skill."""
 
+import json
 import os
-from unittest.mock import patch
+from typing import Any, AsyncIterator, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -30,3 +32,94 @@ class TestRiskIdentifier:
         with patch.dict(os.environ, {}, clear=True):
             with pytest.raises(ValueError, match="OPENAI_API_KEY"):
                 RiskIdentifier()
+
+    @pytest.mark.asyncio
+    async def test_execute_stream(self) -> None:
+        """Test risks are reported as they are generated, then the output."""
+        raw = json.dumps(
+            {
+                "risks": [
+                    {
+                        "severity": "high",
+                        "description": "Default",
+                        "category": "business",
+                    }
+                ],
+                "overall_risk_level": "high",
+            }
+        )
+
+        async def stream() -> AsyncIterator[Any]:
+            for i in range(0, len(raw), 7):
+                yield MagicMock(
+                    choices=[MagicMock(delta=MagicMock(content=raw[i : i + 7]))]
+                )
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            skill = RiskIdentifier()
+            skill.client = AsyncMock()
+            skill.client.chat.completions.create = AsyncMock(return_value=stream())
+
+            events: List[Dict[str, Any]] = [
+                event
+                async for event in skill.execute_stream(
+                    {"decision_context": {"decision_summary": "Approved loan"}}
+                )
+            ]
+
+            assert skill.client.chat.completions.create.call_args.kwargs["stream"]
+            assert "".join(e["content"] for e in events if e["type"] == "delta") == raw
+            items = [e for e in events if e["type"] == "item"]
+            assert items == [
+                {
+                    "type": "item",
+                    "field": "risks",
+                    "value": {
+                        "severity": "high",
+                        "description": "Default",
+                        "category": "business",
+                    },
+                }
+            ]
+            result = events[-1]
+            assert result["type"] == "result"
+            assert result["output"]["analysis"]["overall_risk_level"] == "high"
+            assert result["output"]["raw_response"] == raw
+
+            # The streamed output is cached for execute()
+            assert (
+                await skill.execute(
+                    {"decision_context": {"decision_summary": "Approved loan"}}
+                )
+                == result["output"]
+            )
+            skill.client.chat.completions.create.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_stream_retries_invalid_response(self) -> None:
+        """Test an invalid streamed response is requested again with feedback."""
+        raw = json.dumps({"risks": [], "overall_risk_level": "low"})
+
+        async def stream() -> AsyncIterator[Any]:
+            yield MagicMock(choices=[MagicMock(delta=MagicMock(content="not json"))])
+
+        completion = MagicMock()
+        completion.choices = [MagicMock(message=MagicMock(content=raw))]
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            skill = RiskIdentifier()
+            skill.client = AsyncMock()
+            skill.client.chat.completions.create = AsyncMock(
+                side_effect=[stream(), completion]
+            )
+
+            events = [
+                event
+                async for event in skill.execute_stream(
+                    {"decision_context": {"decision_summary": "Approved loan"}}
+                )
+            ]
+
+            assert events[-1]["output"]["analysis"]["overall_risk_level"] == "low"
+            assert events[-1]["output"]["raw_response"] == raw
+            assert skill.client.chat.completions.create.call_count == 2
@@ -0,0 +1,138 @@
+"""Unit tests for SemanticCache."""
+
+import os
+from unittest.mock import patch
+
+from src.modules.governance.skills._semantic_cache import (
+    SemanticCache,
+    critical_tokens,
+    get_semantic_cache,
+)
+
+
+class TestCriticalTokens:
+    """Test suite for critical_tokens()."""
+
+    def test_normalizes_amounts(self) -> None:
+        """Test equivalent amounts produce the same token."""
+        assert critical_tokens("paid $400k") == critical_tokens("paid $400,000")
+
+    def test_distinguishes_amounts(self) -> None:
+        """Test different amounts produce different tokens."""
+        assert critical_tokens("paid $400k") != critical_tokens("paid $40k")
+
+    def test_percentages(self) -> None:
+        """Test percentages are kept distinct from plain numbers."""
+        assert critical_tokens("rate of 12.50%") == frozenset({"12.5%"})
+
+    def test_names_skip_sentence_starts(self) -> None:
+        """Test capitalized sentence openers are not treated as names."""
+        tokens = critical_tokens("Approved the loan. The Board agreed for Acme Ltd")
+        assert tokens == frozenset({"board", "acme", "ltd"})
+
+    def test_distinguishes_acronyms(self) -> None:
+        """Test near-identical acronyms are kept apart."""
+        assert critical_tokens("we bid on CPC") != critical_tokens("we bid on CPM")
+
+
+class TestSemanticCache:
+    """Test suite for SemanticCache."""
+
+    def test_hit_above_threshold(self) -> None:
+        """Test a similar embedding with matching tokens hits."""
+        cache = SemanticCache(threshold=0.9)
+        cache.set("ns", [1.0, 0.0], "loan for Acme", {"context": {"a": 1}})
+
+        hit = cache.get("ns", [0.99, 0.05], "credit for Acme")
+
+        assert hit is not None
+        value, similarity = hit
+        assert value == {"context": {"a": 1}}
+        assert similarity > 0.99
+
+    def test_miss_below_threshold(self) -> None:
+        """Test a dissimilar embedding misses."""
+        cache = SemanticCache(threshold=0.9)
+        cache.set("ns", [1.0, 0.0], "loan for Acme", {"a": 1})
+
+        assert cache.get("ns", [0.0, 1.0], "loan for Acme") is None
+
+    def test_miss_on_token_mismatch(self) -> None:
+        """Test a similar embedding with different figures misses."""
+        cache = SemanticCache(threshold=0.9)
+        cache.set("ns", [1.0, 0.0], "loan of $400k", {"a": 1})
+
+        assert cache.get("ns", [1.0, 0.0], "loan of $40k") is None
+
+    def test_namespaces_are_isolated(self) -> None:
+        """Test entries only match within their namespace."""
+        cache = SemanticCache()
+        cache.set("model-a", [1.0, 0.0], "text", {"a": 1})
+
+        assert cache.get("model-b", [1.0, 0.0], "text") is None
+
+    def test_delete_removes_entry(self) -> None:
+        """Test deleting a value returned by get() removes only its entry."""
+        cache = SemanticCache(threshold=0.9)
+        cache.set("ns", [1.0, 0.0], "text", {"a": 1})
+        cache.set("ns", [0.0, 1.0], "text", {"b": 2})
+
+        hit = cache.get("ns", [1.0, 0.0], "text")
+        assert hit is not None
+        cache.delete(hit[0])
+
+        assert len(cache) == 1
+        assert cache.get("ns", [1.0, 0.0], "text") is None
+
+    def test_max_entries(self) -> None:
+        """Test the oldest entries are evicted."""
+        cache = SemanticCache(max_entries=2)
+        for i in range(3):
+            cache.set("ns", [1.0, float(i)], "text", {"i": i})
+
+        assert len(cache) == 2
+
+    def test_evicted_entries_miss(self) -> None:
+        """Test an evicted entry no longer hits."""
+        cache = SemanticCache(max_entries=1)
+        cache.set("ns", [1.0, 0.0], "loan for Acme", {"a": 1})
+        cache.set("ns", [1.0, 0.0], "loan for Beta", {"b": 2})
+
+        assert cache.get("ns", [1.0, 0.0], "loan for Acme") is None
+        assert cache.get("ns", [1.0, 0.0], "loan for Beta") is not None
+
+    def test_hit_among_matching_tokens(self) -> None:
+        """Test a closer entry with other figures does not hide a hit."""
+        cache = SemanticCache(threshold=0.9)
+        cache.set("ns", [0.95, 0.3], "loan of $400k", {"a": 1})
+        cache.set("ns", [1.0, 0.0], "loan of $40k", {"b": 2})
+
+        hit = cache.get("ns", [1.0, 0.0], "loan of $400k")
+
+        assert hit is not None
+        assert hit[0] == {"a": 1}
+
+
+class TestGetSemanticCache:
+    """Test suite for get_semantic_cache()."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test the cache is off unless configured."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert get_semantic_cache() is None
+
+    def test_threshold_from_environment(self) -> None:
+        """Test the environment value is used as the threshold."""
+        with patch.dict(os.environ, {"GOVERNANCE_SEMANTIC_CACHE": "0.9"}):
+            cache = get_semantic_cache()
+
+        assert cache is not None
+        assert cache.threshold == 0.9
+
+    def test_default_threshold(self) -> None:
+        """Test a boolean setting uses the default threshold."""
+        with patch.dict(os.environ, {"GOVERNANCE_SEMANTIC_CACHE": "1"}):
+            cache = get_semantic_cache()
+
+        assert cache is not None
+        assert cache.threshold == 0.95
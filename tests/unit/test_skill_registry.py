@@ -4,6 +4,7 @@ from typing import Any, Dict
 
 import pytest
 
+from src.playbooks.models import SkillStep
 from src.skills.base import Skill
 from src.skills.registry import SkillRegistry
 
@@ -41,6 +42,15 @@ class TestSkillRegistry:
         assert "dummy" in registry
         assert registry.get("dummy") == DummySkill
 
+    def test_step_skill_names_match_registered_names_by_identity(self):
+        """Test step skill names are interned like registered names."""
+        registry = SkillRegistry()
+        registry.register(DummySkill)
+        step = SkillStep(name="step", skill="".join(["dum", "my"]))
+
+        (registered_name,) = registry._skills
+        assert step.skill is registered_name
+
     def test_register_duplicate_raises(self):
         """Test that registering duplicate raises error."""
         registry = SkillRegistry()
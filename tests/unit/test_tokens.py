@@ -0,0 +1,77 @@
+"""Unit tests for local token counting."""
+
+import os
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from src.modules.governance import (
+    DecisionContextExtractor,
+    LeadershipQuestionsGenerator,
+    RiskIdentifier,
+)
+from src.modules.governance.skills import _base, _tokens
+from src.modules.governance.skills._llm import build_prefix
+from src.modules.governance.skills._tokens import (
+    PROMPT_CACHE_MIN_TOKENS,
+    count_tokens,
+    prefix_tokens,
+)
+
+
+class TestCountTokens:
+    """Test suite for count_tokens()."""
+
+    def test_estimates_without_tiktoken(self) -> None:
+        """Test the length-based estimate is used when tiktoken is missing."""
+        with patch.object(_tokens, "_encoding", return_value=None):
+            assert count_tokens("") == 0
+            assert count_tokens("abcd") == 1
+            assert count_tokens("abcde") == 2
+
+    def test_prefix_tokens_sums_messages(self) -> None:
+        """Test every prefix message contributes to the count."""
+        prefix = build_prefix("abcd", "abcdabcd", (("abcd", "abcd"),))
+
+        with patch.object(_tokens, "_encoding", return_value=None):
+            assert prefix_tokens(prefix) == 5
+
+
+class TestPromptCachePrefix:
+    """Test the governance prefixes stay long enough for prompt caching."""
+
+    @pytest.mark.parametrize(
+        "skill_class",
+        [DecisionContextExtractor, RiskIdentifier, LeadershipQuestionsGenerator],
+    )
+    def test_prefix_reaches_cache_minimum(self, skill_class: type) -> None:
+        """Test each skill's static prefix clears OpenAI's caching threshold."""
+        assert prefix_tokens(skill_class._PREFIX) >= PROMPT_CACHE_MIN_TOKENS
+
+
+class TestCacheRouting:
+    """Test requests are only routed for prompt caching when it can apply."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_counts(self) -> Iterator[None]:
+        """Forget prefix counts memoized by other tests."""
+        _base._prefix_is_cacheable.cache_clear()
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            yield
+        _base._prefix_is_cacheable.cache_clear()
+
+    def test_long_prefix_is_routed(self) -> None:
+        """Test a prefix above the caching minimum sends its routing key."""
+        skill = RiskIdentifier()
+
+        assert skill.cache_routing_key == RiskIdentifier.prompt_cache_key
+
+    def test_short_prefix_is_not_routed(self) -> None:
+        """Test a prefix below the caching minimum sends no routing key."""
+        skill = RiskIdentifier()
+
+        with patch.object(
+            _base, "prefix_tokens", return_value=PROMPT_CACHE_MIN_TOKENS - 1
+        ):
+            assert skill.cache_routing_key is None
@@ -27,6 +27,12 @@ class TestStepTrace:
         assert trace.error is None
         assert trace.nested_steps == []
 
+    def test_step_trace_has_no_instance_dict(self) -> None:
+        """Test step traces use slots instead of a per-instance __dict__."""
+        trace = StepTrace("test_step", "skill", datetime.utcnow())
+
+        assert not hasattr(trace, "__dict__")
+
     def test_step_trace_to_dict_basic(self) -> None:
         """Test converting step trace to dict."""
         started_at = datetime.utcnow()
@@ -136,6 +142,12 @@ class TestExecutionTrace:
         assert trace.error is None
         assert trace.success is False
 
+    def test_execution_trace_has_no_instance_dict(self) -> None:
+        """Test execution traces use slots instead of a per-instance __dict__."""
+        trace = ExecutionTrace("test_playbook", "exec-123")
+
+        assert not hasattr(trace, "__dict__")
+
     def test_execution_trace_to_dict(self) -> None:
         """Test converting execution trace to dict."""
         trace = ExecutionTrace("my_playbook", "exec-456")